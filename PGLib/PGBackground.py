@@ -0,0 +1,261 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 cjiang. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+from collections import OrderedDict
+from typing import Callable, Sequence
+from PGLib.PGGlobal import *
+
+
+# @class PGBackground
+# @abstract Large or tiled scene background rendered lazily in fixed-size chunks.
+# @discussion The world (@size pixels, or an endless plane with @wrap) is split into
+#             @chunk_size squares. A chunk is rendered by @renderer(world_rect) the first
+#             time it comes into view and kept in an LRU cache holding at most @max_bytes
+#             of pixels, so memory stays bounded however large the map is. What is shown
+#             lives in @view, a window-sized surface used by the scene as its background.
+#             Scrolling shifts @view in place and paints only the strips that were
+#             exposed. Areas outside the world are filled with @fill. With @wrap, the
+#             world repeats endlessly and its size must be a multiple of @chunk_size.
+
+class PGBackground:
+    def __init__(self, size: tuple[int, int], renderer: Callable[[pygame.Rect], pygame.Surface],
+                 chunk_size: int = 256, max_bytes: int = 16 * 1024 * 1024, wrap: bool = False,
+                 fill: pygame.Color = (0, 0, 0)) -> None:
+        assert chunk_size > 0, "Chunk size must be positive!"
+        assert not wrap or (size[0] % chunk_size == 0 and size[1] % chunk_size == 0), \
+            "Wrapped world size must be a multiple of the chunk size!"
+        self._world = pygame.Rect((0, 0), size)
+        self._renderer = renderer
+        self._chunkSize = chunk_size
+        self._maxBytes = max_bytes
+        self._wrap = wrap
+        self._fill = fill
+        self._chunks = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._pos = (0, 0)
+        self._view = None
+        self._viewPos = None
+        self._scroll = (0, 0)
+        self._pending = []
+
+    # @function tiled
+    # @abstract Background built from a grid of tile indices.
+    # @param tiles The tile images, all @tile_size pixels square.
+    # @param tile_map Rows of indices into @tiles; None leaves the cell filled with @fill.
+
+    @classmethod
+    def tiled(cls, tiles: Sequence[pygame.Surface], tile_map: Sequence[Sequence[int]], tile_size: int,
+              **kwargs) -> "PGBackground":
+        rows = len(tile_map)
+        columns = max((len(r) for r in tile_map), default=0)
+
+        def render(rect: pygame.Rect) -> pygame.Surface:
+            chunk = pygame.Surface(rect.size)
+            chunk.fill(kwargs.get("fill", (0, 0, 0)))
+            for ty in range(max(rect.top // tile_size, 0), min((rect.bottom - 1) // tile_size + 1, rows)):
+                row = tile_map[ty]
+                for tx in range(max(rect.left // tile_size, 0), min((rect.right - 1) // tile_size + 1, len(row))):
+                    if row[tx] is not None:
+                        chunk.blit(tiles[row[tx]], (tx * tile_size - rect.x, ty * tile_size - rect.y))
+            return chunk
+
+        return cls((columns * tile_size, rows * tile_size), render, **kwargs)
+
+    # @function from_surface
+    # @abstract Background showing (and chunking) a single large image.
+
+    @classmethod
+    def from_surface(cls, surface: pygame.Surface, **kwargs) -> "PGBackground":
+        return cls(surface.get_size(), lambda rect: surface.subsurface(rect).copy(), **kwargs)
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self._world.size
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunkSize
+
+    @property
+    def view(self) -> pygame.Surface:
+        return self._view
+
+    @property
+    def pos(self) -> tuple[int, int]:
+        return self._pos
+
+    # @property pos
+    # @abstract The world point shown at the top-left corner of @view.
+    # @discussion Scenes with a camera keep it in sync with the camera themselves.
+
+    @pos.setter
+    def pos(self, pos: tuple[int, int]) -> None:
+        self._pos = (int(pos[0]), int(pos[1]))
+
+    # @property scroll
+    # @abstract How far the last @sync scrolled @view, as (dx, dy); zero when it repainted it all.
+
+    @property
+    def scroll(self) -> tuple[int, int]:
+        return self._scroll
+
+    @property
+    def chunks_cached(self) -> int:
+        return len(self._chunks)
+
+    def chunks(self) -> list[pygame.Surface]:
+        return list(self._chunks.values())
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    @property
+    def max_bytes(self) -> int:
+        return self._maxBytes
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    # @function resize
+    # @abstract Allocate @view at @size; it is painted in full on the next @sync.
+
+    def resize(self, size: tuple[int, int]) -> pygame.Surface:
+        self._view = pygame.Surface(size).convert() if pygame.display.get_surface() else pygame.Surface(size)
+        self._viewPos = None
+        return self._view
+
+    # @function invalidate
+    # @abstract Re-render the chunks overlapping @rect (in world coordinates), or all of them.
+
+    def invalidate(self, rect: pygame.Rect = None) -> None:
+        if rect is None:
+            self._chunks.clear()
+            self._bytes = 0
+            self._viewPos = None
+            return
+        rect = pygame.Rect(rect)
+        cs = self._chunkSize
+        for key in [k for k in self._chunks
+                    if rect.colliderect((k[0] * cs, k[1] * cs, cs, cs))]:
+            self._bytes -= self._surface_bytes(self._chunks.pop(key))
+        if self._wrap:
+            self._viewPos = None  # The area may show up anywhere in the view
+        else:
+            self._pending.append(rect)
+
+    @staticmethod
+    def _surface_bytes(surface: pygame.Surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def _chunk(self, cx: int, cy: int) -> pygame.Surface:
+        key = (cx, cy)
+        chunk = self._chunks.get(key)
+        if chunk:
+            self._chunks.move_to_end(key)
+            self._hits += 1
+            return chunk
+        self._misses += 1
+
+        cs = self._chunkSize
+        chunk = self._renderer(pygame.Rect(cx * cs, cy * cs, cs, cs).clip(self._world))
+        if pygame.display.get_surface():
+            chunk = chunk.convert()
+        size = self._surface_bytes(chunk)
+        while self._chunks and self._bytes + size > self._maxBytes:
+            self._bytes -= self._surface_bytes(self._chunks.popitem(last=False)[1])
+        self._chunks[key] = chunk
+        self._bytes += size
+        return chunk
+
+    # @function _paint
+    # @abstract Paint the part of @view at @area (view coordinates) from the chunks.
+
+    def _paint(self, area: pygame.Rect) -> None:
+        view = self._view
+        area = area.clip(view.get_rect())
+        if not area.width or not area.height:
+            return
+        ox, oy = self._viewPos
+        world = area.move(ox, oy)
+        if not self._wrap:
+            view.fill(self._fill, area)
+            world = world.clip(self._world)
+            if not world.width or not world.height:
+                return  # Entirely outside the world
+        cs = self._chunkSize
+        width = self._world.width // cs if self._wrap else 0
+        height = self._world.height // cs if self._wrap else 0
+        for cy in range(world.top // cs, (world.bottom - 1) // cs + 1):
+            for cx in range(world.left // cs, (world.right - 1) // cs + 1):
+                src = world.clip((cx * cs, cy * cs, cs, cs))
+                if not src.width or not src.height:
+                    continue
+                chunk = self._chunk(cx % width if width else cx, cy % height if height else cy)
+                view.blit(chunk, (src.x - ox, src.y - oy), src.move(-cx * cs, -cy * cs))
+
+    # @function sync
+    # @abstract Bring @view up to date with @pos and any invalidated areas.
+    # @return The areas of @view (view coordinates) that were painted. After a scroll
+    #         (see @scroll) these are only the exposed strips; the rest of @view moved.
+
+    def sync(self) -> list[pygame.Rect]:
+        self._scroll = (0, 0)
+        if self._view is None:
+            return []
+        view = self._view.get_rect()
+        pos = self._pos
+        if self._viewPos is None or abs(pos[0] - self._viewPos[0]) >= view.width \
+                or abs(pos[1] - self._viewPos[1]) >= view.height:
+            self._viewPos = pos
+            self._pending = []
+            self._paint(view)
+            return [view]
+
+        changed = []
+        dx, dy = pos[0] - self._viewPos[0], pos[1] - self._viewPos[1]
+        if dx or dy:
+            self._view.scroll(-dx, -dy)
+            self._viewPos = pos
+            self._scroll = (dx, dy)
+            if dx:
+                changed.append(pygame.Rect(view.width - dx if dx > 0 else 0, 0, abs(dx), view.height))
+            if dy:
+                changed.append(pygame.Rect(0, view.height - dy if dy > 0 else 0, view.width, abs(dy)))
+            for strip in changed:
+                self._paint(strip)
+        for rect in self._pending:
+            area = rect.move(-pos[0], -pos[1]).clip(view)
+            if area.width and area.height:
+                self._paint(area)
+                changed.append(area)
+        self._pending = []
+        return changed
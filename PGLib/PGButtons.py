@@ -23,8 +23,18 @@
 #
 
 import pygame.font
-from webcolors import name_to_rgb
+from collections import OrderedDict
+from PGLib.PGFonts import *
 from PGLib.PGObject import *
+from PGLib.PGSurfaceCache import *
+
+
+# @function name_to_rgb
+# @abstract Resolve a color name, importing webcolors only once a color is first needed.
+
+def name_to_rgb(name: str):
+    from webcolors import name_to_rgb as webcolors_name_to_rgb
+    return webcolors_name_to_rgb(name)
 
 
 # @class PGButton
@@ -45,30 +55,135 @@ from PGLib.PGObject import *
 # @class PGTextButton(PGButton)
 # @abstract Class representing simple buttons with text.
 # @discussion This class takes in text and a font, which it then renders into a surface
-#             that will be set to self._img in the parent class constructor.
+#             that will be set to self._img in the parent class constructor. Rendered
+#             labels are shared through a small LRU cache keyed by font, text and color,
+#             so buttons that show the same text (or are relabelled back and forth, as
+#             recycled list items are) only render it once. Whole button images are
+#             shared in the same way, together with their display-format conversion, by
+#             buttons with the same font, text, color and size; the label is then not
+#             rendered at all. Relabelling a button in place draws into a private copy.
+#             With a @PGSurfaceCache installed, button images are also loaded from disk.
 
 class PGTextButton(PGObject):
+    _labelCache = OrderedDict()
+    _LABEL_CACHE_SIZE = 512
+    _imageCache = OrderedDict()
+    _imageCacheBytes = 0
+    _IMAGE_CACHE_BYTES = 16 * 1024 * 1024
+    _DEFAULT_FONT = ("Ariel", 20)
+
     def __init__(self, parent: Type[PGScene], x: int, y: int, text: str, font: pygame.font.Font = None,
                  bg_color: str = "white", width: int = 100, height: int = 100) -> None:
-        if font:
-            self._font = font
-        else:
-            self._font = pygame.font.SysFont("Ariel", 20)
+        self._font = font
+        self._bgName = bg_color
         self._bgColor = name_to_rgb(bg_color)
+        self._boxSize = (width, height)
         self._textStr = text.strip()
-        self._text = self._font.render(self._textStr, True, "white" if self.find_text_color() else "black")
+        self._text = self._textSize = None  # Rendered label; left unrendered on a cache hit
+        shared = self._shared_compose()
+        self._sharedImage = shared is not None
+        if not shared:
+            super().__init__(parent, x, y, self._compose())
+            return
+        super().__init__(parent, x, y)
+        self._use_shared(*shared)
+        self.rect = self.image.get_rect(topleft=(x, y))
+        self._changed()
+
+    # @property font
+    # @abstract The font of the label; buttons without one share a lazily loaded default.
+
+    @property
+    def font(self) -> pygame.font.Font:
+        if self._font is None:
+            self._font = sys_font(*PGTextButton._DEFAULT_FONT)
+        return self._font
+
+    def _compose_key(self) -> tuple:
+        if self._font is None:
+            identity = sys_font_key(*PGTextButton._DEFAULT_FONT)
+        else:
+            identity = font_key(self._font)
+        if identity is None:
+            return None
+        return "text_button", identity, self._textStr, tuple(self._bgColor), self._boxSize
+
+    # @function _shared_compose
+    # @abstract The shared image of buttons looking like this one and its conversion, or
+    #           None if the font cannot be named.
+
+    def _shared_compose(self) -> tuple[pygame.Surface, pygame.Surface]:
+        key = self._compose_key()
+        if key is None:
+            return None
+        fmt = display_format()
+        entry = PGTextButton._imageCache.get(key)
+        if entry is None or entry[1] != fmt:
+            cache = PGSurfaceCache.active()
+            img = cache.fetch(key, self._compose) if cache else self._compose()
+            optimized = optimize_surface(img)
+            size = sum(s.get_width() * s.get_height() * s.get_bytesize() for s in {img, optimized})
+            entry = (img, fmt, optimized, size)
+            PGTextButton._cache_image(key, entry)
+        else:
+            PGTextButton._imageCache.move_to_end(key)
+        self._width, self._height = entry[0].get_size()
+        return entry[0], entry[2]
+
+    @staticmethod
+    def _cache_image(key: tuple, entry: tuple) -> None:
+        old = PGTextButton._imageCache.pop(key, None)
+        if old:
+            PGTextButton._imageCacheBytes -= old[3]
+        images = PGTextButton._imageCache
+        while images and PGTextButton._imageCacheBytes + entry[3] > PGTextButton._IMAGE_CACHE_BYTES:
+            PGTextButton._imageCacheBytes -= images.popitem(last=False)[1][3]
+        images[key] = entry
+        PGTextButton._imageCacheBytes += entry[3]
+
+    # @function cached_labels
+    # @abstract The rendered labels kept for reuse by all text buttons.
+
+    @staticmethod
+    def cached_labels() -> list[pygame.Surface]:
+        return list(PGTextButton._labelCache.values())
+
+    # @function cached_images
+    # @abstract The shared button images kept for reuse, with their conversions.
+
+    @staticmethod
+    def cached_images() -> list[pygame.Surface]:
+        return [s for img, _, optimized, _ in PGTextButton._imageCache.values() for s in (img, optimized)]
+
+    def _render_label(self) -> pygame.Surface:
+        key = (self.font, self._textStr, self.find_text_color())
+        label = PGTextButton._labelCache.get(key)
+        if label is None:
+            label = self.font.render(self._textStr, True, "white" if key[2] else "black")
+            PGTextButton._labelCache[key] = label
+            if len(PGTextButton._labelCache) > PGTextButton._LABEL_CACHE_SIZE:
+                PGTextButton._labelCache.popitem(last=False)
+        else:
+            PGTextButton._labelCache.move_to_end(key)
+        return label
+
+    def _layout_label(self) -> None:
+        self._text = self._render_label()
         self._textSize = self._text.get_size()
-        self._width = width
-        self._height = height
-        if self._textSize[0] > self._width:
-            self._width = self._textSize[0]
-        if self._textSize[1] > self._height:
-            self._height = self._textSize[1]
-
-        img = pygame.Surface((self._width, self._height), pygame.SRCALPHA)
-        img.fill(bg_color)
+        self._width = max(self._boxSize[0], self._textSize[0])
+        self._height = max(self._boxSize[1], self._textSize[1])
+
+    def _paint(self, img: pygame.Surface) -> None:
+        if self._text is None:
+            self._layout_label()
+        img.fill(self._bgColor)
         img.blit(self._text, (self._width / 2 - self._textSize[0] / 2, self._height / 2 - self._textSize[1] / 2))
-        super().__init__(parent, x, y, img)
+
+    def _compose(self) -> pygame.Surface:
+        self._layout_label()
+        img = pygame.Surface((self._width, self._height))
+        self._paint(img)
+        return img
 
     # @function get_text_color
     # @abstract Determines if text should be black or white based on the background color.
@@ -87,3 +202,56 @@ class PGTextButton(PGObject):
 
     def get_text(self):
         return self._textStr
+
+    @property
+    def text(self) -> str:
+        return self._textStr
+
+    # @function text
+    # @abstract Change the label, repainting the existing image in place when its size allows.
+
+    @text.setter
+    def text(self, text: str) -> None:
+        text = text.strip()
+        if text == self._textStr:
+            return
+        self._textStr = text
+        size = (self._width, self._height)
+        self._layout_label()
+        if self._angle == 0 and self._scale == 1 and size == (self._width, self._height):
+            if self._sharedImage:
+                self._unshare()
+            self._paint(self.image)
+            if self._origImage is not self.image:
+                self._paint(self._origImage)
+            self.invalidate_mask()
+            self._changed()
+        else:
+            img = pygame.Surface((self._width, self._height))
+            self._paint(img)
+            self._origImage = img
+            self._imageRef = None
+            self._sharedImage = False
+            self._apply_transform()
+
+    # @function _unshare
+    # @abstract Replace the views of the shared image by private copies, to draw into them.
+
+    def _unshare(self) -> None:
+        self.image = self.image.copy()
+        self._origImage = self._origImage.copy()
+        self._sharedImage = False
+
+    def _content_state(self) -> dict:
+        font = None
+        if self._font is not None:
+            font = font_key(self._font)
+            if font is None:
+                raise ValueError("Fonts not loaded through PGFonts cannot be snapshotted!")
+        return {"text": self._textStr, "font": list(font) if font else None, "bg_color": self._bgName,
+                "size": list(self._boxSize)}
+
+    @classmethod
+    def _from_content(cls, parent: Type[PGScene], content: dict) -> "PGTextButton":
+        font = font_from_key(content["font"]) if content["font"] else None
+        return cls(parent, 0, 0, content["text"], font, content["bg_color"], *content["size"])
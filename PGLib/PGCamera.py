@@ -0,0 +1,169 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 cjiang. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+from PGLib.PGGlobal import *
+
+
+# @class PGCamera
+# @abstract Viewport onto a scene's world.
+# @discussion Once a camera is enabled on a scene (see @PGScene.enable_camera), object
+#             positions are world coordinates and the camera's @pos is the world point
+#             shown at the top-left corner of the window. Objects marked
+#             @PGObject.screen_space stay fixed to the window. When @bounds is set, the
+#             viewport is kept inside it.
+
+class PGCamera:
+    def __init__(self, size: tuple[int, int], pos: tuple[int, int] = (0, 0), bounds: pygame.Rect = None) -> None:
+        self._rect = pygame.Rect(pos, size)
+        self._bounds = pygame.Rect(bounds) if bounds else None
+        self._version = 0
+        self._clamp()
+
+    # @property version
+    # @abstract Incremented every time the viewport moves or changes size.
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def rect(self) -> pygame.Rect:
+        return self._rect.copy()
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self._rect.size
+
+    @property
+    def pos(self) -> tuple[int, int]:
+        return self._rect.topleft
+
+    @pos.setter
+    def pos(self, pos: tuple[int, int]) -> None:
+        rect = self._rect.copy()
+        self._rect.topleft = (int(pos[0]), int(pos[1]))
+        self._clamp()
+        if self._rect != rect:
+            self._version += 1
+
+    @property
+    def bounds(self) -> pygame.Rect:
+        return self._bounds
+
+    @bounds.setter
+    def bounds(self, bounds: pygame.Rect) -> None:
+        self._bounds = pygame.Rect(bounds) if bounds else None
+        self.pos = self.pos
+
+    def move_by(self, dx: int, dy: int) -> None:
+        self.pos = (self._rect.x + dx, self._rect.y + dy)
+
+    def center_on(self, point: tuple[int, int]) -> None:
+        self.pos = (point[0] - self._rect.width // 2, point[1] - self._rect.height // 2)
+
+    def resize(self, size: tuple[int, int]) -> None:
+        center = self._rect.center
+        self._rect.size = size
+        self._rect.center = center
+        self._clamp()
+        self._version += 1
+
+    def _clamp(self) -> None:
+        if self._bounds:
+            self._rect.clamp_ip(self._bounds)
+
+    def world_to_screen(self, point: tuple[int, int]) -> tuple[int, int]:
+        return point[0] - self._rect.x, point[1] - self._rect.y
+
+    def screen_to_world(self, point: tuple[int, int]) -> tuple[int, int]:
+        return point[0] + self._rect.x, point[1] + self._rect.y
+
+
+# @class PGSpatialGrid
+# @abstract Uniform grid of @cell_size pixel cells indexing objects by rect.
+# @discussion Moving an object only touches the cells it leaves and enters, and a query
+#             only visits the cells overlapping the queried rect, so both cost the same
+#             however large the indexed world is.
+
+class PGSpatialGrid:
+    def __init__(self, cell_size: int = 256) -> None:
+        assert cell_size > 0, "Cell size must be positive!"
+        self._cellSize = cell_size
+        self._grid = {}
+        self._cells = {}
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    @property
+    def cell_size(self) -> int:
+        return self._cellSize
+
+    def __contains__(self, obj) -> bool:
+        return obj in self._cells
+
+    def _span(self, rect: pygame.Rect) -> tuple:
+        cs = self._cellSize
+        return tuple((cx, cy) for cx in range(rect.left // cs, (rect.left + max(rect.width, 1) - 1) // cs + 1)
+                     for cy in range(rect.top // cs, (rect.top + max(rect.height, 1) - 1) // cs + 1))
+
+    # @function insert
+    # @abstract Index @obj at @rect, moving it if it is already indexed.
+
+    def insert(self, obj, rect: pygame.Rect) -> None:
+        cells = self._span(rect)
+        old = self._cells.get(obj, ())
+        if cells == old:
+            return
+        grid = self._grid
+        for cell in old:
+            if cell not in cells:
+                grid[cell].discard(obj)
+                if not grid[cell]:
+                    del grid[cell]
+        for cell in cells:
+            grid.setdefault(cell, set()).add(obj)
+        self._cells[obj] = cells
+
+    def remove(self, obj) -> None:
+        for cell in self._cells.pop(obj, ()):
+            self._grid[cell].discard(obj)
+            if not self._grid[cell]:
+                del self._grid[cell]
+
+    def clear(self) -> None:
+        self._grid.clear()
+        self._cells.clear()
+
+    # @function query
+    # @abstract Objects indexed in any cell overlapping @rect (a superset of those inside it).
+
+    def query(self, rect: pygame.Rect) -> set:
+        found = set()
+        grid = self._grid
+        for cell in self._span(rect):
+            objs = grid.get(cell)
+            if objs:
+                found.update(objs)
+        return found
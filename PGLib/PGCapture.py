@@ -0,0 +1,168 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 cjiang. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import os
+import queue
+import threading
+from PGLib.PGGlobal import *
+
+
+# @class PGFrameCapture
+# @abstract Streams rendered frames to disk without stalling the game loop.
+# @discussion Frames are copied into a bounded ring of preallocated surfaces and handed
+#             to a writer thread, which either saves a numbered PNG sequence or appends
+#             raw RGB frames to a single file (readable by ffmpeg with
+#             "-f rawvideo -pix_fmt rgb24 -s WxH"). Only the dirty rects of a frame are
+#             copied: every slot remembers what changed since it was last filled, so a
+#             slot is brought up to date with a handful of small blits. When the writer
+#             falls behind, the "drop" policy discards the new frame and the "block"
+#             policy waits at most @max_wait seconds for a slot before dropping it.
+
+class PGFrameCapture:
+    _MAX_PENDING = 32
+
+    def __init__(self, path: str, size: tuple[int, int], fmt: str = "png", buffers: int = 8,
+                 policy: str = "drop", max_wait: float = 0.005) -> None:
+        assert fmt in ("png", "raw"), "Format must be 'png' or 'raw'!"
+        assert policy in ("drop", "block"), "Policy must be 'drop' or 'block'!"
+        assert buffers > 0, "At least one buffer is required!"
+        self._path = path
+        self._size = (int(size[0]), int(size[1]))
+        self._fmt = fmt
+        self._policy = policy
+        self._maxWait = max_wait
+        self._rect = pygame.Rect((0, 0), self._size)
+
+        self._slots = [pygame.Surface(self._size) for _ in range(buffers)]
+        self._pending = [[self._rect.copy()] for _ in range(buffers)]
+        self._free = queue.Queue()
+        for i in range(buffers):
+            self._free.put(i)
+        self._filled = queue.Queue()
+
+        self._framesCaptured = 0
+        self._framesDropped = 0
+        self._framesWritten = 0
+        self._error = None
+
+        if self._fmt == "raw":
+            self._file = open(self._path, "wb")
+        else:
+            self._file = None
+            if "%" not in self._path:
+                self._path = os.path.join(self._path, "frame_%06d.png")
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        self._writer = threading.Thread(target=self._write_loop, name="PGFrameCapture", daemon=True)
+        self._writer.start()
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self._size
+
+    def buffers(self) -> list[pygame.Surface]:
+        return list(self._slots)
+
+    @property
+    def frames_captured(self) -> int:
+        return self._framesCaptured
+
+    @property
+    def frames_dropped(self) -> int:
+        return self._framesDropped
+
+    @property
+    def frames_written(self) -> int:
+        return self._framesWritten
+
+    @property
+    def error(self) -> Exception:
+        return self._error
+
+    # @function capture
+    # @abstract Queue the current contents of @surface for writing.
+    # @param surface The finished frame, usually the display surface.
+    # @param rects The rects that changed since the previous frame, or None for all of it.
+    # @return Whether the frame was queued (False if it was dropped).
+
+    def capture(self, surface: pygame.Surface, rects: list[pygame.Rect] = None) -> bool:
+        if rects is None:
+            rects = [self._rect]
+        for pending in self._pending:
+            if pending and pending[0] == self._rect:
+                continue  # Already due for a full refresh
+            if len(pending) + len(rects) > self._MAX_PENDING:
+                pending[:] = [self._rect.copy()]
+            else:
+                pending.extend(pygame.Rect(r) for r in rects)
+
+        try:
+            if self._policy == "block":
+                index = self._free.get(timeout=self._maxWait)
+            else:
+                index = self._free.get_nowait()
+        except queue.Empty:
+            self._framesDropped += 1
+            return False
+
+        slot = self._slots[index]
+        for r in self._pending[index]:
+            r = r.clip(self._rect)
+            if r.width and r.height:
+                slot.blit(surface, r, r)
+        self._pending[index] = []
+        self._filled.put((index, self._framesCaptured))
+        self._framesCaptured += 1
+        return True
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._filled.get()
+            if item is None:
+                return
+            index, number = item
+            try:
+                if self._error is None:
+                    if self._file:
+                        self._file.write(pygame.image.tobytes(self._slots[index], "RGB"))
+                    else:
+                        pygame.image.save(self._slots[index], self._path % number)
+                    self._framesWritten += 1
+            except (OSError, pygame.error) as e:
+                self._error = e
+            finally:
+                self._free.put(index)
+
+    # @function close
+    # @abstract Flush all queued frames and stop the writer thread.
+
+    def close(self) -> None:
+        if not self._writer.is_alive():
+            return
+        self._filled.put(None)
+        self._writer.join()
+        if self._file:
+            self._file.close()
@@ -0,0 +1,138 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 cjiang. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+from PGLib.PGObject import *
+from PGLib.PGCamera import PGSpatialGrid
+
+
+# @class PGCollisionGrid
+# @abstract Incremental object-vs-object collision detection for a @PGGroup.
+# @discussion Colliders are indexed in a @PGSpatialGrid of @cell_size pixel cells (the
+#             broad phase). Every frame only colliders whose rect or image changed are
+#             re-indexed and re-tested against the colliders sharing their cells; contacts
+#             between objects that did not change are kept as they are. Candidate pairs
+#             are confirmed by rect overlap and, with @use_masks, by the objects' cached
+#             masks (the narrow phase). Contacts starting or ending in a frame are
+#             reported through @entered and @exited and the objects'
+#             @PGObject.on_collision_enter / @PGObject.on_collision_exit hooks. Contacts
+#             ended by @remove between updates are reported in @exited by the next one.
+
+class PGCollisionGrid:
+    def __init__(self, cell_size: int = 64, use_masks: bool = True) -> None:
+        self._useMasks = use_masks
+        self._index = PGSpatialGrid(cell_size)
+        self._state = {}
+        self._contacts = {}
+        self._entered = []
+        self._exited = []
+        self._removedExits = []
+
+    @property
+    def entered(self) -> list[tuple[PGObject, PGObject]]:
+        return self._entered
+
+    @property
+    def exited(self) -> list[tuple[PGObject, PGObject]]:
+        return self._exited
+
+    @property
+    def colliders(self) -> list[PGObject]:
+        return list(self._state)
+
+    def __contains__(self, obj: PGObject) -> bool:
+        return obj in self._state
+
+    def contacts(self, obj: PGObject) -> set[PGObject]:
+        return set(self._contacts.get(obj, ()))
+
+    def pairs(self) -> list[tuple[PGObject, PGObject]]:
+        return [(a, b) for a, others in self._contacts.items() for b in others if id(a) < id(b)]
+
+    def add(self, obj: PGObject) -> None:
+        if obj in self._state:
+            return
+        self._state[obj] = (None, None)
+        self._contacts[obj] = set()
+
+    def remove(self, obj: PGObject) -> None:
+        if obj not in self._state:
+            return
+        del self._state[obj]
+        self._index.remove(obj)
+        for other in self._contacts.pop(obj):
+            self._contacts[other].discard(obj)
+            self._removedExits.append((obj, other))
+            obj.on_collision_exit(other)
+            other.on_collision_exit(obj)
+
+    # @function touch
+    # @abstract Re-test @obj on the next update although its rect and image did not change.
+    # @discussion For images drawn into in place; see @PGObject.invalidate_mask.
+
+    def touch(self, obj: PGObject) -> None:
+        if obj in self._state:
+            self._state[obj] = (self._state[obj][0], None)
+
+    def _reindex(self, obj: PGObject) -> None:
+        rect = obj.rect.copy()
+        self._index.insert(obj, rect)
+        self._state[obj] = (rect, obj.image)
+
+    def _overlap(self, a: PGObject, b: PGObject) -> bool:
+        if not a.rect.colliderect(b.rect):
+            return False
+        if not self._useMasks:
+            return True
+        return a.mask.overlap(b.mask, (b.rect.x - a.rect.x, b.rect.y - a.rect.y)) is not None
+
+    # @function update
+    # @abstract Bring the contacts up to date with the colliders' current rects and images.
+
+    def update(self) -> None:
+        self._entered = []
+        self._exited = []
+        removed, self._removedExits = self._removedExits, []
+        moved = [o for o, (rect, image) in self._state.items() if o.rect != rect or o.image is not image]
+        for o in moved:
+            self._reindex(o)
+
+        index = self._index
+        for o in moved:
+            old = self._contacts[o]
+            new = {other for other in index.query(o.rect) if other is not o and self._overlap(o, other)}
+            for other in old - new:
+                self._contacts[other].discard(o)
+                self._exited.append((o, other))
+            for other in new - old:
+                self._contacts[other].add(o)
+                self._entered.append((o, other))
+            self._contacts[o] = new
+
+        for a, b in self._exited:
+            a.on_collision_exit(b)
+            b.on_collision_exit(a)
+        for a, b in self._entered:
+            a.on_collision_enter(b)
+            b.on_collision_enter(a)
+        self._exited[:0] = removed
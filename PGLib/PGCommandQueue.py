@@ -0,0 +1,151 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 cjiang. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import time
+from collections import deque
+from typing import Callable
+
+
+# @class PGCommandQueue
+# @abstract Lets other threads hand work to the game loop.
+# @discussion Nothing in PGLib may be touched from outside the game loop's thread; worker
+#             threads @post callables (closures, or any callable command object) here
+#             instead, and the game drains the queue once per frame at a fixed point,
+#             right after processing events. Draining stops once its time budget is used
+#             up (although at least one command always runs), leaving the remaining
+#             commands for the next frame rather than stretching the current one.
+#             Posting only appends to a deque, which is atomic, so it never takes a lock
+#             that the game loop could be holding. Queue depth and the delay between
+#             posting and running a command are tracked as metrics. A command that
+#             raises has its traceback printed and is counted as failed; the commands
+#             after it still run.
+
+class PGCommandQueue:
+    def __init__(self, budget: float = 0.002, window: int = 256) -> None:
+        self._queue = deque()
+        self._budget = budget
+        self._latencies = deque(maxlen=window)
+        self._executed = 0
+        self._failed = 0
+        self._carriedOver = 0
+        self._maxDepth = 0
+
+    @property
+    def budget(self) -> float:
+        return self._budget
+
+    @budget.setter
+    def budget(self, budget: float) -> None:
+        self._budget = budget
+
+    # @function post
+    # @abstract Queue @command(*args, **kwargs) to run on the game loop. Safe from any thread.
+
+    def post(self, command: Callable, *args, **kwargs) -> None:
+        self._queue.append((command, args, kwargs, time.perf_counter()))
+
+    # @function call
+    # @abstract Like @post, but return a concurrent.futures.Future for the command's result.
+
+    def call(self, command: Callable, *args, **kwargs):
+        from concurrent.futures import Future
+        future = Future()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(command(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+        self.post(run)
+        return future
+
+    # @function drain
+    # @abstract Run queued commands until the queue is empty or the budget is spent.
+    # @return The number of commands run.
+
+    def drain(self) -> int:
+        depth = len(self._queue)
+        if not depth:
+            return 0
+        self._maxDepth = max(self._maxDepth, depth)
+        deadline = time.perf_counter() + self._budget
+        count = 0
+        while self._queue:
+            command, args, kwargs, posted = self._queue.popleft()
+            self._latencies.append(time.perf_counter() - posted)
+            count += 1
+            try:
+                command(*args, **kwargs)
+            except Exception:
+                import traceback
+                traceback.print_exc()
+                self._failed += 1
+            else:
+                self._executed += 1
+            if time.perf_counter() >= deadline:
+                break
+        if self._queue:
+            self._carriedOver += 1
+        return count
+
+    # Metrics
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    @property
+    def max_depth(self) -> int:
+        return self._maxDepth
+
+    @property
+    def executed(self) -> int:
+        return self._executed
+
+    @property
+    def failed(self) -> int:
+        return self._failed
+
+    # @property carried_over
+    # @abstract Number of frames that ended with commands still queued.
+
+    @property
+    def carried_over(self) -> int:
+        return self._carriedOver
+
+    @property
+    def latency_avg(self) -> float:
+        return sum(self._latencies) / len(self._latencies) if self._latencies else 0.0
+
+    @property
+    def latency_max(self) -> float:
+        return max(self._latencies, default=0.0)
+
+    def metrics(self) -> dict:
+        return {"depth": self.depth, "max_depth": self._maxDepth, "executed": self._executed,
+                "failed": self._failed, "carried_over": self._carriedOver, "latency_avg": self.latency_avg,
+                "latency_max": self.latency_max}
@@ -0,0 +1,263 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 cjiang. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import os
+import sys
+import time
+import weakref
+from typing import Union
+from PGLib.PGGlobal import *
+
+# Font loading for PGLib.
+#
+# The first pygame.font.SysFont call scans every installed font (running fc-list on
+# Linux, walking the registry on Windows), which dominates startup for font-heavy menus.
+# @sys_font instead remembers, in a small JSON index kept in the user's cache directory,
+# which file (and which synthetic bold/italic) each requested font resolved to, and
+# then opens that file directly. The index is checked against the modification times of
+# the font directories, which costs a few stat calls. Only when those changed are the
+# directories walked, and the index is rebuilt if the set of files in them changed. It is
+# also rebuilt when pygame or the index format changes, and once it is older than
+# @INDEX_MAX_AGE, which catches fonts added deeper down without touching the directories
+# checked. Fonts are also memoized and their identity recorded, so that surfaces
+# rendered with them can be cached (see @PGSurfaceCache).
+
+INDEX_VERSION = 2
+INDEX_MAX_AGE = 7 * 24 * 3600
+
+_fonts = {}
+_fontKeys = weakref.WeakKeyDictionary()
+_index = None
+_indexPath = None
+_indexSignature = None
+_indexFiles = None
+_indexCreated = None
+
+
+def font_index_path() -> str:
+    base = os.environ.get("PGLIB_CACHE_DIR")
+    if not base:
+        if sys.platform == "win32":
+            base = os.path.join(os.environ.get("LOCALAPPDATA", os.path.expanduser("~")), "PGLib")
+        else:
+            base = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "pglib")
+    return os.path.join(base, "fonts-%s.json" % sys.platform)
+
+
+def _font_dirs() -> list[str]:
+    home = os.path.expanduser("~")
+    if sys.platform == "win32":
+        return [os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts"),
+                os.path.join(os.environ.get("LOCALAPPDATA", home), "Microsoft", "Windows", "Fonts")]
+    if sys.platform == "darwin":
+        return ["/Library/Fonts", "/System/Library/Fonts", os.path.join(home, "Library", "Fonts")]
+    return ["/usr/share/fonts", "/usr/local/share/fonts", os.path.join(home, ".fonts"),
+            os.path.join(home, ".local", "share", "fonts")]
+
+
+# @function _signature
+# @abstract Cheap identity of the installed fonts: the font directories' modification times.
+
+def _signature() -> list:
+    signature = [INDEX_VERSION, pygame.version.ver]
+    for d in _font_dirs():
+        try:
+            signature.append([d, os.stat(d).st_mtime_ns])
+        except OSError:
+            pass
+    return signature
+
+
+# @function _file_digest
+# @abstract Hash of the path of every file under the font directories.
+
+def _file_digest() -> str:
+    import hashlib
+    digest = hashlib.sha1()
+    for d in _font_dirs():
+        for root, dirs, files in os.walk(d):
+            dirs.sort()
+            for name in sorted(files):
+                digest.update(os.path.join(root, name).encode("utf-8", "surrogateescape") + b"\0")
+    return digest.hexdigest()
+
+
+# @function _load_index
+# @abstract The index at @path as (fonts, file digest, creation time), or None if it is
+#           unreadable, too old, or made by another pygame or index format.
+
+def _load_index(path: str, signature: list) -> tuple:
+    import json
+    try:
+        with open(path) as f:
+            index = json.load(f)
+        if index["signature"][:2] != signature[:2] or time.time() - index["created"] > INDEX_MAX_AGE:
+            return None
+        fonts = {key: (p, bool(b), bool(i)) for key, (p, b, i) in index["fonts"].items()}
+        files = index["files"] if index["signature"] != signature else None
+        return fonts, files, index["created"]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _save_index() -> None:
+    import json
+    global _indexFiles
+    if _indexFiles is None:
+        _indexFiles = _file_digest()
+    index = {"signature": _indexSignature, "files": _indexFiles, "created": _indexCreated, "fonts": _index}
+    try:
+        os.makedirs(os.path.dirname(_indexPath), exist_ok=True)
+        with open(_indexPath + ".tmp", "w") as f:
+            json.dump(index, f)
+        os.replace(_indexPath + ".tmp", _indexPath)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+# @function init_system_fonts
+# @abstract Load the font index, or start a new one if it is missing or out of date.
+# @return Whether a valid index was loaded.
+
+def init_system_fonts(index_path: str = None) -> bool:
+    global _index, _indexPath, _indexSignature, _indexFiles, _indexCreated
+    if _index is not None:
+        return False
+    _indexPath = index_path if index_path else font_index_path()
+    _indexSignature = _signature()
+    _indexFiles = None
+    loaded = _load_index(_indexPath, _indexSignature)
+    if loaded is not None:
+        fonts, files, created = loaded
+        if files is None:
+            _index, _indexCreated = fonts, created
+            return True
+        # The directories were touched: walk them to see whether the fonts changed
+        _indexFiles = _file_digest()
+        if files == _indexFiles:
+            _index, _indexCreated = fonts, created
+            _save_index()
+            return True
+    _index = {}
+    _indexCreated = time.time()
+    return False
+
+
+def _font_constructor(path: str, size: int, bold: bool, italic: bool) -> pygame.font.Font:
+    font = pygame.font.Font(path, size)
+    font.set_bold(bold)
+    font.set_italic(italic)
+    return font
+
+
+# @function _system_font
+# @abstract Open a system font from the index, resolving it through pygame on a miss.
+# @discussion SysFont hands its resolution (file and synthetic styles) to the
+#             constructor it is given, which is what the index records.
+
+def _system_font(name: str, size: int, bold: bool, italic: bool) -> pygame.font.Font:
+    key = "%s|%d%d" % (name, bold, italic)
+    entry = _index.get(key)
+    if entry is not None:
+        try:
+            return _font_constructor(entry[0], size, entry[1], entry[2])
+        except OSError:
+            pass
+    resolved = []
+
+    def constructor(path: str, size: int, set_bold: bool, set_italic: bool) -> pygame.font.Font:
+        resolved.append((path, set_bold, set_italic))
+        return _font_constructor(path, size, set_bold, set_italic)
+
+    font = pygame.font.SysFont(name, size, bold, italic, constructor)
+    _index[key] = resolved[0]
+    _save_index()
+    return font
+
+
+def _init_font() -> None:
+    if not pygame.font.get_init():
+        pygame.font.init()
+
+
+# @function sys_font
+# @abstract Drop-in replacement for pygame.font.SysFont backed by the font index.
+# @discussion Fonts are shared: asking twice for the same font returns the same object.
+
+def sys_font(name: str, size: int, bold: bool = False, italic: bool = False) -> pygame.font.Font:
+    key = sys_font_key(name, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        _init_font()
+        init_system_fonts()
+        font = _system_font(name, size, bool(bold), bool(italic))
+        _fonts[key] = font
+        register_font(font, *key)
+    return font
+
+
+def sys_font_key(name: str, size: int, bold: bool = False, italic: bool = False) -> tuple:
+    return "sysfont", name, size, bool(bold), bool(italic)
+
+
+# @function file_font
+# @abstract Load (and share) a font from a file, or pygame's default font if @path is None.
+
+def file_font(path: str, size: int) -> pygame.font.Font:
+    if path:
+        st = os.stat(path)
+        key = ("file", os.path.abspath(path), st.st_size, st.st_mtime_ns, size)
+    else:
+        key = ("file", None, size)
+    font = _fonts.get(key)
+    if font is None:
+        _init_font()
+        font = pygame.font.Font(path, size)
+        _fonts[key] = font
+        register_font(font, *key)
+    return font
+
+
+# @function register_font
+# @abstract Record what a font object was loaded from so surfaces rendered with it can be cached.
+# @discussion pygame fonts do not expose their file or size; fonts not created through
+#             this module must be registered explicitly to take part in surface caching.
+
+def register_font(font: pygame.font.Font, *identity) -> None:
+    _fontKeys[font] = identity
+
+
+def font_key(font: pygame.font.Font) -> tuple:
+    return _fontKeys.get(font)
+
+
+# @function font_from_key
+# @abstract The inverse of @font_key: load the font an identity tuple describes.
+
+def font_from_key(key: Union[tuple, list]) -> pygame.font.Font:
+    if key[0] == "sysfont":
+        return sys_font(key[1], key[2], key[3], key[4])
+    if key[0] == "file":
+        return file_font(key[1], key[-1])
+    raise ValueError("Unknown font key %r!" % (key,))
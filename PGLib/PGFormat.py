@@ -0,0 +1,151 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 cjiang. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+from PGLib.PGGlobal import *
+
+# Colors tried, in order, as the colorkey of images whose pixels are either fully opaque
+# or fully transparent; the first one not used by any opaque pixel wins.
+_KEY_CANDIDATES = ((255, 0, 255), (0, 255, 0), (1, 2, 3), (254, 1, 253), (3, 254, 2))
+
+
+# @function display_format
+# @abstract Pixel format of the display, or None without one. Converted images are only
+#           fast to blit while this stays the same.
+
+def display_format() -> tuple:
+    screen = pygame.display.get_surface()
+    if not screen:
+        return None
+    return screen.get_bitsize(), screen.get_masks()
+
+
+# @function surface_kind
+# @abstract Classify the transparency actually used by @surface's pixels.
+# @return "opaque", "colorkey" (every pixel fully opaque or fully transparent) or "alpha".
+
+def surface_kind(surface: pygame.Surface) -> str:
+    return _analyze(surface)[0]
+
+
+def _per_pixel(surface: pygame.Surface) -> bool:
+    # SRCALPHA is also reported for surface alpha, so look for an alpha channel instead
+    return surface.get_masks()[3] != 0
+
+
+def _analyze(surface: pygame.Surface) -> tuple[str, pygame.mask.Mask]:
+    if not _per_pixel(surface):
+        return ("colorkey" if surface.get_colorkey() else "opaque"), None
+    total = surface.get_width() * surface.get_height()
+    opaque = pygame.mask.from_surface(surface, 254)
+    count = opaque.count()
+    if count == total:
+        return "opaque", opaque
+    # Entirely transparent images are left alone: they are usually canvases drawn on later.
+    if count and pygame.mask.from_surface(surface, 0).count() == count:
+        return "colorkey", opaque
+    return "alpha", opaque
+
+
+def _rle(surface: pygame.Surface) -> int:
+    return pygame.RLEACCEL if surface.get_flags() & pygame.RLEACCELOK else 0
+
+
+# @function set_surface_alpha
+# @abstract Like Surface.set_alpha, but keeps the surface RLE accelerated if it was.
+
+def set_surface_alpha(surface: pygame.Surface, alpha: int) -> None:
+    surface.set_alpha(alpha, _rle(surface))
+
+
+# @function with_alpha
+# @abstract @surface with an alpha channel, converting a copy if it has none.
+# @discussion Colorkeyed pixels become transparent; surface alpha is left out of the copy.
+
+def with_alpha(surface: pygame.Surface) -> pygame.Surface:
+    if _per_pixel(surface):
+        return surface
+    result = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+    alpha = surface.get_alpha()
+    surface.set_alpha(None)
+    result.blit(surface, (0, 0))
+    if alpha is not None:
+        set_surface_alpha(surface, alpha)
+    return result
+
+
+# @function optimize_surface
+# @abstract Convert @surface to the fastest display format that preserves its appearance.
+# @discussion Images whose pixels are all opaque become plain display surfaces. Images
+#             made only of fully opaque and fully transparent pixels become colorkeyed,
+#             RLE accelerated display surfaces. Only images with genuinely translucent
+#             pixels keep per-pixel alpha. Surface alpha and colorkeys are preserved.
+#             Without a display, @surface is returned unchanged.
+# @param analyze Whether to inspect the pixels. Without it, images with per-pixel alpha
+#        keep it; used for transient images such as animation steps.
+# @param rle Whether colorkeyed results are RLE accelerated. Images that are later drawn
+#        into or sliced into subsurfaces are faster without.
+# @return A new surface; @surface itself is never modified.
+
+def optimize_surface(surface: pygame.Surface, analyze: bool = True, rle: bool = True) -> pygame.Surface:
+    if not pygame.display.get_surface():
+        return surface
+    flags = pygame.RLEACCEL if rle else 0
+    per_pixel = _per_pixel(surface)
+    alpha = surface.get_alpha()
+    if per_pixel and not analyze:
+        return surface.convert_alpha()
+
+    kind, opaque = _analyze(surface)
+    if kind == "alpha":
+        return surface.convert_alpha()
+    if kind == "opaque" or not per_pixel:
+        key = surface.get_colorkey()
+        if key or (alpha is not None and not per_pixel):
+            # SDL does not reliably convert pixels through a colorkey or surface alpha
+            surface = surface.copy()
+            surface.set_colorkey(None)
+            surface.set_alpha(None)
+        result = surface.convert()
+        if key:
+            result.set_colorkey(key, flags)
+    else:
+        key = _free_key(surface, opaque)
+        if key is None:
+            return surface.convert_alpha()
+        source = surface.copy()
+        source.set_alpha(255)
+        result = pygame.Surface(surface.get_size()).convert()
+        result.fill(key)
+        result.blit(source, (0, 0))
+        result.set_colorkey(key, flags)
+    if alpha is not None and alpha < 255:
+        result.set_alpha(alpha, _rle(result))
+    return result
+
+
+def _free_key(surface: pygame.Surface, opaque: pygame.mask.Mask) -> tuple[int, int, int]:
+    for key in _KEY_CANDIDATES:
+        if not pygame.mask.from_threshold(surface, key, (1, 1, 1, 255)).overlap_area(opaque, (0, 0)):
+            return key
+    return None
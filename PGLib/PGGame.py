@@ -22,8 +22,38 @@
 # SOFTWARE.
 #
 
-from PGLib.PGButtons import *
+import importlib
+import time
+from PGLib.PGBackground import *
+from PGLib.PGCommandQueue import *
+from PGLib.PGFonts import *
 from PGLib.PGGlobal import *
+from PGLib.PGLayout import *
+from PGLib.PGObject import *
+from PGLib.PGSurfaceCache import *
+
+# Widgets and optional subsystems are imported on first access (e.g. "from PGLib.PGGame
+# import PGTextArea") rather than with the rest of the library, so that importing the
+# game loop alone stays cheap. Being lazy, they are not brought in by
+# "from PGLib.PGGame import *": import the ones needed by name.
+_LAZY_IMPORTS = {
+    "PGAnimatedObject": "PGLib.PGSpriteSheet",
+    "PGCamera": "PGLib.PGCamera",
+    "PGFrameCapture": "PGLib.PGCapture",
+    "PGLatencyTracker": "PGLib.PGLatency",
+    "PGListView": "PGLib.PGListView",
+    "PGMemoryTracker": "PGLib.PGMemory",
+    "PGSpriteSheet": "PGLib.PGSpriteSheet",
+    "PGTextArea": "PGLib.PGTextArea",
+    "PGTextButton": "PGLib.PGButtons",
+    "name_to_rgb": "PGLib.PGButtons",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    return getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
 
 
 class PGScene:
@@ -56,11 +86,125 @@ class PGGame:
         self._prevActiveScene = None
         self._transitionOutComplete = True
         self._transitionInComplete = True
+        self._activation = PGAnimation.finished()
+        self._overlays = []
+        self._commands = PGCommandQueue()
+        self._capture = None
+        self._pointer = None
+        self._governor = None
+        self._latency = None
+        self._memory = None
 
     @property
     def screen(self) -> pygame.Surface:
         return self._screen
 
+    # @property commands
+    # @abstract Queue through which other threads get work done on the game loop.
+
+    @property
+    def commands(self) -> PGCommandQueue:
+        return self._commands
+
+    # @function post
+    # @abstract Run @command(*args, **kwargs) on the game loop. Safe to call from any thread.
+
+    def post(self, command: Callable, *args, **kwargs) -> None:
+        self._commands.post(command, *args, **kwargs)
+
+    # @function enable_surface_cache
+    # @abstract Install a persistent cache of pre-rendered surfaces stored in @directory.
+
+    def enable_surface_cache(self, directory: str, max_bytes: int = 64 * 1024 * 1024) -> PGSurfaceCache:
+        cache = PGSurfaceCache(directory, max_bytes)
+        cache.install()
+        return cache
+
+    # @function enable_quality_governor
+    # @abstract Lower rendering quality automatically while frames overrun their budget.
+    # @discussion See @PGQualityGovernor; its decisions are available from @quality.
+
+    def enable_quality_governor(self, window: int = 30, overload: float = 1.0,
+                                headroom: float = 0.6) -> PGQualityGovernor:
+        self._governor = PGQualityGovernor(self._fps, window, overload, headroom)
+        self._governor.install()
+        return self._governor
+
+    def disable_quality_governor(self) -> None:
+        if self._governor:
+            self._governor.uninstall()
+            self._governor = None
+
+    @property
+    def quality(self) -> PGQualityGovernor:
+        return self._governor
+
+    # @function enable_latency_tracking
+    # @abstract Measure the time from each input event to the frame showing its effect.
+    # @discussion See @PGLatencyTracker; read the results from @latency.
+
+    def enable_latency_tracking(self, samples: int = 1000) -> "PGLatencyTracker":
+        from PGLib.PGLatency import PGLatencyTracker
+        self._latency = PGLatencyTracker(samples)
+        self._latency.install()
+        return self._latency
+
+    def disable_latency_tracking(self) -> None:
+        if self._latency:
+            self._latency.uninstall()
+            self._latency = None
+
+    @property
+    def latency(self) -> "PGLatencyTracker":
+        return self._latency
+
+    # @function enable_memory_tracking
+    # @abstract Account for the pixel memory held by every scene, sampling every @interval frames.
+    # @discussion See @PGMemoryTracker; read the results from @memory.
+
+    def enable_memory_tracking(self, interval: int = 60) -> "PGMemoryTracker":
+        from PGLib.PGMemory import PGMemoryTracker
+        self._memory = PGMemoryTracker(self, interval)
+        return self._memory
+
+    def disable_memory_tracking(self) -> None:
+        self._memory = None
+
+    @property
+    def memory(self) -> "PGMemoryTracker":
+        return self._memory
+
+    @property
+    def capture(self) -> "PGFrameCapture":
+        return self._capture
+
+    # @function start_capture
+    # @abstract Begin streaming every drawn frame to disk.
+    # @discussion See @PGFrameCapture for the meaning of the parameters. Frames are captured
+    #             at the window size at the time of the call.
+
+    def start_capture(self, path: str, fmt: str = "png", buffers: int = 8, policy: str = "drop",
+                      max_wait: float = 0.005) -> "PGFrameCapture":
+        from PGLib.PGCapture import PGFrameCapture
+        self.stop_capture()
+        self._capture = PGFrameCapture(path, self._screen.get_size(), fmt, buffers, policy, max_wait)
+        return self._capture
+
+    # @function stop_capture
+    # @abstract Flush and stop the running capture, if any.
+    # @return The finished capture, whose counters remain readable.
+
+    def stop_capture(self) -> "PGFrameCapture":
+        capture = self._capture
+        if capture:
+            capture.close()
+            self._capture = None
+        return capture
+
+    @property
+    def scenes(self) -> list[PGScene]:
+        return self._scenes
+
     # @function add_scene
     # @abstract Appends a new scene to @self._scenes and activate it.
     # @param scene The scene to add.
@@ -80,7 +224,11 @@ class PGGame:
     # set_level
     # eliminate all scenes above @level and activate it thereafter
 
-    def set_active_scene(self, scene: PGScene, trans_in: str = "fade", trans_out: str = "fade") -> None:
+    # @function set_active_scene
+    # @return An animation that completes once the scene has finished transitioning in
+    #         (or has been replaced by another scene).
+
+    def set_active_scene(self, scene: PGScene, trans_in: str = "fade", trans_out: str = "fade") -> PGAnimation:
         assert scene, "Scene must be valid!"
         assert scene in self._scenes, "Scene must be contained!"
         if self._activeScene:
@@ -90,47 +238,146 @@ class PGGame:
         self._activeScene = scene
         self._activeScene.transition_in_method = trans_in
         self._transitionInComplete = False
+        self._activation.finish()
+        self._activation = PGAnimation()
+        return self._activation
+
+    def set_active_scene_index(self, index: int = 0, trans_in: str = "fade", trans_out: str = "fade") -> PGAnimation:
+        return self.set_active_scene(self._scenes[index], trans_in, trans_out)
+
+    @property
+    def overlays(self) -> list[PGScene]:
+        return self._overlays
+
+    # @function push_overlay
+    # @abstract Show a scene on top of everything currently displayed.
+    # @discussion While overlays are present, only the topmost one receives events and is
+    #             updated; the scenes below are frozen and shown through its background.
+
+    def push_overlay(self, overlay: PGScene) -> None:
+        assert overlay not in self._overlays, "Overlay is already shown!"
+        underlying = self._overlays[-1] if self._overlays else self._activeScene
+        self._overlays.append(overlay)
+        overlay.attach(underlying)
+
+    # @function pop_overlay
+    # @abstract Remove an overlay (the topmost one by default) and repaint what lies below.
+
+    def pop_overlay(self, overlay: PGScene = None) -> None:
+        if not self._overlays:
+            return
+        if not overlay:
+            overlay = self._overlays[-1]
+        index = self._overlays.index(overlay)
+        self._overlays.remove(overlay)
+        if index < len(self._overlays):
+            # Restack the overlay that sat above the removed one
+            self._overlays[index].attach(self._overlays[index - 1] if index else self._activeScene)
+        elif self._overlays:
+            self._overlays[-1].repaint()
+        elif self._activeScene:
+            self._activeScene.repaint()
+
+    # @function _frame
+    # @abstract Process events, update and draw the active scene (or topmost overlay) once.
+    # @return False once the game should stop.
+
+    def _frame(self) -> bool:
+        events = pygame.event.get()
+        tracker = self._latency
+        stamp = tracker.now() if tracker else None
+        for event in events:
+            if event.type == pygame.MOUSEWHEEL:
+                # Wheel events carry no position: use the pointer's as of this event
+                event.pos = self._pointer or pygame.mouse.get_pos()
+            elif hasattr(event, "pos"):
+                self._pointer = event.pos
+            if tracker:
+                tracker.begin(pygame.event.event_name(event.type), stamp)
+            if self._overlays:
+                self._overlays[-1].process_events(event)
+            elif self._activeScene:
+                self._activeScene.process_events(event)
+            if tracker:
+                tracker.end()
+            if event.type == pygame.QUIT:
+                self.stop_capture()
+                pygame.quit()
+                return False
+            if event.type == pygame.VIDEORESIZE:
+                fmt = display_format()
+                self._screen = pygame.display.set_mode((event.w, event.h),
+                                                       pygame.DOUBLEBUF | pygame.HWSURFACE | pygame.RESIZABLE)
+                reformat = display_format() != fmt
+                for s in self._scenes + self._overlays:
+                    if reformat:
+                        s.reformat()
+                    s.resize(self._screen)
+
+        self._commands.drain()
+
+        scene = self._activeScene
+        if not scene:
+            self.stop_capture()
+            return False
 
-    def set_active_scene_index(self, index: int = 0, trans_in: str = "fade", trans_out: str = "fade") -> None:
-        self.set_active_scene(self._scenes[index], trans_in, trans_out)
+        if self._overlays:
+            scene = self._overlays[-1]
+            scene.refresh()
+        elif not self._transitionOutComplete:
+            scene = self._prevActiveScene
+            self._transitionOutComplete = scene.transition_out()
+            if self._transitionOutComplete:
+                if not self._activeScene.background_set():
+                    self._activeScene.capture_background(self._screen.copy())
+                return True  # Do not update after transition out is complete to prevent "flashing"
+        elif not self._transitionInComplete:
+            self._transitionInComplete = scene.transition_in()
+            if self._transitionInComplete:
+                self._activation.finish()
+
+        scene.update()
+        rects = scene.draw()
+        if self._capture:
+            self._capture.capture(self._screen, rects)
+        if self._memory:
+            self._memory.frame()
+        return True
 
     # main game loop
     # processes & updates the active scene every frame
 
     def _game_loop(self) -> None:
         while True:
-            for event in pygame.event.get():
-                if self._activeScene:
-                    self._activeScene.process_events(event)
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return
-                if event.type == pygame.VIDEORESIZE:
-                    self._screen = pygame.display.set_mode((event.w, event.h),
-                                                           pygame.DOUBLEBUF | pygame.HWSURFACE | pygame.RESIZABLE)
-
-            scene = self._activeScene
-            if not scene:
+            frame_start = time.perf_counter()
+            if not self._frame():
                 return
-
-            if not self._transitionOutComplete:
-                scene = self._prevActiveScene
-                self._transitionOutComplete = scene.transition_out()
-                if self._transitionOutComplete:
-                    if not self._activeScene.background_set():
-                        self._activeScene.background = self._screen.copy()
-                        self._activeScene.update_background()
-                    continue  # Do not update after transition out is complete to prevent "flashing"
-            elif not self._transitionInComplete:
-                self._transitionInComplete = scene.transition_in()
-
-            scene.update()
-            scene.draw()
+            if self._governor:
+                self._governor.record(time.perf_counter() - frame_start)
             clock.tick(self._fps)
 
     def start(self):
         self._game_loop()
 
+    # @function start_async
+    # @abstract Run the game loop as a coroutine on the running asyncio event loop.
+    # @discussion After each frame the loop sleeps for whatever remains of the frame budget,
+    #             letting other tasks (network, file I/O, coroutine click actions and code
+    #             awaiting animations) run in between frames. Use as
+    #             "asyncio.run(game.start_async())".
+
+    async def start_async(self) -> None:
+        import asyncio
+        budget = 1 / self._fps
+        while True:
+            frame_start = time.perf_counter()
+            if not self._frame():
+                return
+            if self._governor:
+                self._governor.record(time.perf_counter() - frame_start)
+            clock.tick()
+            await asyncio.sleep(max(0.0, budget - (time.perf_counter() - frame_start)))
+
 
 # @class PGScene
 # @abstract Base class for all scene objects in the game.
@@ -151,8 +398,14 @@ class PGScene:
         self._transitionInMethod = "none"
         self._transitionOutMethod = "none"
         self._veil = None
+        self._veilScale = 1
         self._background = None
         self._backgroundSet = False
+        self._dynamicBackground = None
+        self._backgroundRef = None
+        self._backgroundCaptured = False
+        self._version = 0
+        self._layout = None
         self.background = bg
         self.update_background()
 
@@ -176,33 +429,178 @@ class PGScene:
     def group(self) -> PGGroup:
         return self._objects
 
+    # @property veil
+    # @abstract The object covering the scene during a transition, or None.
+
+    @property
+    def veil(self) -> PGObject:
+        return self._veil
+
     def add_object(self, obj: PGObject):
         self._objects.add(obj)
+        self.invalidate()
 
     def remove_object(self, obj: PGObject):
         self._objects.remove(obj)
+        self.invalidate()
+
+    # @function invalidate
+    # @abstract Mark the scene's appearance as changed.
+    # @discussion Objects call this whenever their image, alpha or position changes, so
+    #             cached renders of the scene (e.g. popup snapshots) know to rebuild.
+
+    def invalidate(self) -> None:
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    # @property layout
+    # @abstract The root layout of the scene, arranged within the whole screen.
+    # @discussion The layout pass runs in @update, and only when the layout was invalidated
+    #             or the window was resized.
+
+    @property
+    def layout(self) -> PGLayout:
+        return self._layout
 
-    # TO-DO: Handle dynamic background support
+    @layout.setter
+    def layout(self, layout: PGLayout) -> None:
+        self._layout = layout
+
+    # @function resize
+    # @abstract Adopt the new display surface after the window is resized.
+
+    def resize(self, screen: pygame.Surface) -> None:
+        self._screen = screen
+        if self.camera:
+            self.camera.resize(screen.get_size())
+        if self._dynamicBackground:
+            self._background = self._dynamicBackground.resize(screen.get_size())
+            self.update_background()
+        self.repaint()
+
+    @property
+    def camera(self) -> "PGCamera":
+        return self._objects.camera
+
+    # @function enable_camera
+    # @abstract Position the scene's objects in world coordinates seen through a camera.
+    # @discussion Only objects inside the viewport are drawn, hit-tested and, with
+    #             @cull_updates, updated, so a frame costs what is visible rather than
+    #             what the world contains. See @PGCamera and @PGGroup.set_camera.
+
+    def enable_camera(self, pos: tuple[int, int] = (0, 0), bounds: pygame.Rect = None, cell_size: int = 256,
+                      cull_updates: bool = False) -> "PGCamera":
+        from PGLib.PGCamera import PGCamera
+        camera = PGCamera(self._screen.get_size(), pos, bounds)
+        self._objects.set_camera(camera, cell_size, cull_updates)
+        self.invalidate()
+        return camera
+
+    def disable_camera(self) -> None:
+        self._objects.set_camera(None)
+        self.invalidate()
+
+    # @property background
+    # @abstract The window-sized surface drawn behind the scene's objects.
+    # @discussion Either a static surface or, when a @PGBackground is assigned, that
+    #             background's view, which follows the camera (or @PGBackground.pos) and
+    #             is brought up to date before every draw.
 
     @property
     def background(self) -> pygame.Surface:
         return self._background
 
     @background.setter
-    def background(self, bg: pygame.Surface = None) -> None:
-        if bg:
-            self._background = bg
+    def background(self, bg: Union[pygame.Surface, PGBackground] = None) -> None:
+        self._dynamicBackground = None
+        self._backgroundRef = find_image_ref(bg) if isinstance(bg, pygame.Surface) else None
+        self._backgroundCaptured = False
+        if isinstance(bg, PGBackground):
+            self._dynamicBackground = bg
+            self._background = bg.resize(self._screen.get_size())
+            self._backgroundSet = True
+        elif bg:
+            self._background = optimize_surface(bg)
             self._backgroundSet = True
         else:
-            self._background = pygame.Surface(self._screen.get_size()).convert_alpha()
+            self._background = pygame.Surface(self._screen.get_size()).convert()
             self._background.fill((0, 0, 0))
+        self.invalidate()
 
     def background_set(self) -> bool:
         return self._backgroundSet
 
+    # @function capture_background
+    # @abstract Keep @surface, what the screen showed, as the background of a scene that has none.
+    # @discussion Used once a transition into the scene ends. Snapshots leave it out: a
+    #             restored scene starts over from the default background.
+
+    def capture_background(self, surface: pygame.Surface) -> None:
+        self.background = surface
+        self._backgroundCaptured = True
+        self.update_background()
+
     def update_background(self) -> None:
         self._objects.clear(self._screen, self._background)
 
+    # @function reformat
+    # @abstract Convert every image of the scene again after the display format changed.
+
+    def reformat(self) -> None:
+        for s in self._objects.sprites():
+            if isinstance(s, PGObject):
+                s.reformat()
+        if self._dynamicBackground:
+            self._dynamicBackground.invalidate()
+        else:
+            self._background = optimize_surface(self._background)
+            self.update_background()
+
+    @property
+    def dynamic_background(self) -> PGBackground:
+        return self._dynamicBackground
+
+    # @function _sync_background
+    # @abstract Scroll or re-render the dynamic background, repainting what it changed.
+    # @discussion A scroll moves the screen along with it, so that only the exposed strips
+    #             are drawn again (see @PGGroup.scroll).
+
+    def _sync_background(self) -> None:
+        bg = self._dynamicBackground
+        if not bg:
+            return
+        if self.camera:
+            bg.pos = self.camera.pos
+        rects = bg.sync()
+        dx, dy = bg.scroll
+        if dx or dy:
+            self._objects.scroll(self._screen, dx, dy)
+        for r in rects:
+            self._objects.repaint_background(r)
+        if rects:
+            self.invalidate()
+
+    # @function render
+    # @abstract Fully draw the scene (background and visible objects) onto @surface.
+    # @discussion Unlike @draw, this neither relies on dirty rects nor touches the display.
+
+    def render(self, surface: pygame.Surface) -> pygame.Surface:
+        self._sync_background()
+        surface.blit(self._background, (0, 0))
+        for s in self._objects.visible_sprites():
+            if s.visible:
+                surface.blit(s.image, self._objects.screen_rect(s), s.source_rect, s.blendmode)
+        return surface
+
+    # @function repaint
+    # @abstract Have the next @draw restore the whole screen rather than only dirty areas.
+
+    def repaint(self) -> None:
+        self._objects.repaint_rect(self._screen.get_rect())
+
     @property
     def game(self) -> PGGame:
         return self._game
@@ -210,8 +608,8 @@ class PGScene:
     # @function activate
     # @abstract Sets the current scene as active in the game.
 
-    def activate(self, trans_in: str = "fade", trans_out: str = "fade") -> None:
-        self._game.set_active_scene(self, trans_in, trans_out)
+    def activate(self, trans_in: str = "fade", trans_out: str = "fade") -> PGAnimation:
+        return self._game.set_active_scene(self, trans_in, trans_out)
 
     # @function finish
     # @abstract Entirely remove the scene from the game.
@@ -231,14 +629,99 @@ class PGScene:
     # @discussion Must be overridden if there are other objects (such as fader, background).
 
     def update(self) -> None:
+        if self._layout:
+            self._layout.layout(self._screen.get_rect())
         self._objects.update()
 
-    def draw(self) -> None:
-        pygame.display.update(self._objects.draw(self._screen))
+    def draw(self) -> list[pygame.Rect]:
+        self._sync_background()
+        rects = self._objects.draw(self._screen)
+        pygame.display.update(rects)
+        tracker = latency_tracker()
+        if tracker:
+            tracker.presented()
+        return rects
 
     @staticmethod
     def fit_image(img_path: str, size: (int, int)) -> pygame.Surface:
-        return pygame.transform.smoothscale(pygame.image.load(img_path), size)
+        return fit_file(img_path, size)
+
+    # Snapshots
+
+    # @function find
+    # @abstract The object given @name, or None.
+
+    def find(self, name: str) -> PGObject:
+        for s in self._objects.sprites():
+            if isinstance(s, PGObject) and s.name == name:
+                return s
+        return None
+
+    # @function snapshot
+    # @abstract A compact, JSON-serializable description of the scene and its objects.
+    # @discussion Images are recorded by reference (see @PGImages), never as pixels, so a
+    #             snapshot costs a few hundred bytes per object. The background must have a
+    #             reference too; dynamic backgrounds are not supported. Objects are
+    #             recorded by @PGObject.get_state in drawing order; transition veils and
+    #             plain pygame sprites are left out.
+
+    def snapshot(self) -> dict:
+        if self._dynamicBackground:
+            raise ValueError("Scenes with a dynamic background cannot be snapshotted!")
+        state = {"version": SNAPSHOT_VERSION, "class": class_path(type(self))}
+        if self._backgroundSet and not self._backgroundCaptured:
+            if self._backgroundRef is None:
+                raise ValueError("The scene's background has no image reference and cannot be snapshotted!")
+            state["background"] = list(self._backgroundRef)
+        if self._transitionInMethod != "none":
+            state["transition_in"] = self._transitionInMethod
+        if self._transitionOutMethod != "none":
+            state["transition_out"] = self._transitionOutMethod
+        if self.camera:
+            state["camera"] = {"pos": list(self.camera.pos), "cell_size": self._objects.cull_cell_size,
+                               "cull_updates": self._objects.cull_updates}
+            if self.camera.bounds:
+                state["camera"]["bounds"] = list(self.camera.bounds)
+        if self._objects.static_layers:
+            state["static_layers"] = self._objects.static_layers
+        state["objects"] = [s.get_state() for s in self._objects.sprites()
+                            if isinstance(s, PGObject) and s is not self._veil]
+        return state
+
+    # @function restore
+    # @abstract Rebuild a scene from a @snapshot and add it to @game.
+    # @discussion Objects built from image references share the loaded and converted
+    #             images, and text buttons share the images of buttons looking the same, so
+    #             a restore mostly creates views of surfaces that already exist. Text areas
+    #             still render their visible lines. Only @PGScene's own
+    #             constructor runs: the scene class's is skipped, as it would build the
+    #             objects over again. Override @restored to reconnect actions and look up
+    #             objects (see @find).
+
+    @staticmethod
+    def restore(game: PGGame, state: dict) -> "PGScene":
+        if state.get("version") != SNAPSHOT_VERSION:
+            raise ValueError("Unsupported snapshot version %r!" % state.get("version"))
+        cls = find_class(state["class"])
+        scene = cls.__new__(cls)
+        PGScene.__init__(scene, game, load_image(state["background"]) if "background" in state else None)
+        scene._transitionInMethod = state.get("transition_in", "none")
+        scene._transitionOutMethod = state.get("transition_out", "none")
+        camera = state.get("camera")
+        if camera:
+            scene.enable_camera(camera["pos"], camera.get("bounds"), camera["cell_size"], camera["cull_updates"])
+        for layer in state.get("static_layers", []):
+            scene._objects.set_layer_static(layer)
+        for s in state["objects"]:
+            PGObject.from_state(scene, s)
+        scene.restored()
+        return scene
+
+    # @function restored
+    # @abstract Invoked once @restore rebuilt the scene.
+
+    def restored(self) -> None:
+        return
 
     #
     # TO-DO: Enhance with decorators
@@ -260,9 +743,10 @@ class PGScene:
 
     def _transition_fade_alpha(self, is_in: bool, alpha: int) -> bool:
         if not self._veil:
-            veil_img = pygame.Surface(self._screen.get_size(), pygame.SRCALPHA)
+            veil_img = pygame.Surface(self._screen.get_size())
             veil_img.fill((0, 0, 0))
             self._veil = PGObject(self, 0, 0, img=veil_img)
+            self._veil.screen_space = True
             self._veil.alpha = alpha if is_in else 0
             self._veil.fade(0 if is_in else alpha)
             return False
@@ -273,14 +757,22 @@ class PGScene:
 
     def _transition_in_zoom(self) -> bool:
         if not self._veil:
-            self._veil = PGObject(self, 0, 0, img=self._screen.convert_alpha().copy())
+            # At reduced quality the veil is a smaller copy of the screen zoomed up further
+            factor = quality().effect_scale
+            img = self._screen.copy()
+            if factor < 1:
+                img = scale_surface(img, (max(1, int(img.get_width() * factor)), max(1, int(img.get_height() * factor))))
+            self._veil = PGObject(self, 0, 0, img=img)
+            self._veil.screen_space = True
+            self._veil.rect.center = self._screen.get_rect().center
+            self._veilScale = 1 / factor
             self._veil.scale = 0.01
             for s in self._objects.sprites():
                 s.alpha = 0
-            self._veil.zoom(1)
+            self._veil.zoom(self._veilScale)
             return False
 
-        if self._veil.scale == 1:
+        if self._veil.scale == self._veilScale:
             for s in self._objects.sprites():
                 s.alpha = 255
             return True
@@ -24,4 +24,15 @@
 
 import pygame
 
-clock = pygame.time.Clock()
\ No newline at end of file
+clock = pygame.time.Clock()
+
+# Set by PGLatencyTracker.install; kept here so that reporting to the tracker does not
+# require importing PGLib.PGLatency
+_latencyTracker = None
+
+
+# @function latency_tracker
+# @abstract The installed @PGLatencyTracker, or None.
+
+def latency_tracker():
+    return _latencyTracker
\ No newline at end of file
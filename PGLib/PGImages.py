@@ -0,0 +1,202 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 cjiang. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import weakref
+from collections import OrderedDict
+from typing import Union
+from PGLib.PGFormat import *
+from PGLib.PGGlobal import *
+from PGLib.PGSurfaceCache import *
+
+# Images by reference, so that scene snapshots (see @PGScene.snapshot) can name image
+# content instead of storing pixels. A reference is a tuple (or, after a round trip
+# through JSON, a list):
+#   ("file", path)                  the image file at path
+#   ("fit", path, width, height)    the image file smoothly scaled to the given size
+#   ("registered", name)            a surface handed to @register_image under name
+# Surfaces produced here remember their reference, so objects built from them can be
+# snapshotted without being told where their image came from.
+
+
+# @class _SharedSurfaces
+# @abstract Surfaces by key, shared while in use and kept for a while after.
+# @discussion The most recently used surfaces, up to @max_bytes of pixels, are kept alive
+#             here; beyond that a surface stays shared only for as long as something else
+#             (such as an object's views of it) keeps it alive.
+
+class _SharedSurfaces:
+    def __init__(self, max_bytes: int) -> None:
+        self._maxBytes = max_bytes
+        self._live = weakref.WeakValueDictionary()
+        self._recent = OrderedDict()
+        self._bytes = 0
+
+    @staticmethod
+    def _surface_bytes(surface: pygame.Surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def get(self, key) -> pygame.Surface:
+        surface = self._live.get(key)
+        if surface is not None:
+            self._keep(key, surface)
+        return surface
+
+    def put(self, key, surface: pygame.Surface) -> None:
+        self.discard(key)
+        self._live[key] = surface
+        self._keep(key, surface)
+
+    def _keep(self, key, surface: pygame.Surface) -> None:
+        if key in self._recent:
+            self._recent.move_to_end(key)
+            return
+        self._recent[key] = surface
+        self._bytes += self._surface_bytes(surface)
+        while len(self._recent) > 1 and self._bytes > self._maxBytes:
+            self._bytes -= self._surface_bytes(self._recent.popitem(last=False)[1])
+
+    def discard(self, key) -> None:
+        self._live.pop(key, None)
+        surface = self._recent.pop(key, None)
+        if surface is not None:
+            self._bytes -= self._surface_bytes(surface)
+
+    def keys(self) -> list:
+        return list(self._live.keys())
+
+    def surfaces(self) -> list[pygame.Surface]:
+        return list(self._live.values())
+
+    def clear(self) -> None:
+        self._live.clear()
+        self._recent.clear()
+        self._bytes = 0
+
+
+_images = _SharedSurfaces(32 * 1024 * 1024)
+_optimized = _SharedSurfaces(32 * 1024 * 1024)
+_registered = {}
+_refs = weakref.WeakKeyDictionary()
+
+
+# @function find_image_ref
+# @abstract The reference @surface was loaded from, or None.
+
+def find_image_ref(surface: pygame.Surface) -> tuple:
+    return _refs.get(surface)
+
+
+def _tag(surface: pygame.Surface, ref: tuple) -> pygame.Surface:
+    _refs[surface] = ref
+    return surface
+
+
+# @function register_image
+# @abstract Make @surface available as ("registered", @name), e.g. for generated images.
+
+def register_image(name: str, surface: pygame.Surface) -> tuple:
+    ref = ("registered", name)
+    _registered[name] = surface
+    _images.discard(ref)
+    for key in [k for k in _optimized.keys() if k[0] == ref]:
+        _optimized.discard(key)
+    _tag(surface, ref)
+    return ref
+
+
+# @function image_file
+# @abstract Load the image at @path, through the installed @PGSurfaceCache if any.
+
+def image_file(path: str) -> pygame.Surface:
+    cache = PGSurfaceCache.active()
+    if not cache:
+        img = pygame.image.load(path)
+    else:
+        img = cache.fetch(("image", PGSurfaceCache.file_key(path)), lambda: pygame.image.load(path))
+    return _tag(img, ("file", path))
+
+
+# @function fit_file
+# @abstract Load the image at @path smoothly scaled to @size (see @PGScene.fit_image).
+
+def fit_file(path: str, size: tuple[int, int]) -> pygame.Surface:
+    size = (int(size[0]), int(size[1]))
+    cache = PGSurfaceCache.active()
+    if not cache:
+        img = pygame.transform.smoothscale(pygame.image.load(path), size)
+    else:
+        img = cache.fetch(("fit_image", PGSurfaceCache.file_key(path), size),
+                          lambda: pygame.transform.smoothscale(pygame.image.load(path), size))
+    return _tag(img, ("fit", path) + size)
+
+
+# @function load_image
+# @abstract The surface behind @ref, loaded once and then shared.
+# @discussion The surface must not be modified; use @PGObject(image_ref=...) or a copy.
+
+def load_image(ref: Union[tuple, list]) -> pygame.Surface:
+    ref = tuple(ref)
+    img = _images.get(ref)
+    if img is not None:
+        return img
+    if ref[0] == "registered":
+        img = _registered[ref[1]]
+    elif ref[0] == "file":
+        img = image_file(ref[1])
+    elif ref[0] == "fit":
+        img = fit_file(ref[1], ref[2:4])
+    else:
+        raise ValueError("Unknown image reference %r!" % (ref,))
+    _images.put(ref, img)
+    return img
+
+
+# @function optimized_image
+# @abstract The shared @optimize_surface conversion of the image behind @ref.
+# @discussion Conversions are kept per display format, so objects restored from the same
+#             reference analyze and convert the image only once.
+
+def optimized_image(ref: Union[tuple, list]) -> pygame.Surface:
+    ref = tuple(ref)
+    key = (ref, display_format())
+    img = _optimized.get(key)
+    if img is None:
+        img = _tag(optimize_surface(load_image(ref)), ref)
+        _optimized.put(key, img)
+    return img
+
+
+# @function shared_images
+# @abstract The loaded and converted images currently shared, for memory accounting.
+
+def shared_images() -> list[pygame.Surface]:
+    return _images.surfaces() + _optimized.surfaces()
+
+
+# @function forget_images
+# @abstract Drop the shared images, e.g. after the files behind them changed.
+
+def forget_images() -> None:
+    _images.clear()
+    _optimized.clear()
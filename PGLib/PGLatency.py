@@ -0,0 +1,168 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 cjiang. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import time
+import weakref
+from collections import deque
+import PGLib.PGGlobal
+from PGLib.PGGlobal import *
+
+
+# @class PGLatencyTracker
+# @abstract Measures how long input events take to show up on screen.
+# @discussion Every event is stamped when the game loop dequeues it. While it is being
+#             handled, the tracker knows which event and which object (the one clicked,
+#             hovered or handed the event) are responsible, and every object whose image,
+#             alpha or position changes, or which starts an animation, is attributed to
+#             them. The latency is recorded when the first frame containing such a change
+#             is passed to pygame.display.update: in seconds and in frames (1 being the
+#             first frame shown after the event), per event type and per handling
+#             object. Effects produced later by coroutine handlers are not attributed.
+#             Install one with @install (or @PGGame.enable_latency_tracking) to have
+#             PGLib report to it; PGLib finds it through @latency_tracker.
+
+class PGLatencyTracker:
+    # Changes still not shown after this many frames (e.g. animations of nothing) are dropped
+    _MAX_PENDING_FRAMES = 600
+
+    def __init__(self, samples: int = 1000) -> None:
+        self._samples = samples
+        self._context = None
+        self._pending = {}
+        self._frame = 0
+        self._byType = {}
+        self._byObject = {}
+        self._labels = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def active() -> "PGLatencyTracker":
+        return latency_tracker()
+
+    def install(self) -> None:
+        PGLib.PGGlobal._latencyTracker = self
+
+    @staticmethod
+    def uninstall() -> None:
+        PGLib.PGGlobal._latencyTracker = None
+
+    @staticmethod
+    def now() -> float:
+        return time.perf_counter()
+
+    # @function begin
+    # @abstract Attribute changes from now on to an event of type @name, dequeued at @stamp.
+
+    def begin(self, name: str, stamp: float, target=None) -> None:
+        self._context = [name, stamp, self._frame, target]
+
+    def end(self) -> None:
+        self._context = None
+
+    @property
+    def stamp(self) -> float:
+        return self._context[1] if self._context else None
+
+    # @function target
+    # @abstract Name @obj as the object handling the current event.
+
+    def target(self, obj) -> None:
+        if self._context:
+            self._context[3] = obj
+            self._label(obj)
+
+    # @function touched
+    # @abstract Note that @obj changed (@visible) or started an animation that will change it.
+
+    def touched(self, obj, visible: bool = True) -> None:
+        if self._context:
+            if obj not in self._pending or visible:
+                self._pending[obj] = [visible] + self._context
+        elif visible and obj in self._pending:
+            self._pending[obj][0] = True
+
+    # @function presented
+    # @abstract Record the latency of every pending change drawn in the frame just shown.
+
+    def presented(self) -> None:
+        now = time.perf_counter()
+        self._frame += 1
+        for obj, (visible, name, stamp, frame, target) in list(self._pending.items()):
+            if not visible:
+                if self._frame - frame > self._MAX_PENDING_FRAMES:
+                    del self._pending[obj]
+                continue
+            del self._pending[obj]
+            sample = (now - stamp, self._frame - frame)
+            self._byType.setdefault(name, deque(maxlen=self._samples)).append(sample)
+            if target is not None:
+                self._byObject.setdefault(self._label(target), deque(maxlen=self._samples)).append(sample)
+
+    # @function _label
+    # @abstract Name of @obj in reports, fixed the first time it is seen.
+
+    def _label(self, obj) -> str:
+        label = self._labels.get(obj)
+        if label is None:
+            text = getattr(obj, "text", None)
+            if isinstance(text, str) and len(text) < 32:
+                label = "%s '%s' (%#x)" % (type(obj).__name__, text, id(obj))
+            else:
+                label = "%s (%#x)" % (type(obj).__name__, id(obj))
+            self._labels[obj] = label
+        return label
+
+    @staticmethod
+    def _percentiles(samples) -> dict:
+        seconds = sorted(s[0] for s in samples)
+        frames = sorted(s[1] for s in samples)
+
+        def rank(values, p):
+            return values[min(len(values) - 1, max(0, int(round(p / 100 * len(values))) - 1))]
+
+        stats = {"count": len(seconds)}
+        for p in (50, 95, 99):
+            stats["p%d" % p] = rank(seconds, p)
+            stats["p%d_frames" % p] = rank(frames, p)
+        return stats
+
+    # @function report
+    # @abstract Latency percentiles (seconds and frames) per event type and per object.
+
+    def report(self) -> dict:
+        return {"by_type": {k: self._percentiles(v) for k, v in self._byType.items()},
+                "by_object": {k: self._percentiles(v) for k, v in self._byObject.items()}}
+
+    def format_report(self) -> str:
+        lines = []
+        for title, table in self.report().items():
+            lines.append("%-40s %6s %9s %9s %9s %7s" % (title, "count", "p50 ms", "p95 ms", "p99 ms", "p99 fr"))
+            for key, s in sorted(table.items(), key=lambda item: -item[1]["p95"]):
+                lines.append("%-40s %6d %9.1f %9.1f %9.1f %7d" % (key[:40], s["count"], s["p50"] * 1000,
+                                                               s["p95"] * 1000, s["p99"] * 1000, s["p99_frames"]))
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        self._pending.clear()
+        self._byType.clear()
+        self._byObject.clear()
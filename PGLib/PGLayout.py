@@ -0,0 +1,282 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 cjiang. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import abc
+from PGLib.PGObject import *
+
+
+# @class PGLayout
+# @abstract Base class for layout containers positioning objects within a scene.
+# @discussion A layout is a tree of containers whose leaves are @PGObject instances.
+#             Measured sizes are cached per container: when an object's size changes, or a
+#             child is added or removed, only the containers on its path to the root are
+#             marked dirty. A layout pass (run at most once per frame by the owning scene)
+#             re-measures the dirty containers and re-arranges only the subtrees whose
+#             assigned rect or content changed, so resizing the window re-arranges without
+#             re-measuring, and changing one label touches only its ancestors.
+# @param padding Either a single int or a (left, top, right, bottom) tuple.
+# @param spacing Gap between consecutive children.
+
+class PGLayout(abc.ABC):
+    def __init__(self, *children: Union[PGObject, "PGLayout"], padding: Union[int, tuple] = 0,
+                 spacing: int = 0) -> None:
+        self._parent = None
+        self._children = []
+        self._padding = padding if isinstance(padding, tuple) else (padding,) * 4
+        self._spacing = spacing
+        self._size = (0, 0)
+        self._rect = None
+        self._measureDirty = True
+        self._arrangeDirty = True
+        for child in children:
+            self.add(child)
+
+    @property
+    def parent(self) -> "PGLayout":
+        return self._parent
+
+    @property
+    def children(self) -> list:
+        return self._children
+
+    @property
+    def rect(self) -> pygame.Rect:
+        return self._rect
+
+    @property
+    def padding(self) -> tuple[int, int, int, int]:
+        return self._padding
+
+    @padding.setter
+    def padding(self, padding: Union[int, tuple]) -> None:
+        self._padding = padding if isinstance(padding, tuple) else (padding,) * 4
+        self.invalidate()
+
+    @property
+    def spacing(self) -> int:
+        return self._spacing
+
+    @spacing.setter
+    def spacing(self, spacing: int) -> None:
+        self._spacing = spacing
+        self.invalidate()
+
+    def add(self, child: Union[PGObject, "PGLayout"]) -> None:
+        assert child._layout is None if isinstance(child, PGObject) else child._parent is None, \
+            "Child already belongs to a layout!"
+        if isinstance(child, PGObject):
+            child._layout = self
+        else:
+            child._parent = self
+        self._children.append(child)
+        self.invalidate()
+
+    def remove(self, child: Union[PGObject, "PGLayout"]) -> None:
+        self._children.remove(child)
+        if isinstance(child, PGObject):
+            child._layout = None
+        else:
+            child._parent = None
+        self.invalidate()
+
+    # @function invalidate
+    # @abstract Mark this container and its ancestors for re-measuring.
+
+    def invalidate(self) -> None:
+        node = self
+        while node and not node._measureDirty:
+            node._measureDirty = True
+            node._arrangeDirty = True
+            node = node._parent
+
+    @staticmethod
+    def _child_size(child: Union[PGObject, "PGLayout"]) -> tuple[int, int]:
+        if isinstance(child, PGObject):
+            return child.rect.size
+        return child.measure()
+
+    @staticmethod
+    def _place(child: Union[PGObject, "PGLayout"], rect: pygame.Rect) -> None:
+        if isinstance(child, PGObject):
+            if child.pos != rect.topleft:
+                child.pos = rect.topleft
+        else:
+            child.arrange(rect)
+
+    # @function measure
+    # @abstract Return the size the container needs, recomputing it only if dirty.
+
+    def measure(self) -> tuple[int, int]:
+        if self._measureDirty:
+            w, h = self._measure([self._child_size(c) for c in self._children])
+            self._size = (w + self._padding[0] + self._padding[2], h + self._padding[1] + self._padding[3])
+            self._measureDirty = False
+        return self._size
+
+    # @function arrange
+    # @abstract Position the children within @rect, skipping the work if nothing changed.
+
+    def arrange(self, rect: pygame.Rect) -> None:
+        rect = pygame.Rect(rect)
+        if not self._arrangeDirty and rect == self._rect:
+            return
+        self._rect = rect
+        self._arrangeDirty = False
+        inner = pygame.Rect(rect.x + self._padding[0], rect.y + self._padding[1],
+                            rect.width - self._padding[0] - self._padding[2],
+                            rect.height - self._padding[1] - self._padding[3])
+        sizes = [self._child_size(c) for c in self._children]
+        for child, cell in zip(self._children, self._arrange(inner, sizes)):
+            self._place(child, cell)
+
+    # @function layout
+    # @abstract Run a full layout pass with this container as the root.
+
+    def layout(self, rect: pygame.Rect) -> None:
+        self.measure()
+        self.arrange(rect)
+
+    # @function _measure
+    # @abstract The size of the content (without padding) given the children's @sizes.
+
+    @abc.abstractmethod
+    def _measure(self, sizes: list[tuple[int, int]]) -> tuple[int, int]:
+        pass
+
+    # @function _arrange
+    # @abstract One rect per child, placing children of @sizes within @inner.
+
+    @abc.abstractmethod
+    def _arrange(self, inner: pygame.Rect, sizes: list[tuple[int, int]]) -> list[pygame.Rect]:
+        pass
+
+
+# @class PGLinearLayout
+# @abstract Shared implementation of rows and columns.
+# @param justify Fraction of the free main-axis space placed before the children.
+# @param align Fraction of the free cross-axis space placed before each child.
+
+class PGLinearLayout(PGLayout):
+    _axis = 0
+
+    def __init__(self, *children: Union[PGObject, PGLayout], padding: Union[int, tuple] = 0,
+                 spacing: int = 0, justify: float = 0, align: float = 0) -> None:
+        self._justify = justify
+        self._align = align
+        super().__init__(*children, padding=padding, spacing=spacing)
+
+    def _measure(self, sizes: list[tuple[int, int]]) -> tuple[int, int]:
+        a = self._axis
+        main = sum(s[a] for s in sizes) + self._spacing * max(len(sizes) - 1, 0)
+        cross = max((s[1 - a] for s in sizes), default=0)
+        return (main, cross) if a == 0 else (cross, main)
+
+    def _arrange(self, inner: pygame.Rect, sizes: list[tuple[int, int]]) -> list[pygame.Rect]:
+        a = self._axis
+        origin = (inner.x, inner.y)
+        extent = (inner.width, inner.height)
+        used = sum(s[a] for s in sizes) + self._spacing * max(len(sizes) - 1, 0)
+        offset = origin[a] + int(max(extent[a] - used, 0) * self._justify)
+        cells = []
+        for size in sizes:
+            cross = origin[1 - a] + int(max(extent[1 - a] - size[1 - a], 0) * self._align)
+            cells.append(pygame.Rect((offset, cross) if a == 0 else (cross, offset), size))
+            offset += size[a] + self._spacing
+        return cells
+
+
+class PGRow(PGLinearLayout):
+    _axis = 0
+
+
+class PGColumn(PGLinearLayout):
+    _axis = 1
+
+
+# @class PGGrid
+# @abstract Places children row by row into a fixed number of columns.
+# @discussion Each column is as wide as its widest child and each row as tall as its
+#             tallest; children are aligned within their cells by @align.
+
+class PGGrid(PGLayout):
+    def __init__(self, *children: Union[PGObject, PGLayout], columns: int = 1, padding: Union[int, tuple] = 0,
+                 spacing: int = 0, align: tuple[float, float] = (0, 0)) -> None:
+        assert columns > 0, "Grid needs at least one column!"
+        self._columns = columns
+        self._align = align
+        super().__init__(*children, padding=padding, spacing=spacing)
+
+    def _tracks(self, sizes: list[tuple[int, int]]) -> tuple[list[int], list[int]]:
+        widths = [0] * min(self._columns, len(sizes))
+        heights = [0] * ((len(sizes) + self._columns - 1) // self._columns)
+        for i, (w, h) in enumerate(sizes):
+            widths[i % self._columns] = max(widths[i % self._columns], w)
+            heights[i // self._columns] = max(heights[i // self._columns], h)
+        return widths, heights
+
+    def _measure(self, sizes: list[tuple[int, int]]) -> tuple[int, int]:
+        widths, heights = self._tracks(sizes)
+        return (sum(widths) + self._spacing * max(len(widths) - 1, 0),
+                sum(heights) + self._spacing * max(len(heights) - 1, 0))
+
+    def _arrange(self, inner: pygame.Rect, sizes: list[tuple[int, int]]) -> list[pygame.Rect]:
+        widths, heights = self._tracks(sizes)
+        xs = [inner.x + sum(widths[:i]) + self._spacing * i for i in range(len(widths))]
+        ys = [inner.y + sum(heights[:i]) + self._spacing * i for i in range(len(heights))]
+        cells = []
+        for i, (w, h) in enumerate(sizes):
+            col, row = i % self._columns, i // self._columns
+            cells.append(pygame.Rect(xs[col] + int((widths[col] - w) * self._align[0]),
+                                     ys[row] + int((heights[row] - h) * self._align[1]), w, h))
+        return cells
+
+
+# @class PGAnchor
+# @abstract Places each child at a proportional position of the available rect.
+# @discussion Mirrors @PGObject.set_pos_prop: (0, 0) is the top left corner, (0.5, 0.5)
+#             centers the child and (1, 1) is the bottom right corner. Measures as the
+#             largest child, but is normally used as the root and given the whole screen.
+
+class PGAnchor(PGLayout):
+    def __init__(self, *children: Union[PGObject, PGLayout], anchor: tuple[float, float] = (0.5, 0.5),
+                 padding: Union[int, tuple] = 0) -> None:
+        self._anchor = anchor
+        super().__init__(*children, padding=padding)
+
+    @property
+    def anchor(self) -> tuple[float, float]:
+        return self._anchor
+
+    @anchor.setter
+    def anchor(self, anchor: tuple[float, float]) -> None:
+        self._anchor = anchor
+        self._arrangeDirty = True
+        self.invalidate()
+
+    def _measure(self, sizes: list[tuple[int, int]]) -> tuple[int, int]:
+        return max((s[0] for s in sizes), default=0), max((s[1] for s in sizes), default=0)
+
+    def _arrange(self, inner: pygame.Rect, sizes: list[tuple[int, int]]) -> list[pygame.Rect]:
+        return [pygame.Rect(inner.x + int((inner.width - w) * self._anchor[0]),
+                            inner.y + int((inner.height - h) * self._anchor[1]), w, h) for w, h in sizes]
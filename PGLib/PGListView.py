@@ -0,0 +1,196 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 cjiang. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+from PGLib.PGButtons import *
+
+
+# @class PGListView
+# @abstract A scrollable list or grid over an arbitrarily long sequence of items.
+# @discussion Only enough item objects to fill the viewport (plus @margin rows on each
+#             side) ever exist. They are never added to a scene: the list draws them
+#             onto its own image, so the scene's group sees a single object to hit-test
+#             and draw. As rows scroll out of range their objects are recycled and
+#             rebound to the rows scrolling in. Scrolling moves the pixels already drawn
+#             with Surface.scroll and paints only the newly exposed strip.
+# @param items Any sequence supporting len() and indexing.
+# @param factory Creates an item object for the list; defaults to a @PGTextButton.
+# @param bind Loads an item into an item object; defaults to setting its text to str(item).
+
+class PGListView(PGObject):
+    def __init__(self, parent: Type[PGScene], x: int, y: int, width: int, height: int, items: Sequence,
+                 item_height: int = 30, columns: int = 1, factory: Callable = None, bind: Callable = None,
+                 font: pygame.font.Font = None, bg_color: str = "white", margin: int = 2) -> None:
+        assert item_height > 0 and columns > 0, "Item height and column count must be positive!"
+        self._items = items
+        self._itemHeight = item_height
+        self._columns = columns
+        self._itemWidth = width // columns
+        self._font = font if font else sys_font("Ariel", 20)
+        self._bgColor = name_to_rgb(bg_color)
+        self._bgName = bg_color
+        self._factory = factory if factory else self._default_factory
+        self._bind = bind if bind else self._default_bind
+        self._margin = margin
+        self._bound = {}
+        self._pool = []
+        self._offset = 0
+        self._selectAction = None
+        super().__init__(parent, x, y, pygame.Surface((width, height)))
+        self._redraw()
+
+    def _default_factory(self, view: "PGListView") -> PGObject:
+        return PGTextButton(None, 0, 0, "", self._font, self._bgName, self._itemWidth, self._itemHeight)
+
+    @staticmethod
+    def _default_bind(obj: PGObject, item) -> None:
+        obj.text = str(item)
+
+    @property
+    def items(self) -> Sequence:
+        return self._items
+
+    @items.setter
+    def items(self, items: Sequence) -> None:
+        self._items = items
+        self._offset = min(self._offset, self._max_offset())
+        self.refresh()
+
+    # @function refresh
+    # @abstract Rebind and redraw every visible item, e.g. after the items were modified.
+
+    def refresh(self) -> None:
+        self._pool.extend(self._bound.values())
+        self._bound.clear()
+        self._redraw()
+
+    @property
+    def view_count(self) -> int:
+        return len(self._bound) + len(self._pool)
+
+    def surfaces(self) -> list[pygame.Surface]:
+        views = list(self._bound.values()) + self._pool
+        return super().surfaces() + [s for v in views for s in v.surfaces()]
+
+    # @function _content_state
+    # @abstract List views are not snapshotted: their items, factory and binder are
+    #           arbitrary objects and code. Recreate them in @PGScene.restored.
+
+    def _content_state(self) -> dict:
+        raise ValueError("PGListView cannot be snapshotted!")
+
+    def _row_count(self) -> int:
+        return (len(self._items) + self._columns - 1) // self._columns
+
+    def _max_offset(self) -> int:
+        return max(0, self._row_count() * self._itemHeight - self.rect.height)
+
+    # Scrolling
+
+    @property
+    def scroll(self) -> int:
+        return self._offset
+
+    @scroll.setter
+    def scroll(self, offset: int) -> None:
+        offset = max(0, min(int(offset), self._max_offset()))
+        delta = offset - self._offset
+        if not delta:
+            return
+        self._offset = offset
+        height = self.rect.height
+        if abs(delta) >= height:
+            self._redraw()
+            return
+        self.image.scroll(0, -delta)
+        if delta > 0:
+            self._redraw(pygame.Rect(0, height - delta, self.rect.width, delta))
+        else:
+            self._redraw(pygame.Rect(0, 0, self.rect.width, -delta))
+
+    def scroll_by(self, pixels: int) -> None:
+        self.scroll = self._offset + pixels
+
+    def scroll_to(self, index: int) -> None:
+        self.scroll = index // self._columns * self._itemHeight
+
+    # Recycling
+
+    def _view_for(self, index: int) -> PGObject:
+        view = self._bound.get(index)
+        if view is None:
+            view = self._pool.pop() if self._pool else self._factory(self)
+            self._bind(view, self._items[index])
+            self._bound[index] = view
+        return view
+
+    def _release_hidden(self) -> None:
+        first = (self._offset // self._itemHeight - self._margin) * self._columns
+        last = ((self._offset + self.rect.height) // self._itemHeight + self._margin + 1) * self._columns
+        for index in [i for i in self._bound if i < first or i >= last]:
+            self._pool.append(self._bound.pop(index))
+
+    # Rendering
+
+    def _redraw(self, area: pygame.Rect = None) -> None:
+        if area is None:
+            area = self.image.get_rect()
+        self._release_hidden()
+        self.image.set_clip(area)
+        self.image.fill(self._bgColor)
+        first_row = (self._offset + area.top) // self._itemHeight
+        last_row = min((self._offset + area.bottom - 1) // self._itemHeight, self._row_count() - 1)
+        for row in range(first_row, last_row + 1):
+            y = row * self._itemHeight - self._offset
+            for col in range(self._columns):
+                index = row * self._columns + col
+                if index >= len(self._items):
+                    break
+                self.image.blit(self._view_for(index).image, (col * self._itemWidth, y))
+        self.image.set_clip(None)
+        self.invalidate_mask()
+        self._changed()
+
+    # Input
+
+    def connect_select(self, action: Callable, *args, **kwargs) -> None:
+        if callable(action):
+            self._selectAction = lambda index, item: action(index, item, *args, **kwargs)
+
+    def index_at(self, pos: tuple[int, int]) -> int:
+        x, y = pos[0] - self.rect.x, pos[1] - self.rect.y + self._offset
+        col = min(x // self._itemWidth, self._columns - 1)
+        index = y // self._itemHeight * self._columns + col
+        return index if 0 <= x and 0 <= index < len(self._items) else -1
+
+    def on_click(self) -> None:
+        super().on_click()
+        index = self.index_at(self.click_pos) if self.click_pos else -1
+        if index >= 0:
+            self._view_for(index).on_click()
+            if self._selectAction:
+                self._selectAction(index, self._items[index])
+
+    def process_events(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.MOUSEWHEEL and self.rect.collidepoint(self.event_pos(event)):
+            self.scroll_by(-event.y * self._itemHeight)
@@ -0,0 +1,205 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 cjiang. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+from typing import Callable, Iterable
+from PGLib.PGGlobal import *
+
+# Category of surfaces held by PGLib itself rather than by a scene
+GLOBAL = "(global)"
+
+
+# @function surface_bytes
+# @abstract Pixel bytes owned by @surface; subsurfaces own none, their parent does.
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    if surface is None or surface.get_parent() is not None:
+        return 0
+    return surface.get_pitch() * surface.get_height()
+
+
+# @class PGMemorySnapshot
+# @abstract Pixel bytes by (owner, category) at one point in time.
+# @discussion The owner is a scene label or @GLOBAL; the category is an object type or
+#             what the surfaces are for ("background", "veil", "label cache", ...).
+
+class PGMemorySnapshot:
+    def __init__(self, frame: int, entries: dict) -> None:
+        self._frame = frame
+        self._entries = entries
+
+    @property
+    def frame(self) -> int:
+        return self._frame
+
+    @property
+    def entries(self) -> dict:
+        return dict(self._entries)
+
+    @property
+    def total(self) -> int:
+        return sum(self._entries.values())
+
+    def by_owner(self) -> dict:
+        totals = {}
+        for (owner, _), size in self._entries.items():
+            totals[owner] = totals.get(owner, 0) + size
+        return totals
+
+    def by_category(self) -> dict:
+        totals = {}
+        for (_, category), size in self._entries.items():
+            totals[category] = totals.get(category, 0) + size
+        return totals
+
+    # @function diff
+    # @abstract Bytes gained (or, if negative, released) per entry since @earlier.
+
+    def diff(self, earlier: "PGMemorySnapshot") -> dict:
+        keys = set(self._entries) | set(earlier._entries)
+        changes = {k: self._entries.get(k, 0) - earlier._entries.get(k, 0) for k in keys}
+        return {k: v for k, v in changes.items() if v}
+
+    def format(self) -> str:
+        lines = ["%-48s %-24s %12s" % ("owner", "category", "bytes")]
+        for (owner, category), size in sorted(self._entries.items(), key=lambda item: -item[1]):
+            lines.append("%-48s %-24s %12d" % (owner[:48], category[:24], size))
+        lines.append("%-48s %-24s %12d" % ("total", "", self.total))
+        return "\n".join(lines)
+
+
+# @class PGMemoryTracker
+# @abstract Accounts for the pixel memory of a game's scenes, objects and caches.
+# @discussion Rather than hooking every allocation, the tracker walks what the game holds
+#             (every scene, including inactive ones, and the overlays: their backgrounds,
+#             veils, static composites and objects, plus PGLib's own caches) and sums the
+#             bytes of each distinct surface. A surface reachable from several places, such
+#             as a shared sprite sheet, is counted once, under the first owner found. Objects
+#             report their surfaces through @PGObject.surfaces.
+#
+#             @sample takes a snapshot and updates the high-water marks; attached to a game
+#             (see @PGGame.enable_memory_tracking) one is taken every @interval frames.
+#             Budgets set with @set_budget apply to an owner, a category or "total", and
+#             actions connected with @connect_over_budget are called while they are exceeded.
+
+class PGMemoryTracker:
+    def __init__(self, game, interval: int = 60) -> None:
+        self._game = game
+        self._interval = interval
+        self._frame = 0
+        self._last = None
+        self._highWater = {}
+        self._budgets = {}
+        self._overBudgetActions = []
+
+    @property
+    def last(self) -> PGMemorySnapshot:
+        return self._last
+
+    # @property high_water
+    # @abstract Largest byte count seen per entry, per owner, per category and in total.
+
+    @property
+    def high_water(self) -> dict:
+        return dict(self._highWater)
+
+    def set_budget(self, key: str, max_bytes: int = None) -> None:
+        if max_bytes is None:
+            self._budgets.pop(key, None)
+        else:
+            self._budgets[key] = max_bytes
+
+    def connect_over_budget(self, action: Callable, *args, **kwargs) -> None:
+        self._overBudgetActions.append((action, args, kwargs))
+
+    def frame(self) -> None:
+        self._frame += 1
+        if self._interval and self._frame % self._interval == 0:
+            self.sample()
+
+    @staticmethod
+    def _label(scene) -> str:
+        return "%s (%#x)" % (type(scene).__name__, id(scene))
+
+    # @function sample
+    # @abstract Account for every surface now, returning the snapshot.
+
+    def sample(self) -> PGMemorySnapshot:
+        entries = {}
+        seen = set()
+
+        def add(owner: str, category: str, surfaces: Iterable[pygame.Surface]) -> None:
+            for s in surfaces:
+                if s is None:
+                    continue
+                root = s.get_abs_parent()
+                if id(root) in seen:
+                    continue
+                seen.add(id(root))
+                key = (owner, category)
+                entries[key] = entries.get(key, 0) + surface_bytes(root)
+
+        game = self._game
+        for scene in list(game.scenes) + [o for o in game.overlays if o not in game.scenes]:
+            owner = self._label(scene)
+            veil = scene.veil
+            if veil:
+                add(owner, "veil", veil.surfaces())
+            background = scene.dynamic_background
+            if background:
+                add(owner, "background", [background.view])
+                add(owner, "background chunks", background.chunks())
+            else:
+                add(owner, "background", [scene.background])
+            group = scene.group
+            add(owner, "static composite", [group.static_composite])
+            for s in group.sprites():
+                if s is not veil and hasattr(s, "surfaces"):
+                    add(owner, type(s).__name__, s.surfaces())
+
+        from PGLib.PGButtons import PGTextButton
+        from PGLib.PGImages import shared_images
+        add(GLOBAL, "label cache", PGTextButton.cached_labels())
+        add(GLOBAL, "button images", PGTextButton.cached_images())
+        add(GLOBAL, "shared images", shared_images())
+        if game.capture:
+            add(GLOBAL, "capture buffers", game.capture.buffers())
+
+        snapshot = PGMemorySnapshot(self._frame, entries)
+        self._last = snapshot
+        self._update_marks(snapshot)
+        return snapshot
+
+    def _update_marks(self, snapshot: PGMemorySnapshot) -> None:
+        current = {"total": snapshot.total}
+        current.update(snapshot.by_owner())
+        current.update(snapshot.by_category())
+        current.update(snapshot.entries)
+        for key, size in current.items():
+            if size > self._highWater.get(key, 0):
+                self._highWater[key] = size
+        for key, budget in self._budgets.items():
+            size = current.get(key, 0)
+            if size > budget:
+                for action, args, kwargs in self._overBudgetActions:
+                    action(key, size, budget, *args, **kwargs)
@@ -22,46 +22,138 @@
 # SOFTWARE.
 #
 
+import importlib
 import math
 
 import pygame
+from collections.abc import Coroutine
 from typing import Union, Sequence, Callable, Type
 from pygame.mask import from_surface
 import operator
+from PGLib.PGFormat import *
 from PGLib.PGGlobal import *
+from PGLib.PGImages import *
+from PGLib.PGQuality import *
 
 
 class PGScene:
     pass
 
 
+# Version of the format written by @PGObject.get_state and @PGScene.snapshot.
+SNAPSHOT_VERSION = 1
+_classes = {}
+
+
+# @function class_path
+# @abstract The importable name of @cls, as recorded in snapshots.
+
+def class_path(cls: type) -> str:
+    return "%s:%s" % (cls.__module__, cls.__qualname__)
+
+
+# @function find_class
+# @abstract The class named by @class_path, importing its module if needed.
+
+def find_class(path: str) -> type:
+    cls = _classes.get(path)
+    if cls is None:
+        module, name = path.split(":")
+        cls = importlib.import_module(module)
+        for part in name.split("."):
+            cls = getattr(cls, part)
+        _classes[path] = cls
+    return cls
+
+
+# @class PGAnimation
+# @abstract Handle to a queued animation or transition.
+# @discussion Returned by the animation methods of @PGObject and by scene activation. The
+#             game loop finishes it once the animation has played out; coroutines running
+#             under @PGGame.start_async can simply await it, e.g.
+#             "await button.fade(0); await button.move((0, 0))".
+
+class PGAnimation:
+    def __init__(self) -> None:
+        self._done = False
+        self._futures = []
+
+    @staticmethod
+    def finished() -> "PGAnimation":
+        animation = PGAnimation()
+        animation.finish()
+        return animation
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    def finish(self) -> None:
+        if self._done:
+            return
+        self._done = True
+        for future in self._futures:
+            if not future.done():
+                future.set_result(None)
+        self._futures.clear()
+
+    def __await__(self):
+        if not self._done:
+            import asyncio
+            future = asyncio.get_running_loop().create_future()
+            self._futures.append(future)
+            yield from future.__await__()
+
+
 class PGObject(pygame.sprite.DirtySprite):
-    def __init__(self, parent: Type[PGScene], x: int = 0, y: int = 0, img: pygame.Surface = None) -> None:
+    def __init__(self, parent: Type[PGScene], x: int = 0, y: int = 0, img: pygame.Surface = None,
+                 image_ref: tuple = None) -> None:
         super().__init__()
         self._parent = parent
         self.dirty = 2
         self._clickAction = None
+        self._clickPos = None
         self._hoverAction = None
-        if not img:
+        self._hoverLeaveAction = None
+        self.name = None
+        if image_ref is not None:
+            # Private views of the shared images, so that alpha stays per object
+            self._imageRef = tuple(image_ref)
+            self._use_shared(load_image(image_ref), optimized_image(image_ref))
+        elif not img:
             self.image = pygame.Surface((0, 0), pygame.SRCALPHA)
             self._origImage = None
             self._imageSet = False
+            self._imageRef = None
         else:
-            self.image = img.convert_alpha()
+            self.image = optimize_surface(img)
             self._origImage = img
             self._imageSet = True
+            self._imageRef = find_image_ref(img)
 
         self.rect = self.image.get_rect(topleft=(x, y))
         self._posChanges = []
+        self._posAnimations = []
 
         self._angle = 0
         self._angleChanges = []
+        self._angleAnimations = []
 
         self._scale = 1
         self._scaleChanges = []
+        self._scaleAnimations = []
 
         self._alpha = 255
         self._alphaChanges = []
+        self._alphaAnimations = []
+
+        self._static = False
+        self._screenSpace = False
+        self._layout = None
+        self._mask = None
+        self._maskImage = None
+        self._rotationSource = None
+        self._rotationOf = None
 
         if self._parent:
             self._parent.add_object(self)
@@ -69,18 +161,140 @@ class PGObject(pygame.sprite.DirtySprite):
     def update(self, *args, **kwargs) -> None:
         return
 
+    # @function kill
+    # @abstract Remove the object from all its groups and drop its queued animations.
+    # @discussion The @PGAnimation handles given out for them are finished, so that
+    #             coroutines awaiting the object do not wait forever.
+
+    def kill(self) -> None:
+        super().kill()
+        self._stop_animations()
+
+    def _stop_animations(self) -> None:
+        for animations in (self._alphaAnimations, self._scaleAnimations, self._angleAnimations,
+                           self._posAnimations):
+            for a in animations:
+                a.finish()
+            animations.clear()
+        for changes in (self._alphaChanges, self._scaleChanges, self._angleChanges, self._posChanges):
+            changes.clear()
+
+    # @function _changed
+    # @abstract Tell the parent scene that the object's appearance changed.
+
+    def _changed(self) -> None:
+        if self._parent:
+            self._parent.invalidate()
+        for g in self.groups():
+            if isinstance(g, PGGroup):
+                g._sprite_changed(self)
+        tracker = latency_tracker()
+        if tracker:
+            tracker.touched(self)
+
+    # @function _animated
+    # @abstract Tell the object's groups that an animation was queued.
+
+    def _animated(self) -> None:
+        for g in self.groups():
+            if isinstance(g, PGGroup):
+                g._sprite_animated(self)
+        tracker = latency_tracker()
+        if tracker:
+            tracker.touched(self, False)
+
+    # @property static
+    # @abstract Whether the object is flattened into its groups' static background.
+    # @discussion See @PGGroup.set_static.
+
+    @property
+    def static(self) -> bool:
+        return self._static
+
+    @static.setter
+    def static(self, static: bool) -> None:
+        for g in self.groups():
+            if isinstance(g, PGGroup):
+                g.set_static(self, static)
+
+    # @property screen_space
+    # @abstract Whether the object stays fixed to the window when its scene has a camera.
+    # @discussion See @PGScene.enable_camera. Overlays such as HUDs and transition veils
+    #             are screen space; everything else is positioned in world coordinates.
+
+    @property
+    def screen_space(self) -> bool:
+        return self._screenSpace
+
+    @screen_space.setter
+    def screen_space(self, screen_space: bool) -> None:
+        if screen_space == self._screenSpace:
+            return
+        self._screenSpace = screen_space
+        self._changed()
+
     @property
     def img(self) -> pygame.Surface:
         return self.image
 
     @img.setter
     def img(self, img: pygame.Surface) -> None:
-        img = img.convert_alpha()
+        self._imageRef = find_image_ref(img)
+        self._set_img(img)
+
+    # @property image_ref
+    # @abstract Where the image came from (see @PGImages), or None if it is not known.
+    # @discussion Objects are snapshotted with this reference instead of their pixels.
+
+    @property
+    def image_ref(self) -> tuple:
+        return self._imageRef
+
+    # @function _set_img
+    # @abstract Show @img, converted by @optimize_surface and centered on the current rect.
+    # @param analyze False for transient images (rotation and zoom steps), which are not
+    #        worth inspecting.
+
+    def _set_img(self, img: pygame.Surface, analyze: bool = True) -> None:
+        img = optimize_surface(img, analyze)
         if not self._imageSet:
             self._origImage = img
             self._imageSet = True
+        if self._alpha != 255:
+            set_surface_alpha(img, self._alpha)
+        size = self.rect.size
         self.image = img
         self.rect = img.get_rect(center=self.rect.center)
+        self._mask = None  # img may be the previous image object
+        self._changed()
+        if self._layout and self.rect.size != size:
+            self._layout.invalidate()
+
+    # @function _use_shared
+    # @abstract Show @optimized, the shared conversion of the shared image @img.
+    # @discussion The object holds private views of both, so that alpha stays per object.
+    #             Neither may be drawn into; @self.rect is left to the caller.
+
+    def _use_shared(self, img: pygame.Surface, optimized: pygame.Surface) -> None:
+        self.image = optimized.subsurface(optimized.get_rect())
+        self._origImage = img.subsurface(img.get_rect())
+        self._imageSet = True
+
+    # @function surfaces
+    # @abstract The surfaces the object holds, for memory accounting (see @PGMemoryTracker).
+
+    def surfaces(self) -> list[pygame.Surface]:
+        if self._rotationSource is not None and self._rotationSource is not self._origImage:
+            return [self.image, self._origImage, self._rotationSource]
+        return [self.image, self._origImage]
+
+    # @function reformat
+    # @abstract Convert the image again after the display's pixel format changed.
+
+    def reformat(self) -> None:
+        if self._imageSet:
+            self.image = optimize_surface(self.image)
+            self._changed()
 
     @property
     def angle(self) -> float:
@@ -89,7 +303,7 @@ class PGObject(pygame.sprite.DirtySprite):
     @angle.setter
     def angle(self, angle: float):
         self._angle = angle
-        self.img = pygame.transform.rotozoom(self._origImage, -self._angle, 1)
+        self._apply_transform()
 
     def normalize_angle(self):
         self._angle %= 360
@@ -101,8 +315,34 @@ class PGObject(pygame.sprite.DirtySprite):
     @scale.setter
     def scale(self, factor: float) -> None:
         self._scale = factor
-        self.img = pygame.transform.smoothscale(self._origImage, (self._origImage.get_width() * factor,
-                                                                  self._origImage.get_height() * factor))
+        self._apply_transform()
+
+    # @function _apply_transform
+    # @abstract Show @self._origImage rotated and scaled by the current angle and scale.
+
+    def _apply_transform(self) -> None:
+        if self._angle:
+            img = rotozoom_surface(self._transform_source(), -self._angle, self._scale)
+        elif self._scale == 1:
+            img = self._origImage
+        else:
+            # Smooth scaling would blend a colorkey into the edges
+            source = self._transform_source() if self._origImage.get_colorkey() else self._origImage
+            img = scale_surface(source, (self._origImage.get_width() * self._scale,
+                                         self._origImage.get_height() * self._scale))
+        # Animation steps are shown for a frame only, not worth analyzing
+        self._set_img(img, not (self._angleChanges or self._scaleChanges))
+
+    # @function _transform_source
+    # @abstract @self._origImage with an alpha channel, so that the corners rotation adds
+    #           are transparent and colorkeyed edges scale cleanly. Kept until
+    #           @self._origImage is replaced or redrawn.
+
+    def _transform_source(self) -> pygame.Surface:
+        if self._rotationOf is not self._origImage:
+            self._rotationSource = with_alpha(self._origImage)
+            self._rotationOf = self._origImage
+        return self._rotationSource
 
     @property
     def alpha(self) -> int:
@@ -112,22 +352,27 @@ class PGObject(pygame.sprite.DirtySprite):
     def alpha(self, alpha: int) -> None:
         if alpha < 0:
             alpha = 0
-        self.image.set_alpha(alpha)
+        set_surface_alpha(self.image, alpha)
         self._origImage.set_alpha(alpha)
         self._imageSet = True
         self._alpha = alpha
+        self._changed()
 
     # Animations
     # TO-DO: speed customization, unification with delay, inertia
 
-    def fade(self, alpha: int) -> None:
+    def fade(self, alpha: int) -> PGAnimation:
         self._alphaChanges.append(alpha)
+        self._alphaAnimations.append(PGAnimation())
+        self._animated()
+        return self._alphaAnimations[-1]
 
     def _test_fade(self) -> None:
         if not self._alphaChanges:
             return
         if self._alphaChanges[0] == self.alpha:
             self._alphaChanges.pop(0)
+            self._alphaAnimations.pop(0).finish()
             return
 
         if self.alpha > self._alphaChanges[0]:
@@ -135,42 +380,66 @@ class PGObject(pygame.sprite.DirtySprite):
         elif self.alpha < self._alphaChanges[0]:
             self.alpha = self.alpha + 8 if self._alphaChanges[0] > self.alpha + 8 else self._alphaChanges[0]
 
-    def zoom(self, factor: float):
+    def zoom(self, factor: float) -> PGAnimation:
         self._scaleChanges.append(factor)
+        self._scaleAnimations.append(PGAnimation())
+        self._animated()
+        return self._scaleAnimations[-1]
 
     def _test_zoom(self) -> None:
         if not self._scaleChanges:
             return
         if self._scaleChanges[0] == self.scale:
             self._scaleChanges.pop(0)
+            self._scaleAnimations.pop(0).finish()
+            return
+        step = animation_tick()
+        if not step:
             return
 
+        delta = 0.2 * step
         if self.scale > self._scaleChanges[0]:
-            self.scale = self.scale - 0.2 if self._scaleChanges[0] < self.scale - 0.2 else self._scaleChanges[0]
+            self.scale = self.scale - delta if self._scaleChanges[0] < self.scale - delta else self._scaleChanges[0]
         elif self.scale < self._scaleChanges[0]:
-            self.scale = self.scale + 0.2 if self._scaleChanges[0] > self.scale + 0.2 else self._scaleChanges[0]
+            self.scale = self.scale + delta if self._scaleChanges[0] > self.scale + delta else self._scaleChanges[0]
 
-    def rotate(self, angle: float) -> None:
+    def rotate(self, angle: float) -> PGAnimation:
         self._angleChanges.append(angle)
+        self._angleAnimations.append(PGAnimation())
+        self._animated()
+        return self._angleAnimations[-1]
 
     def _test_rotate(self) -> None:
         if not self._angleChanges:
             return
         if self._angleChanges[0] == self.angle:
             self._angleChanges.pop(0)
+            self._angleAnimations.pop(0).finish()
             self.normalize_angle()
             return
+        step = animation_tick()
+        if not step:
+            return
 
+        delta = 3 * step
         if self.angle > self._angleChanges[0]:
-            self.angle = self.angle - 3 if self._angleChanges[0] < self.angle - 3 else self._angleChanges[0]
+            self.angle = self.angle - delta if self._angleChanges[0] < self.angle - delta else self._angleChanges[0]
         if self.angle < self._angleChanges[0]:
-            self.angle = self.angle + 3 if self._angleChanges[0] > self.angle + 3 else self._angleChanges[0]
+            self.angle = self.angle + delta if self._angleChanges[0] > self.angle + delta else self._angleChanges[0]
 
-    def move(self, pos: tuple[int, int], time: float = 1) -> None:
-        dx, dy = tuple(map(lambda x, y: (x - y) / (clock.get_fps() * time), pos, self.rect.topleft))
+    def move(self, pos: tuple[int, int], time: float = 1) -> PGAnimation:
+        fps = clock.get_fps()
+        if not fps:
+            # Nothing measured yet (first frames): assume the game runs at its target rate
+            governor = PGQualityGovernor.active()
+            fps = 1 / governor.budget if governor else 60
+        dx, dy = tuple(map(lambda x, y: (x - y) / (fps * time), pos, self.rect.topleft))
         dx = math.ceil(dx) if dx > 0 else math.floor(dx)
         dy = math.ceil(dy) if dy > 0 else math.floor(dy)
         self._posChanges.append((pos, dx, dy))
+        self._posAnimations.append(PGAnimation())
+        self._animated()
+        return self._posAnimations[-1]
 
 
     def _test_move(self) -> None:
@@ -178,6 +447,7 @@ class PGObject(pygame.sprite.DirtySprite):
             return
         if self._posChanges[0][0] == self.pos:
             self._posChanges.pop(0)
+            self._posAnimations.pop(0).finish()
             return
 
         if self.pos != self._posChanges[0][0]:
@@ -200,10 +470,22 @@ class PGObject(pygame.sprite.DirtySprite):
     @pos.setter
     def pos(self, pos: tuple[int, int]) -> None:
         self.rect.topleft = pos
+        self._changed()
 
     def set_pos_prop(self, x: float, y: float) -> None:
-        self.pos = (int((pygame.display.get_surface().get_width() - self.rect.width) * x),
-                    int((pygame.display.get_surface().get_height() - self.rect.height) * y))
+        width, height = pygame.display.get_surface().get_size()
+        self.pos = (int((width - self.rect.width) * x), int((height - self.rect.height) * y))
+
+    @property
+    def layout(self) -> "PGLayout":
+        return self._layout
+
+    # @property click_pos
+    # @abstract Where the latest click on the object landed, in the coordinates of @self.rect.
+
+    @property
+    def click_pos(self) -> tuple[int, int]:
+        return self._clickPos
 
     def connect_click(self, action: Callable, *args, **kwargs) -> None:
         if callable(action):
@@ -213,6 +495,10 @@ class PGObject(pygame.sprite.DirtySprite):
         if callable(action):
             self._hoverAction = lambda: action(*args, **kwargs)
 
+    def connect_hover_leave(self, action: Callable, *args, **kwargs) -> None:
+        if callable(action):
+            self._hoverLeaveAction = lambda: action(*args, **kwargs)
+
     # @function _on_click
     # @abstract Click action to be override in subclasses.
     # @discussion Should a subclass have a click action that all its subclasses will
@@ -221,7 +507,7 @@ class PGObject(pygame.sprite.DirtySprite):
 
     def on_click(self) -> None:
         if self._clickAction:
-            self._clickAction()
+            self._dispatch(self._clickAction())
 
     # @function _on_hover
     # @abstract Hover action to be override in subclasses.
@@ -231,12 +517,78 @@ class PGObject(pygame.sprite.DirtySprite):
 
     def on_hover(self) -> None:
         if self._hoverAction:
-            self._hoverAction()
+            self._dispatch(self._hoverAction())
+
+    # @function on_hover_enter
+    # @abstract Invoked once when the cursor starts hovering over the object.
+    # @discussion Defaults to @on_hover, so actions set with @connect_hover fire on enter.
+
+    def on_hover_enter(self) -> None:
+        self.on_hover()
+
+    # @function on_hover_leave
+    # @abstract Invoked once when the cursor stops hovering over the object.
+
+    def on_hover_leave(self) -> None:
+        if self._hoverLeaveAction:
+            self._dispatch(self._hoverLeaveAction())
+
+    _tasks = set()
+
+    # @function _dispatch
+    # @abstract Run coroutine actions as tasks so that they never hold up a frame.
+
+    @staticmethod
+    def _dispatch(result) -> None:
+        if not isinstance(result, Coroutine):
+            return
+        import asyncio
+        try:
+            task = asyncio.get_running_loop().create_task(result)
+        except RuntimeError:
+            result.close()
+            raise RuntimeError("Coroutine actions require the game to be run with PGGame.start_async()")
+        PGObject._tasks.add(task)
+        task.add_done_callback(PGObject._tasks.discard)
+
+    # @property mask
+    # @abstract Collision mask of the current image, rebuilt only when the image changes.
+
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        if self._mask is None or self._maskImage is not self.image:
+            self._mask = from_surface(self.image)
+            self._maskImage = self.image
+        return self._mask
+
+    # @function invalidate_mask
+    # @abstract Must be called after drawing into @self.image (or @self._origImage) in place.
+    # @discussion Also has the collision grids of the object's groups test it again.
+
+    def invalidate_mask(self) -> None:
+        self._mask = None
+        self._rotationOf = None
+        for g in self.groups():
+            if isinstance(g, PGGroup) and g.collisions:
+                g.collisions.touch(self)
+
+    # @function on_collision_enter
+    # @abstract Invoked when the object starts touching @other; see @PGGroup.enable_collisions.
+
+    def on_collision_enter(self, other: "PGObject") -> None:
+        return
+
+    # @function on_collision_exit
+    # @abstract Invoked when the object stops touching @other.
+
+    def on_collision_exit(self, other: "PGObject") -> None:
+        return
 
     def collidepoint(self, p: tuple[int, int]) -> bool:
-        mask = from_surface(self.image)
+        if not self.rect.collidepoint(p):
+            return False
         try:
-            mask.get_at((p[0] - self.pos[0], p[1] - self.pos[1]))
+            self.mask.get_at((p[0] - self.pos[0], p[1] - self.pos[1]))
             return True
         except IndexError:
             return False
@@ -244,35 +596,599 @@ class PGObject(pygame.sprite.DirtySprite):
     def process_events(self, event: pygame.event.Event) -> None:
         return
 
+    # @function event_pos
+    # @abstract Where a pointer event happened, in the coordinates of @self.rect.
+    # @discussion Accounts for the camera of the object's group. Mouse wheel events are
+    #             given the pointer position by @PGGame; delivered any other way, they fall
+    #             back to the current pointer position.
+
+    def event_pos(self, event: pygame.event.Event) -> tuple[int, int]:
+        pos = getattr(event, "pos", None) or pygame.mouse.get_pos()
+        for g in self.groups():
+            if isinstance(g, PGGroup):
+                return g._local_pos(self, pos)
+        return pos
+
+    # Snapshots
+
+    # @function get_state
+    # @abstract A compact, JSON-serializable description of the object.
+    # @discussion Records what @_content_state says the object shows, plus its placement,
+    #             transforms and pending animations; values at their defaults are left out.
+    #             Actions connected with @connect_click and the like are code and are not
+    #             recorded (see @PGScene.restored). Pending animations are restored, but
+    #             not the @PGAnimation handles already given out for them.
+
+    def get_state(self) -> dict:
+        state = {"class": class_path(type(self)), "content": self._content_state(),
+                 "center": list(self.rect.center)}
+        if self.name is not None:
+            state["name"] = self.name
+        if self.layer:
+            state["layer"] = self.layer
+        if not self.visible:
+            state["visible"] = False
+        if self._static:
+            state["static"] = True
+        if self._screenSpace:
+            state["screen_space"] = True
+        if self._angle:
+            state["angle"] = self._angle
+        if self._scale != 1:
+            state["scale"] = self._scale
+        if self._alpha != 255:
+            state["alpha"] = self._alpha
+        animations = {"fade": list(self._alphaChanges), "zoom": list(self._scaleChanges),
+                      "rotate": list(self._angleChanges),
+                      "move": [[list(pos), dx, dy] for pos, dx, dy in self._posChanges]}
+        animations = {k: v for k, v in animations.items() if v}
+        if animations:
+            state["animations"] = animations
+        return state
+
+    # @function set_state
+    # @abstract Apply a state recorded by @get_state (apart from its content).
+    # @discussion Animations already pending are finished and replaced by the recorded ones.
+
+    def set_state(self, state: dict) -> None:
+        self.name = state.get("name")
+        layer = state.get("layer", 0)
+        if layer != self.layer:
+            groups = self.groups()
+            for g in groups:
+                g.change_layer(self, layer)
+            if not groups:
+                self._layer = layer
+        if state.get("visible", True) != self.visible:
+            self.visible = state.get("visible", True)
+        self.screen_space = state.get("screen_space", False)
+        if state.get("angle", 0) != self._angle:
+            self.angle = state.get("angle", 0)
+        if state.get("scale", 1) != self._scale:
+            self.scale = state.get("scale", 1)
+        if state.get("alpha", 255) != self._alpha:
+            self.alpha = state.get("alpha", 255)
+        center = tuple(state["center"])
+        if center != self.rect.center:
+            self.rect.center = center
+            self._changed()
+        if state.get("static", False) != self._static:
+            self.static = state.get("static", False)
+
+        self._stop_animations()
+        animations = state.get("animations", {})
+        self._alphaChanges = list(animations.get("fade", []))
+        self._scaleChanges = list(animations.get("zoom", []))
+        self._angleChanges = list(animations.get("rotate", []))
+        self._posChanges = [(tuple(pos), dx, dy) for pos, dx, dy in animations.get("move", [])]
+        self._alphaAnimations = [PGAnimation() for _ in self._alphaChanges]
+        self._scaleAnimations = [PGAnimation() for _ in self._scaleChanges]
+        self._angleAnimations = [PGAnimation() for _ in self._angleChanges]
+        self._posAnimations = [PGAnimation() for _ in self._posChanges]
+        if animations:
+            self._animated()
+
+    # @function from_state
+    # @abstract Build an object from a state recorded by @get_state and add it to @parent.
+
+    @staticmethod
+    def from_state(parent: Type[PGScene], state: dict) -> "PGObject":
+        obj = find_class(state["class"])._from_content(None, state["content"])
+        obj._layer = state.get("layer", 0)
+        obj._parent = parent
+        if parent:
+            parent.add_object(obj)
+        obj.set_state(state)
+        return obj
+
+    # @function _content_state
+    # @abstract What the object shows, as recorded by @get_state.
+    # @discussion By default the image reference. Subclasses that draw their own image
+    #             override this together with @_from_content.
+
+    def _content_state(self) -> dict:
+        if self._imageRef is None:
+            raise ValueError("%s has no image reference and cannot be snapshotted!" % type(self).__name__)
+        return {"image": list(self._imageRef)}
+
+    # @function _from_content
+    # @abstract Build an object showing @content, as recorded by @_content_state.
+    # @discussion Only @PGObject's constructor runs, so subclasses that keep state of their
+    #             own should override this.
+
+    @classmethod
+    def _from_content(cls, parent: Type[PGScene], content: dict) -> "PGObject":
+        obj = cls.__new__(cls)
+        PGObject.__init__(obj, parent, image_ref=content["image"])
+        return obj
+
+
+# @class PGGroup
+# @abstract Layered group that dispatches input to its objects.
+# @discussion Clicks are hit-tested against the top layer as they arrive. Mouse motion is
+#             forwarded to the top layer's objects like any other event, but only the
+#             latest position is hit-tested, once per frame in @update, and the hovered
+#             object is tracked so that @PGObject.on_hover_enter and
+#             @PGObject.on_hover_leave fire only when it changes. An object removed
+#             while hovered simply stops being hovered, without a leave callback.
+#
+#             Objects (or whole layers) marked static are not drawn individually: they
+#             are composited once, in layer order, onto the background passed to @clear,
+#             and dynamic objects are cleared and redrawn over that composite. It is
+#             rebuilt only when a static object changes or static membership changes.
+#             Static objects therefore always appear beneath dynamic ones.
+#
+#             With a camera (see @set_camera), objects are indexed by world rect in a
+#             @PGSpatialGrid that is updated as they change, and only the objects inside
+#             the viewport (plus screen-space ones) are drawn and hit-tested. Their rects
+#             are shifted to screen coordinates for the duration of @draw only.
 
 class PGGroup(pygame.sprite.LayeredDirty):
     def __init__(self, *sprites: Union[PGObject, Sequence[PGObject]]) -> None:
+        self._static = set()
+        self._staticLayers = set()
+        self._staticValid = False
+        self._baseBgd = None
+        self._composite = None
+        self._dynamicSprites = None
+        self._camera = None
+        self._cullIndex = None
+        self._cullUpdates = False
+        self._cameraVersion = None
+        self._screenPos = None
+        self._scrolled = False
+        self._screenSprites = set()
+        self._moved = set()
+        self._animating = set()
+        self._order = None
+        self._visible = []
+        self._visibleSet = set()
         super().__init__(*sprites)
+        self._mousePos = None
+        self._mouseStamp = None
+        self._hovered = None
+        self._collisions = None
+
+    @property
+    def hovered(self) -> PGObject:
+        return self._hovered
+
+    def add_internal(self, sprite: PGObject, layer: int = None) -> None:
+        super().add_internal(sprite, layer)
+        self._dynamicSprites = None
+        self._order = None
+        if self.get_layer_of_sprite(sprite) in self._staticLayers:
+            self.set_static(sprite)
+        if self._camera:
+            self._moved.add(sprite)
+
+    def remove_internal(self, sprite: PGObject) -> None:
+        super().remove_internal(sprite)
+        self._dynamicSprites = None
+        self._order = None
+        if sprite is self._hovered:
+            self._hovered = None
+        if self._camera:
+            self._cullIndex.remove(sprite)
+            self._screenSprites.discard(sprite)
+            self._moved.discard(sprite)
+            self._animating.discard(sprite)
+        if sprite in self._static:
+            self.set_static(sprite, False)
+        if self._collisions:
+            self._collisions.remove(sprite)
+
+    # @function enable_collisions
+    # @abstract Start tracking collisions between the group's colliders every update.
+    # @discussion See @PGCollisionGrid. Objects take part once passed to @add_collider.
+
+    def enable_collisions(self, cell_size: int = 64, use_masks: bool = True) -> None:
+        from PGLib.PGCollision import PGCollisionGrid
+        colliders = self._collisions.colliders if self._collisions else []
+        self._collisions = PGCollisionGrid(cell_size, use_masks)
+        for s in colliders:
+            self._collisions.add(s)
+
+    @property
+    def collisions(self):
+        return self._collisions
+
+    def add_collider(self, sprite: PGObject) -> None:
+        assert self._collisions, "Collisions are not enabled!"
+        assert self.has(sprite), "Collider must be in the group!"
+        self._collisions.add(sprite)
+
+    def remove_collider(self, sprite: PGObject) -> None:
+        if self._collisions:
+            self._collisions.remove(sprite)
+
+    def change_layer(self, sprite: PGObject, new_layer: int) -> None:
+        from_static_layer = self.get_layer_of_sprite(sprite) in self._staticLayers
+        super().change_layer(sprite, new_layer)
+        self._dynamicSprites = None
+        self._order = None
+        self.set_static(sprite, new_layer in self._staticLayers or (sprite in self._static and not from_static_layer))
+
+    # @function set_static
+    # @abstract Flatten @sprite into the cached background, or make it dynamic again.
+
+    def set_static(self, sprite: PGObject, static: bool = True) -> None:
+        if static == (sprite in self._static):
+            return
+        if static:
+            self._static.add(sprite)
+        else:
+            self._static.discard(sprite)
+        if isinstance(sprite, PGObject):
+            sprite._static = any(isinstance(g, PGGroup) and sprite in g._static for g in sprite.groups())
+        self._dynamicSprites = None
+        self.invalidate_static()
+
+    # @function set_layer_static
+    # @abstract Flatten every current and future object of @layer into the cached background.
+
+    def set_layer_static(self, layer: int, static: bool = True) -> None:
+        if static:
+            self._staticLayers.add(layer)
+        else:
+            self._staticLayers.discard(layer)
+        for s in self.get_sprites_from_layer(layer):
+            self.set_static(s, static)
+
+    @property
+    def static_layers(self) -> list[int]:
+        return sorted(self._staticLayers)
+
+    def invalidate_static(self) -> None:
+        self._staticValid = False
+
+    # @property static_composite
+    # @abstract The background with the static objects drawn in, or None without static objects.
+
+    @property
+    def static_composite(self) -> pygame.Surface:
+        return self._composite
+
+    def _sprite_changed(self, sprite: PGObject) -> None:
+        if sprite in self._static:
+            self._staticValid = False
+        if self._camera:
+            self._moved.add(sprite)
+
+    def _sprite_animated(self, sprite: PGObject) -> None:
+        self._animating.add(sprite)
+
+    @property
+    def camera(self) -> "PGCamera":
+        return self._camera
+
+    # @property cull_cell_size
+    # @abstract Cell size of the spatial index used with a camera, or None without one.
+
+    @property
+    def cull_cell_size(self) -> int:
+        return self._cullIndex.cell_size if self._cullIndex is not None else None
+
+    @property
+    def cull_updates(self) -> bool:
+        return self._cullUpdates
+
+    # @function set_camera
+    # @abstract View the group through @camera, or through the window again if it is None.
+    # @param cell_size Cell size of the spatial index, ideally a few times the typical object.
+    # @param cull_updates Whether objects outside the viewport skip @PGObject.update. Queued
+    #        animations (fade, zoom, rotate, move) still run wherever the object is.
+
+    def set_camera(self, camera: "PGCamera", cell_size: int = 256, cull_updates: bool = False) -> None:
+        from PGLib.PGCamera import PGSpatialGrid
+        self._camera = camera
+        self._cullUpdates = bool(camera) and cull_updates
+        self._cameraVersion = None
+        self._screenPos = None
+        self._screenSprites = set()
+        self._visible = []
+        self._visibleSet = set()
+        if camera:
+            self._cullIndex = PGSpatialGrid(cell_size)
+            self._moved = set(self._spritelist)
+        else:
+            self._cullIndex = None
+            self._moved = set()
+            self._use_update = False  # Redraw everything once
+        self._staticValid = False
+
+    def _sprite_order(self) -> dict:
+        if self._order is None:
+            self._order = {s: i for i, s in enumerate(self._spritelist)}
+        return self._order
+
+    # @function _cull
+    # @abstract Bring the spatial index and the list of objects in view up to date.
+
+    def _cull(self) -> None:
+        camera = self._camera
+        moved = camera.version != self._cameraVersion
+        if not (moved or self._moved or self._order is None):
+            return
+        for s in self._moved:
+            if isinstance(s, PGObject) and s.screen_space:
+                self._cullIndex.remove(s)
+                self._screenSprites.add(s)
+            else:
+                self._cullIndex.insert(s, s.rect)
+                self._screenSprites.discard(s)
+        self._moved = set()
+
+        view = camera.rect
+        visible = [s for s in self._cullIndex.query(view) if s.rect.colliderect(view)]
+        visible.extend(self._screenSprites)
+        visible.sort(key=self._sprite_order().__getitem__)
+        visible_set = set(visible)
+
+        spritedict = self.spritedict
+        for s in self._visibleSet - visible_set:
+            rect = spritedict.get(s)
+            if rect is not None and rect is not self._init_rect:
+                self.lostsprites.append(rect)
+                spritedict[s] = self._init_rect
+        if moved:
+            # Unless @scroll already moved the screen along, everything shifted
+            self._cameraVersion = camera.version
+            if camera.pos != self._screenPos:
+                self._screenPos = camera.pos
+                self._staticValid = False
+                self.repaint_rect(pygame.Rect((0, 0), camera.size))
+        self._visible = visible
+        self._visibleSet = visible_set
+
+    # @function visible_sprites
+    # @abstract Objects in view, in drawing order (all of them when there is no camera).
+
+    def visible_sprites(self) -> list[PGObject]:
+        if not self._camera:
+            return self.sprites()
+        self._cull()
+        return list(self._visible)
+
+    # @function screen_rect
+    # @abstract Where @sprite appears in the window.
+
+    def screen_rect(self, sprite: PGObject) -> pygame.Rect:
+        if not self._camera or sprite.screen_space:
+            return sprite.rect.copy()
+        return sprite.rect.move(-self._camera.pos[0], -self._camera.pos[1])
+
+    def _local_pos(self, sprite: PGObject, pos: tuple[int, int]) -> tuple[int, int]:
+        if not self._camera or sprite.screen_space:
+            return pos
+        return self._camera.screen_to_world(pos)
+
+    # @function scroll
+    # @abstract Move what @surface shows by (-@dx, -@dy), following a camera move over a
+    #           background that scrolled by as much.
+    # @discussion The pixels of world-space objects and of the static composite move along
+    #             and stay valid, so only the exposed strips (see @repaint_background) and
+    #             the areas screen-space objects were dragged to need painting again.
+
+    def scroll(self, surface: pygame.Surface, dx: int, dy: int) -> None:
+        def fixed(s):
+            return not self._camera or (isinstance(s, PGObject) and s.screen_space)
+
+        surface.scroll(-dx, -dy)
+        if self._composite is not None and self._staticValid:
+            if any(fixed(s) for s in self._static):
+                self._staticValid = False
+            else:
+                self._composite.scroll(-dx, -dy)
+        lost = [r.move(-dx, -dy) for r in self.lostsprites]
+        spritedict = self.spritedict
+        for s, r in spritedict.items():
+            if r is self._init_rect:
+                continue
+            if fixed(s):
+                lost.append(r.move(-dx, -dy))
+            else:
+                spritedict[s] = r.move(-dx, -dy)
+        self.lostsprites = lost
+        if self._camera and self._screenPos is not None:
+            self._screenPos = (self._screenPos[0] + dx, self._screenPos[1] + dy)
+        self._scrolled = True
+
+    # @function repaint_background
+    # @abstract Redraw @rect (screen coordinates) of the background, and of the static
+    #           composite built on it, on the next @draw.
+
+    def repaint_background(self, rect: pygame.Rect) -> None:
+        composite = self._composite
+        if composite is not None and self._staticValid:
+            if self._baseBgd:
+                composite.blit(self._baseBgd, rect, rect)
+            else:
+                composite.fill((0, 0, 0), rect)
+            composite.set_clip(rect)
+            for s in self._static_in(rect):
+                composite.blit(s.image, self.screen_rect(s), s.source_rect, s.blendmode)
+            composite.set_clip(None)
+        self.repaint_rect(rect)
+
+    def _static_in(self, rect: pygame.Rect) -> list[PGObject]:
+        if self._camera:
+            area = rect.move(self._camera.pos)
+            sprites = [s for s in self._cullIndex.query(area) if s in self._static and s.rect.colliderect(area)]
+            sprites.sort(key=self._sprite_order().__getitem__)
+        else:
+            sprites = [s for s in self._spritelist if s in self._static and s.rect.colliderect(rect)]
+        return [s for s in sprites if s.visible]
+
+    def clear(self, surface: pygame.Surface, bgd: pygame.Surface) -> None:
+        self._baseBgd = bgd
+        self._staticValid = False
+        super().clear(surface, bgd)
+
+    def _build_static(self, surface: pygame.Surface) -> None:
+        if self._baseBgd:
+            composite = self._baseBgd.copy()
+        else:
+            composite = pygame.Surface(surface.get_size()).convert()
+            composite.fill((0, 0, 0))
+        for s in self._spritelist:
+            if s in self._static and s.visible:
+                composite.blit(s.image, s.rect, s.source_rect, s.blendmode)
+        self._bgd = self._composite = composite
+        self._staticValid = True
+        self.repaint_rect(surface.get_rect())
+
+    def draw(self, surface: pygame.Surface, bgsurf: pygame.Surface = None,
+             special_flags: int = None) -> list[pygame.Rect]:
+        rects = self._draw_camera(surface, bgsurf, special_flags) if self._camera \
+            else self._draw_layers(surface, bgsurf, special_flags)
+        if self._scrolled:
+            self._scrolled = False
+            return [surface.get_rect()]  # Every pixel moved
+        return rects
+
+    def _draw_camera(self, surface: pygame.Surface, bgsurf: pygame.Surface = None,
+                     special_flags: int = None) -> list[pygame.Rect]:
+        self._cull()
+        dx, dy = self._camera.pos
+        shifted = [s for s in self._visible if s not in self._screenSprites]
+        for s in shifted:
+            s.rect.move_ip(-dx, -dy)
+        sprites = self._spritelist
+        self._spritelist = self._visible
+        try:
+            return self._draw_layers(surface, bgsurf, special_flags)
+        finally:
+            self._spritelist = sprites
+            for s in shifted:
+                s.rect.move_ip(dx, dy)
+
+    def _draw_layers(self, surface: pygame.Surface, bgsurf: pygame.Surface = None,
+                     special_flags: int = None) -> list[pygame.Rect]:
+        if not self._static:
+            if self._composite:
+                self._bgd = self._baseBgd
+                self._composite = None
+                self.repaint_rect(surface.get_rect())
+            return super().draw(surface, bgsurf, special_flags)
+
+        if bgsurf is not None:
+            self.clear(surface, bgsurf)
+        if not self._staticValid:
+            self._build_static(surface)
+        dynamic = self._dynamicSprites
+        if dynamic is None:
+            dynamic = [s for s in self._spritelist if s not in self._static]
+            if not self._camera:
+                self._dynamicSprites = dynamic
+
+        sprites = self._spritelist
+        self._spritelist = dynamic
+        try:
+            return super().draw(surface, None, special_flags)
+        finally:
+            self._spritelist = sprites
+
+    def _top_sprites(self) -> list[PGObject]:
+        if not self._camera:
+            return self.get_sprites_from_layer(self.get_top_layer())
+        self._cull()
+        top = self.get_top_layer()
+        return [s for s in self._visible if self.get_layer_of_sprite(s) == top]
+
+    def _hit_test(self, pos: tuple[int, int]) -> PGObject:
+        for s in reversed(self._top_sprites()):
+            if isinstance(s, PGObject) and s.collidepoint(self._local_pos(s, pos)):
+                return s
+        return None
 
     def process_events(self, event: pygame.event.Event) -> None:
+        tracker = latency_tracker()
+        if event.type == pygame.MOUSEMOTION:
+            self._mousePos = event.pos
+            if tracker and self._mouseStamp is None:
+                self._mouseStamp = tracker.stamp  # The oldest motion not yet hit-tested
+
         if not self.sprites():
             return
 
+        # Culling only narrows down what can be clicked; every event still reaches all the
+        # objects of the top layer
+        hit = self._hit_test(event.pos) if event.type == pygame.MOUSEBUTTONDOWN else None
         for s in reversed(self.get_sprites_from_layer(self.get_top_layer())):
             if not isinstance(s, PGObject):
                 continue
 
-            if event.type == pygame.MOUSEBUTTONDOWN | pygame.MOUSEMOTION:
-                # Collision is still not accurate
-                if s.collidepoint(pygame.mouse.get_pos()):
-                    if event.type == pygame.MOUSEBUTTONDOWN:
-                        s.on_click()
-                        return
-                    elif event.type == pygame.MOUSEMOTION:
-                        s.on_hover()
-                        return
+            if s is hit:
+                if tracker:
+                    tracker.target(s)
+                s._clickPos = self._local_pos(s, event.pos)
+                s.on_click()
+                return
 
+            if tracker:
+                tracker.target(s)
             s.process_events(event)
 
+    def _update_hover(self) -> None:
+        hovered = self._hovered
+        if self._mousePos is not None:
+            hovered = self._hit_test(self._mousePos) if self.sprites() else None
+            self._mousePos = None
+
+        tracker = latency_tracker()
+        stamp = self._mouseStamp
+        self._mouseStamp = None
+        if hovered is not self._hovered:
+            if tracker and stamp is not None:
+                tracker.begin("MouseMotion", stamp, self._hovered)
+            if self._hovered:
+                self._hovered.on_hover_leave()
+            self._hovered = hovered
+            if hovered:
+                if tracker and stamp is not None:
+                    tracker.target(hovered)
+                hovered.on_hover_enter()
+            if tracker and stamp is not None:
+                tracker.end()
+
     def update(self, *args, **kwargs) -> None:
-        super().update(*args, **kwargs)
-        for s in self.sprites():
+        if self._cullUpdates:
+            self._cull()
+            sprites = self._visible + [s for s in self._animating if s not in self._visibleSet]
+            for s in sprites:
+                s.update(*args, **kwargs)
+        else:
+            super().update(*args, **kwargs)
+            sprites = self.sprites()
+        self._update_hover()
+        for s in sprites:
             s._test_fade()
             s._test_rotate()
             s._test_zoom()
             s._test_move()
+        if self._animating:
+            self._animating = {s for s in self._animating
+                               if s._alphaChanges or s._angleChanges or s._scaleChanges or s._posChanges}
+        if self._collisions:
+            self._collisions.update()
@@ -25,7 +25,81 @@
 from PGLib.PGGame import *
 
 
+# @class PGPopUpScene
+# @abstract A dialog shown on top of the current scene.
+# @discussion Popups live on the game's overlay stack instead of its scene list. When
+#             shown, the scene underneath is rendered once into a snapshot, optionally
+#             dimmed and blurred, which then serves as the popup's background: only the
+#             popup's own objects are updated and drawn every frame. The snapshot is
+#             rebuilt only when the version of the underlying scene changes.
+
 class PGPopUpScene(PGScene):
-    def __init__(self, game: PGGame, windows_size: tuple[int, int], window_bg: pygame.Surface = None):
+    def __init__(self, game: PGGame, windows_size: tuple[int, int], window_bg: pygame.Surface = None,
+                 dim: int = 100, blur: int = 0):
         super().__init__(game, None)
-        # Do it with layers
\ No newline at end of file
+        self._game.remove_scene(self)
+        self._dim = dim
+        self._blur = blur
+        self._underlying = None
+        self._underlyingVersion = None
+
+        if window_bg:
+            window_bg = pygame.transform.smoothscale(window_bg, windows_size)
+        else:
+            window_bg = pygame.Surface(windows_size)
+            window_bg.fill((255, 255, 255))
+        self._window = PGObject(self, 0, 0, window_bg)
+        self._window.set_pos_prop(0.5, 0.5)
+
+    @property
+    def window(self) -> PGObject:
+        return self._window
+
+    @property
+    def underlying(self) -> PGScene:
+        return self._underlying
+
+    # @function activate
+    # @abstract Show the popup over whatever is currently displayed.
+    # @discussion Transitions are not supported for popups and are ignored.
+
+    def activate(self, trans_in: str = "none", trans_out: str = "none") -> PGAnimation:
+        self._game.push_overlay(self)
+        return PGAnimation.finished()
+
+    # @function finish
+    # @abstract Close the popup and reveal the scene beneath it.
+
+    def finish(self, trans_in: str = "none", trans_out: str = "none") -> None:
+        self._game.pop_overlay(self)
+
+    # @function attach
+    # @abstract Place the popup over @scene and take a fresh snapshot of it.
+
+    def attach(self, scene: PGScene) -> None:
+        self._underlying = scene
+        self._underlyingVersion = None
+        self.refresh()
+
+    # @function refresh
+    # @abstract Rebuild the snapshot if the underlying scene has changed since it was taken.
+
+    def refresh(self) -> None:
+        if not self._underlying or self._underlying.version == self._underlyingVersion:
+            return
+        self._underlyingVersion = self._underlying.version
+        snapshot = self._underlying.render(pygame.Surface(self._screen.get_size()).convert())
+        self.background = self._apply_effects(snapshot)
+        self.update_background()
+        self.repaint()
+
+    def _apply_effects(self, snapshot: pygame.Surface) -> pygame.Surface:
+        if self._blur > 1:
+            w, h = snapshot.get_size()
+            blur = self._blur / quality().effect_scale
+            small = scale_surface(snapshot, (max(1, int(w // blur)), max(1, int(h // blur))))
+            snapshot = scale_surface(small, (w, h))
+        if self._dim > 0:
+            shade = 255 - self._dim
+            snapshot.fill((shade, shade, shade), special_flags=pygame.BLEND_MULT)
+        return snapshot
@@ -0,0 +1,201 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 cjiang. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import time
+from collections import deque, namedtuple
+from typing import Callable
+from PGLib.PGGlobal import *
+
+# @class PGQualityLevel
+# @abstract One step of the quality ladder.
+# @field smooth Whether images are scaled and rotated with filtering (smoothscale, rotozoom).
+# @field animation_step Zoom and rotation animations advance this many steps at once, on
+#        every animation_step-th frame, so they keep their pace with fewer transforms.
+# @field effect_scale Resolution, relative to the window, of full-screen effects: zoom
+#        transitions and popup blur.
+PGQualityLevel = namedtuple("PGQualityLevel", "name smooth animation_step effect_scale")
+
+# @class PGQualityDecision
+# @abstract A level change made by a @PGQualityGovernor, kept for logging.
+PGQualityDecision = namedtuple("PGQualityDecision", "frame time old new average budget")
+
+QUALITY_LEVELS = (
+    PGQualityLevel("full", True, 1, 1),
+    PGQualityLevel("fast_transforms", False, 1, 1),
+    PGQualityLevel("coarse_animation", False, 2, 1),
+    PGQualityLevel("reduced_effects", False, 2, 0.5),
+    PGQualityLevel("minimal", False, 4, 0.25),
+)
+
+
+# @class PGQualityGovernor
+# @abstract Trades rendering quality for frame time when frames overrun their budget.
+# @discussion Frame times (the work done per frame, excluding the wait for the next one)
+#             are averaged over the last @window frames. When the average exceeds the
+#             budget by the @overload factor, quality drops one level; once it falls below
+#             @headroom of the budget and has stayed at the current level for twice the
+#             window, quality rises one level. The window restarts after every change, so
+#             each level is judged on its own frames. Changes are kept in @decisions and
+#             reported to actions connected with @connect_change. Install one with
+#             @install (or @PGGame.enable_quality_governor) to have PGLib follow it.
+
+class PGQualityGovernor:
+    _active = None
+
+    def __init__(self, fps: int = 60, window: int = 30, overload: float = 1.0, headroom: float = 0.6,
+                 levels: tuple[PGQualityLevel, ...] = QUALITY_LEVELS, history: int = 100) -> None:
+        assert window > 0, "Window must hold at least one frame!"
+        assert 0 < headroom < overload, "Headroom must be below the overload threshold!"
+        self._budget = 1 / fps
+        self._window = deque(maxlen=window)
+        self._total = 0.0
+        self._overload = overload
+        self._headroom = headroom
+        self._levels = levels
+        self._level = 0
+        self._pinned = None
+        self._frame = 0
+        self._sinceChange = 0
+        self._decisions = deque(maxlen=history)
+        self._changeActions = []
+
+    @staticmethod
+    def active() -> "PGQualityGovernor":
+        return PGQualityGovernor._active
+
+    def install(self) -> None:
+        PGQualityGovernor._active = self
+
+    @staticmethod
+    def uninstall() -> None:
+        PGQualityGovernor._active = None
+
+    @property
+    def budget(self) -> float:
+        return self._budget
+
+    @property
+    def levels(self) -> tuple[PGQualityLevel, ...]:
+        return self._levels
+
+    @property
+    def level(self) -> int:
+        return self._level
+
+    # @property setting
+    # @abstract The @PGQualityLevel currently in effect.
+
+    @property
+    def setting(self) -> PGQualityLevel:
+        return self._levels[self._level]
+
+    @property
+    def frame(self) -> int:
+        return self._frame
+
+    @property
+    def average(self) -> float:
+        return self._total / len(self._window) if self._window else 0.0
+
+    @property
+    def decisions(self) -> list[PGQualityDecision]:
+        return list(self._decisions)
+
+    def connect_change(self, action: Callable, *args, **kwargs) -> None:
+        self._changeActions.append((action, args, kwargs))
+
+    # @function pin
+    # @abstract Hold quality at @level regardless of frame times, or let it adapt again if None.
+
+    def pin(self, level: int = None) -> None:
+        self._pinned = level
+        if level is not None:
+            self._change(level)
+
+    # @function record
+    # @abstract Account for a finished frame that took @seconds of work.
+
+    def record(self, seconds: float) -> None:
+        self._frame += 1
+        self._sinceChange += 1
+        if len(self._window) == self._window.maxlen:
+            self._total -= self._window[0]
+        self._window.append(seconds)
+        self._total += seconds
+        if self._pinned is not None or len(self._window) < self._window.maxlen:
+            return
+
+        average = self.average
+        if average > self._budget * self._overload and self._level < len(self._levels) - 1:
+            self._change(self._level + 1)
+        elif average < self._budget * self._headroom and self._level > 0 \
+                and self._sinceChange >= 2 * self._window.maxlen:
+            self._change(self._level - 1)
+
+    def _change(self, level: int) -> None:
+        level = max(0, min(level, len(self._levels) - 1))
+        if level == self._level:
+            return
+        decision = PGQualityDecision(self._frame, time.time(), self._level, level, self.average, self._budget)
+        self._decisions.append(decision)
+        self._level = level
+        self._sinceChange = 0
+        self._window.clear()
+        self._total = 0.0
+        for action, args, kwargs in self._changeActions:
+            action(decision, *args, **kwargs)
+
+
+# @function quality
+# @abstract The quality level PGLib renders at: that of the installed governor, or full.
+
+def quality() -> PGQualityLevel:
+    governor = PGQualityGovernor._active
+    return governor.setting if governor else QUALITY_LEVELS[0]
+
+
+# @function animation_tick
+# @abstract How many steps zoom and rotation animations advance this frame (0 to skip it).
+
+def animation_tick() -> int:
+    governor = PGQualityGovernor._active
+    if not governor:
+        return 1
+    step = governor.setting.animation_step
+    return step if governor.frame % step == 0 else 0
+
+
+def scale_surface(surface: pygame.Surface, size: tuple[int, int]) -> pygame.Surface:
+    if quality().smooth:
+        return pygame.transform.smoothscale(surface, size)
+    return pygame.transform.scale(surface, size)
+
+
+def rotozoom_surface(surface: pygame.Surface, angle: float, scale: float) -> pygame.Surface:
+    if quality().smooth:
+        return pygame.transform.rotozoom(surface, angle, scale)
+    if scale != 1:
+        surface = pygame.transform.scale(surface, (round(surface.get_width() * scale),
+                                                   round(surface.get_height() * scale)))
+    return pygame.transform.rotate(surface, angle)
@@ -0,0 +1,284 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 cjiang. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import os
+import weakref
+from PGLib.PGObject import *
+
+
+# @class PGSpriteSheet
+# @abstract Animation frames sliced from a single sheet image.
+# @discussion The sheet is converted to the display format once and every frame is a
+#             subsurface of it, so slicing copies no pixels. Sheets loaded through @load
+#             are shared by every caller asking for the same file and layout for as long
+#             as any of them is alive. Frames are read left to right, top to bottom.
+# @param frame_size Size of one frame in pixels.
+# @param count Number of frames, or None for every whole frame on the sheet.
+# @param spacing Pixels between neighbouring frames.
+# @param margin Pixels around the frames along the sheet's edges.
+
+class PGSpriteSheet:
+    _sheets = weakref.WeakValueDictionary()
+
+    def __init__(self, sheet: pygame.Surface, frame_size: tuple[int, int], count: int = None,
+                 spacing: int = 0, margin: int = 0) -> None:
+        self._source = sheet
+        self._key = None
+        self._sheet = optimize_surface(sheet, rle=False)
+        self._format = display_format()
+        width, height = frame_size
+        columns = (sheet.get_width() - 2 * margin + spacing) // (width + spacing)
+        rows = (sheet.get_height() - 2 * margin + spacing) // (height + spacing)
+        if count is None:
+            count = columns * rows
+        assert 0 < count <= columns * rows, "Sheet does not hold that many frames!"
+        self._rects = tuple(pygame.Rect(margin + i % columns * (width + spacing),
+                                        margin + i // columns * (height + spacing), width, height)
+                            for i in range(count))
+        self._frames = tuple(self._sheet.subsurface(r) for r in self._rects)
+        self._masks = [None] * count
+
+    # @function load
+    # @abstract The shared sheet for the image at @path, loading and slicing it if needed.
+
+    @classmethod
+    def load(cls, path: str, frame_size: tuple[int, int], count: int = None, spacing: int = 0,
+             margin: int = 0) -> "PGSpriteSheet":
+        key = (os.path.abspath(path), tuple(frame_size), count, spacing, margin)
+        sheet = cls._sheets.get(key)
+        if sheet is None:
+            sheet = cls(pygame.image.load(path), frame_size, count, spacing, margin)
+            sheet._key = key
+            cls._sheets[key] = sheet
+        return sheet
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __getitem__(self, index: int) -> pygame.Surface:
+        return self._frames[index]
+
+    @property
+    def frames(self) -> tuple[pygame.Surface, ...]:
+        return self._frames
+
+    @property
+    def frame_size(self) -> tuple[int, int]:
+        return self._rects[0].size
+
+    # @function views
+    # @abstract A private set of frames sharing the sheet's pixels.
+    # @discussion Surface-wide state such as alpha can then be changed without affecting
+    #             other users of the sheet.
+
+    def views(self) -> tuple[pygame.Surface, ...]:
+        return tuple(self._sheet.subsurface(r) for r in self._rects)
+
+    # @function reformat
+    # @abstract Convert the sheet again if the display's pixel format changed.
+    # @return Whether the frames were replaced.
+
+    def reformat(self) -> bool:
+        if display_format() == self._format:
+            return False
+        self._sheet = optimize_surface(self._source, rle=False)
+        self._format = display_format()
+        self._frames = tuple(self._sheet.subsurface(r) for r in self._rects)
+        return True
+
+    def mask(self, index: int) -> pygame.mask.Mask:
+        if self._masks[index] is None:
+            self._masks[index] = from_surface(self._frames[index])
+        return self._masks[index]
+
+
+# @class PGAnimatedObject
+# @abstract Object whose image cycles through the frames of a @PGSpriteSheet.
+# @discussion The current frame is derived from the time elapsed since @play, so the
+#             animation keeps its pace whatever the frame rate. Stepping a frame only
+#             swaps @self.image for another prepared frame: nothing is converted,
+#             allocated or recentered. Rotation and zoom are not applied to frames.
+
+class PGAnimatedObject(PGObject):
+    def __init__(self, parent: Type[PGScene], x: int, y: int, sheet: PGSpriteSheet, fps: float = 12,
+                 loop: bool = True, playing: bool = True) -> None:
+        assert fps > 0, "Frame rate must be positive!"
+        self._sheet = sheet
+        self._frames = sheet.frames
+        self._fps = fps
+        self._loop = loop
+        self._index = 0
+        self._start = None
+        self._elapsed = 0
+        self._playback = PGAnimation.finished()
+        super().__init__(parent, x, y)
+        self.image = self._origImage = self._frames[0]
+        self._imageSet = True
+        self.rect = self.image.get_rect(topleft=(x, y))
+        self._changed()
+        if playing:
+            self.play()
+
+    @property
+    def sheet(self) -> PGSpriteSheet:
+        return self._sheet
+
+    @property
+    def fps(self) -> float:
+        return self._fps
+
+    @fps.setter
+    def fps(self, fps: float) -> None:
+        assert fps > 0, "Frame rate must be positive!"
+        if self._start is not None:
+            self._elapsed = self._now()
+            self._start = pygame.time.get_ticks()
+        self._fps = fps
+
+    @property
+    def loop(self) -> bool:
+        return self._loop
+
+    @loop.setter
+    def loop(self, loop: bool) -> None:
+        self._loop = loop
+
+    @property
+    def playing(self) -> bool:
+        return self._start is not None
+
+    @property
+    def frame(self) -> int:
+        return self._index
+
+    @frame.setter
+    def frame(self, index: int) -> None:
+        assert 0 <= index < len(self._frames), "Frame index out of range!"
+        self._elapsed = index / self._fps
+        if self._start is not None:
+            self._start = pygame.time.get_ticks()
+        self._show(index)
+
+    def _now(self) -> float:
+        return self._elapsed + (pygame.time.get_ticks() - self._start) / 1000
+
+    # @function play
+    # @abstract Start or resume the animation.
+    # @return An animation that completes when a non-looping playback reaches its last frame
+    #         (or is stopped).
+
+    def play(self) -> PGAnimation:
+        if self._start is None:
+            self._start = pygame.time.get_ticks()
+            if self._playback.done:
+                self._playback = PGAnimation()
+        return self._playback
+
+    def pause(self) -> None:
+        if self._start is not None:
+            self._elapsed = self._now()
+            self._start = None
+
+    def stop(self) -> None:
+        self._start = None
+        self._elapsed = 0
+        self._show(0)
+        self._playback.finish()
+
+    # @function kill
+    # @abstract Also ends the playback, so that coroutines awaiting @play resume.
+
+    def kill(self) -> None:
+        super().kill()
+        self.pause()
+        self._playback.finish()
+
+    @property
+    def alpha(self) -> int:
+        return self._alpha
+
+    @alpha.setter
+    def alpha(self, alpha: int) -> None:
+        alpha = max(alpha, 0)
+        if alpha != 255 and self._frames is self._sheet.frames:
+            self._frames = self._sheet.views()
+            self.image = self._origImage = self._frames[self._index]
+        for f in self._frames:
+            set_surface_alpha(f, alpha)
+        self._alpha = alpha
+        self._changed()
+
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        return self._sheet.mask(self._index)
+
+    def reformat(self) -> None:
+        self._sheet.reformat()
+        self._frames = self._sheet.views() if self._alpha != 255 else self._sheet.frames
+        if self._alpha != 255:
+            for f in self._frames:
+                set_surface_alpha(f, self._alpha)
+        self.image = self._origImage = self._frames[self._index]
+        self._changed()
+
+    def _show(self, index: int) -> None:
+        if index == self._index:
+            return
+        self._index = index
+        self.image = self._frames[index]
+        self._changed()
+
+    def update(self, *args, **kwargs) -> None:
+        if self._start is None:
+            return
+        index = int(self._now() * self._fps)
+        count = len(self._frames)
+        if index >= count:
+            if self._loop:
+                index %= count
+            else:
+                self._show(count - 1)
+                self.pause()
+                self._elapsed = 0
+                self._playback.finish()
+                return
+        self._show(index)
+
+    # @function _content_state
+    # @abstract The sheet, by the arguments it was loaded with, and the playback position.
+    # @discussion Only sheets obtained from @PGSpriteSheet.load can be referenced.
+
+    def _content_state(self) -> dict:
+        if self._sheet._key is None:
+            raise ValueError("Only sprite sheets from PGSpriteSheet.load can be snapshotted!")
+        path, frame_size, count, spacing, margin = self._sheet._key
+        return {"sheet": [path, list(frame_size), count, spacing, margin], "fps": self._fps, "loop": self._loop,
+                "playing": self.playing, "frame": self._index}
+
+    @classmethod
+    def _from_content(cls, parent: Type[PGScene], content: dict) -> "PGAnimatedObject":
+        obj = cls(parent, 0, 0, PGSpriteSheet.load(*content["sheet"]), content["fps"], content["loop"],
+                  content["playing"])
+        obj.frame = content["frame"]
+        return obj
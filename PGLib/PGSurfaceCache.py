@@ -0,0 +1,177 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 cjiang. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import mmap
+import os
+import struct
+from typing import Callable
+from PGLib.PGGlobal import *
+
+
+# @class PGSurfaceCache
+# @abstract Opt-in on-disk cache of pre-rendered surfaces (button labels, scaled images).
+# @discussion Entries are keyed by a hash of everything that went into producing the
+#             surface (font identity, text, colors, source file and target size) and are
+#             stored as a small header followed by raw RGBA pixels. A hit memory-maps the
+#             file and wraps it as a Surface directly, so nothing is decoded or rendered.
+#             Entries written by another @VERSION are ignored and removed, and the least
+#             recently used files are deleted whenever the cache outgrows @max_bytes.
+#             Install one with @install (or @PGGame.enable_surface_cache) to have PGLib use it.
+
+class PGSurfaceCache:
+    VERSION = 1
+    _MAGIC = b"PGSC"
+    _HEADER = struct.Struct("<4sHHII")
+    _SUFFIX = ".pgs"
+
+    _active = None
+
+    def __init__(self, directory: str, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self._directory = directory
+        self._maxBytes = max_bytes
+        self._hits = 0
+        self._misses = 0
+        os.makedirs(directory, exist_ok=True)
+        self._total = sum(e.stat().st_size for e in self._entries())
+        if self._total > self._maxBytes:
+            self.cleanup()
+
+    @staticmethod
+    def active() -> "PGSurfaceCache":
+        return PGSurfaceCache._active
+
+    def install(self) -> None:
+        PGSurfaceCache._active = self
+
+    @staticmethod
+    def uninstall() -> None:
+        PGSurfaceCache._active = None
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def size(self) -> int:
+        return self._total
+
+    # Keys
+
+    @staticmethod
+    def file_key(path: str) -> tuple:
+        st = os.stat(path)
+        return os.path.abspath(path), st.st_size, st.st_mtime_ns
+
+    def key(self, *parts) -> str:
+        import hashlib
+        return hashlib.sha1(repr((self.VERSION,) + parts).encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, key + self._SUFFIX)
+
+    # Access
+
+    def get(self, key: str) -> pygame.Surface:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            self._misses += 1
+            return None
+
+        magic, version, _, w, h = self._HEADER.unpack_from(data) if len(data) >= self._HEADER.size \
+            else (None, None, None, 0, 0)
+        if magic != self._MAGIC or version != self.VERSION or len(data) != self._HEADER.size + w * h * 4:
+            data.close()
+            self._remove(path)
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        os.utime(path)
+        return pygame.image.frombuffer(memoryview(data)[self._HEADER.size:], (w, h), "RGBA")
+
+    def put(self, key: str, surface: pygame.Surface) -> None:
+        w, h = surface.get_size()
+        path = self._path(key)
+        temp = path + ".tmp"
+        try:
+            old = os.path.getsize(path)
+        except OSError:
+            old = 0
+        try:
+            with open(temp, "wb") as f:
+                f.write(self._HEADER.pack(self._MAGIC, self.VERSION, 0, w, h))
+                f.write(pygame.image.tobytes(surface, "RGBA"))
+            os.replace(temp, path)
+        except OSError:
+            return
+        self._total += self._HEADER.size + w * h * 4 - old
+        if self._total > self._maxBytes:
+            self.cleanup()
+
+    # @function fetch
+    # @abstract Return the cached surface for @parts, building and storing it on a miss.
+
+    def fetch(self, parts: tuple, build: Callable[[], pygame.Surface]) -> pygame.Surface:
+        key = self.key(*parts)
+        surface = self.get(key)
+        if surface is None:
+            surface = build()
+            self.put(key, surface)
+        return surface
+
+    # Maintenance
+
+    def _entries(self) -> list[os.DirEntry]:
+        return [e for e in os.scandir(self._directory) if e.name.endswith(self._SUFFIX)]
+
+    def _remove(self, path: str) -> None:
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+            self._total -= size
+        except OSError:
+            pass
+
+    # @function cleanup
+    # @abstract Delete least recently used entries until the cache is below 3/4 of its budget.
+
+    def cleanup(self) -> None:
+        entries = sorted(self._entries(), key=lambda e: e.stat().st_mtime_ns)
+        self._total = sum(e.stat().st_size for e in entries)
+        for e in entries:
+            if self._total <= self._maxBytes * 3 // 4:
+                break
+            self._remove(e.path)
+
+    def clear(self) -> None:
+        for e in self._entries():
+            self._remove(e.path)
+        self._total = 0
@@ -0,0 +1,438 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 cjiang. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import itertools
+import re
+from bisect import bisect_right
+from collections import OrderedDict
+from PGLib.PGFonts import *
+from PGLib.PGObject import *
+
+
+def _color_state(color) -> Union[str, list]:
+    return color if isinstance(color, str) else list(color)
+
+
+class _Paragraph:
+    __slots__ = ("text", "lines")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.lines = None
+
+
+# @class PGTextArea
+# @abstract A scrollable, word-wrapped, multi-line text box.
+# @discussion Text is stored as a list of paragraphs (split on newlines), each caching its
+#             own line breaks as slices of its text. An edit re-wraps only the paragraphs
+#             it touches. Paragraphs are grouped into blocks that keep their total line
+#             count, so finding the paragraph behind a line, or inserting anywhere in the
+#             buffer, does not walk the whole text. The image is a fixed-size viewport:
+#             only the visible lines are drawn, from a small LRU cache of rendered lines
+#             that is reused while scrolling. Cost per edit and memory for surfaces thus
+#             do not grow with the length of the buffer.
+# @param follow Keep the view pinned to the end when text is added while at the end.
+
+class PGTextArea(PGObject):
+    _BLOCK_SIZE = 128
+    _WORD = re.compile(r"\S*\s*")
+
+    def __init__(self, parent: Type[PGScene], x: int, y: int, width: int, height: int, text: str = "",
+                 font: pygame.font.Font = None, font_color: tuple = (0, 0, 0), bg_color: tuple = (255, 255, 255),
+                 margin: int = 4, antialias: bool = True, editable: bool = True, follow: bool = True,
+                 cache_lines: int = None) -> None:
+        self._font = font if font else sys_font("Ariel", 20)
+        self._fontColor = font_color
+        self._bgColor = bg_color
+        self._margin = margin
+        self._antialias = antialias
+        self._editable = editable
+        self._follow = follow
+        self._lineHeight = self._font.get_linesize()
+        self._visibleLines = max(1, (height - 2 * margin) // self._lineHeight)
+        self._cacheSize = cache_lines if cache_lines else self._visibleLines * 2 + 16
+        self._lineCache = OrderedDict()
+
+        self._blocks = [[]]
+        self._blockLines = [0]
+        self._starts = None
+        self._lineCount = 0
+        self._paragraphCount = 0
+        self._scroll = 0
+        self._cursor = (0, 0)
+        self._redraw = True
+
+        super().__init__(parent, x, y, pygame.Surface((width, height)))
+        self.text = text
+        self._render()
+
+    # Buffer access
+
+    @property
+    def text(self) -> str:
+        return "\n".join(p.text for block in self._blocks for p in block)
+
+    @text.setter
+    def text(self, text: str) -> None:
+        paragraphs = [_Paragraph(t) for t in text.split("\n")]
+        for p in paragraphs:
+            p.lines = self._wrap(p.text)
+        self._blocks = [paragraphs[i:i + self._BLOCK_SIZE] for i in range(0, len(paragraphs), self._BLOCK_SIZE)]
+        self._blockLines = [sum(len(p.lines) for p in block) for block in self._blocks]
+        self._starts = None
+        self._lineCount = sum(self._blockLines)
+        self._paragraphCount = len(paragraphs)
+        self._cursor = (self._paragraphCount - 1, len(paragraphs[-1].text))
+        self._scroll = self._max_scroll() if self._follow else 0
+        self._redraw = True
+
+    @property
+    def paragraph_count(self) -> int:
+        return self._paragraphCount
+
+    @property
+    def line_count(self) -> int:
+        return self._lineCount
+
+    def get_paragraph(self, index: int) -> str:
+        b, j = self._locate_paragraph(index)
+        return self._blocks[b][j].text
+
+    def set_paragraph(self, index: int, text: str) -> None:
+        assert "\n" not in text, "Paragraphs cannot contain newlines!"
+        b, j = self._locate_paragraph(index)
+        p = self._blocks[b][j]
+        old = len(p.lines)
+        p.text = text
+        p.lines = self._wrap(text)
+        self._blockLines[b] += len(p.lines) - old
+        self._starts = None
+        self._lineCount += len(p.lines) - old
+        self._edited(b, j, old, len(p.lines))
+
+    def insert_paragraph(self, index: int, text: str) -> None:
+        assert "\n" not in text, "Paragraphs cannot contain newlines!"
+        at_end = self._scroll >= self._max_scroll()
+        p = _Paragraph(text)
+        p.lines = self._wrap(text)
+        if index >= self._paragraphCount:
+            b, j = len(self._blocks) - 1, len(self._blocks[-1])
+        else:
+            b, j = self._locate_paragraph(index)
+        self._blocks[b].insert(j, p)
+        self._blockLines[b] += len(p.lines)
+        self._starts = None
+        self._lineCount += len(p.lines)
+        self._paragraphCount += 1
+        if len(self._blocks[b]) > 2 * self._BLOCK_SIZE:
+            block = self._blocks[b]
+            self._blocks[b:b + 1] = [block[:self._BLOCK_SIZE], block[self._BLOCK_SIZE:]]
+            self._blockLines[b:b + 1] = [sum(len(q.lines) for q in self._blocks[b]),
+                                         sum(len(q.lines) for q in self._blocks[b + 1])]
+            if j >= self._BLOCK_SIZE:
+                b, j = b + 1, j - self._BLOCK_SIZE
+        if self._follow and at_end:
+            self._scroll = self._max_scroll()
+            self._redraw = True
+        else:
+            self._edited(b, j, 0, len(p.lines))
+
+    def delete_paragraph(self, index: int) -> None:
+        b, j = self._locate_paragraph(index)
+        p = self._blocks[b].pop(j)
+        self._blockLines[b] -= len(p.lines)
+        self._starts = None
+        self._lineCount -= len(p.lines)
+        self._paragraphCount -= 1
+        if not self._blocks[b] and len(self._blocks) > 1:
+            del self._blocks[b]
+            del self._blockLines[b]
+        if not self._paragraphCount:
+            self.insert_paragraph(0, "")
+        self._scroll = min(self._scroll, self._max_scroll())
+        self._redraw = True
+
+    def append(self, text: str) -> None:
+        for line in text.split("\n"):
+            self.insert_paragraph(self._paragraphCount, line)
+
+    # Wrapping
+
+    def _wrap(self, text: str) -> list[str]:
+        width = self.rect.width - 2 * self._margin
+        size = self._font.size
+        if not text or width <= 0 or size(text)[0] <= width:
+            return [text]
+
+        lines = []
+        line = ""
+        for word in self._WORD.findall(text):
+            if not word:
+                continue
+            if size((line + word).rstrip())[0] <= width:
+                line += word
+                continue
+            if line:
+                lines.append(line)
+                line = ""
+            while size(word.rstrip())[0] > width:
+                # Break words wider than the box by characters
+                lo, hi = 1, len(word)
+                while lo < hi:
+                    mid = (lo + hi + 1) // 2
+                    if size(word[:mid])[0] <= width:
+                        lo = mid
+                    else:
+                        hi = mid - 1
+                lines.append(word[:lo])
+                word = word[lo:]
+            line = word
+        if line or not lines:
+            lines.append(line)
+        return lines
+
+    # Line lookup
+
+    # @function _block_starts
+    # @abstract The first line and first paragraph index of every block, for bisecting.
+    # @discussion Rebuilt after an edit on the next lookup, in one pass over the blocks.
+
+    def _block_starts(self) -> tuple[list[int], list[int]]:
+        if self._starts is None:
+            self._starts = (list(itertools.accumulate(self._blockLines, initial=0)),
+                            list(itertools.accumulate((len(block) for block in self._blocks), initial=0)))
+        return self._starts
+
+    def _locate_paragraph(self, index: int) -> tuple[int, int]:
+        assert 0 <= index < self._paragraphCount, "Paragraph index out of range!"
+        starts = self._block_starts()[1]
+        b = bisect_right(starts, index) - 1
+        return b, index - starts[b]
+
+    def _locate_line(self, line: int) -> tuple[int, int, int]:
+        if line >= self._lineCount:
+            return len(self._blocks) - 1, len(self._blocks[-1]) - 1, len(self._blocks[-1][-1].lines) - 1
+        starts = self._block_starts()[0]
+        b = bisect_right(starts, line) - 1
+        line -= starts[b]
+        for j, p in enumerate(self._blocks[b]):
+            if line < len(p.lines):
+                return b, j, line
+            line -= len(p.lines)
+
+    def _first_line(self, b: int, j: int) -> int:
+        return self._block_starts()[0][b] + sum(len(p.lines) for p in self._blocks[b][:j])
+
+    # @function _edited
+    # @abstract Schedule a redraw if a paragraph that went from @old to @new lines is shown.
+    # @discussion Edits above the viewport only matter when they reflow: the scroll position
+    #             is then shifted so that the same lines stay in view.
+
+    def _edited(self, b: int, j: int, old: int, new: int) -> None:
+        first = self._first_line(b, j)
+        if first + old <= self._scroll:
+            if new != old:
+                self._scroll = max(0, min(self._scroll + new - old, self._max_scroll()))
+                self._redraw = True
+        elif first < self._scroll + self._visibleLines:
+            self._redraw = True
+
+    # Scrolling
+
+    def _max_scroll(self) -> int:
+        return max(0, self._lineCount - self._visibleLines)
+
+    @property
+    def scroll(self) -> int:
+        return self._scroll
+
+    @scroll.setter
+    def scroll(self, line: int) -> None:
+        line = max(0, min(int(line), self._max_scroll()))
+        if line != self._scroll:
+            self._scroll = line
+            self._redraw = True
+
+    def scroll_by(self, lines: int) -> None:
+        self.scroll = self._scroll + lines
+
+    # Rendering
+
+    def _render_line(self, text: str) -> pygame.Surface:
+        surface = self._lineCache.get(text)
+        if surface is not None:
+            self._lineCache.move_to_end(text)
+            return surface
+        surface = self._font.render(text.rstrip(), self._antialias, self._fontColor, self._bgColor)
+        self._lineCache[text] = surface
+        if len(self._lineCache) > self._cacheSize:
+            self._lineCache.popitem(last=False)
+        return surface
+
+    def _render(self) -> None:
+        self._redraw = False
+        self.image.fill(self._bgColor)
+        self.invalidate_mask()
+        if not self._lineCount:
+            return
+        b, j, k = self._locate_line(self._scroll)
+        index = self._paragraph_index(b, j)
+        y = self._margin
+        drawn = 0
+        while drawn < self._visibleLines and b < len(self._blocks):
+            p = self._blocks[b][j]
+            while k < len(p.lines) and drawn < self._visibleLines:
+                if p.lines[k]:
+                    self.image.blit(self._render_line(p.lines[k]), (self._margin, y))
+                if self._editable and index == self._cursor[0]:
+                    self._draw_cursor(p, k, y, self._cursor[1])
+                y += self._lineHeight
+                drawn += 1
+                k += 1
+            k = 0
+            j += 1
+            index += 1
+            if j >= len(self._blocks[b]):
+                b, j = b + 1, 0
+        self._changed()
+
+    def _paragraph_index(self, b: int, j: int) -> int:
+        return self._block_starts()[1][b] + j
+
+    def _draw_cursor(self, p: _Paragraph, k: int, y: int, col: int) -> None:
+        start = sum(len(line) for line in p.lines[:k])
+        end = start + len(p.lines[k])
+        if start <= col < end or (col == end and k == len(p.lines) - 1):
+            x = self._margin + self._font.size(p.lines[k][:col - start])[0]
+            self.image.fill(self._fontColor, (x, y, 2, self._lineHeight))
+
+    def update(self, *args, **kwargs) -> None:
+        if self._redraw:
+            self._render()
+
+    def surfaces(self) -> list[pygame.Surface]:
+        return super().surfaces() + list(self._lineCache.values())
+
+    def _content_state(self) -> dict:
+        font = font_key(self._font)
+        if font is None:
+            raise ValueError("Fonts not loaded through PGFonts cannot be snapshotted!")
+        return {"size": list(self._origImage.get_size()), "text": self.text, "font": list(font),
+                "font_color": _color_state(self._fontColor), "bg_color": _color_state(self._bgColor),
+                "margin": self._margin, "antialias": self._antialias, "editable": self._editable,
+                "follow": self._follow, "cache_lines": self._cacheSize, "scroll": self._scroll,
+                "cursor": list(self._cursor)}
+
+    @classmethod
+    def _from_content(cls, parent: Type[PGScene], content: dict) -> "PGTextArea":
+        colors = [c if isinstance(c, str) else tuple(c) for c in (content["font_color"], content["bg_color"])]
+        obj = cls(parent, 0, 0, *content["size"], content["text"], font_from_key(content["font"]), *colors,
+                  content["margin"], content["antialias"], content["editable"], content["follow"],
+                  content["cache_lines"])
+        obj.scroll = content["scroll"]
+        obj.cursor = content["cursor"]
+        return obj
+
+    # Input
+
+    @property
+    def editable(self) -> bool:
+        return self._editable
+
+    @editable.setter
+    def editable(self, editable: bool) -> None:
+        self._editable = editable
+        self._redraw = True
+
+    @property
+    def cursor(self) -> tuple[int, int]:
+        return self._cursor
+
+    @cursor.setter
+    def cursor(self, cursor: tuple[int, int]) -> None:
+        para = max(0, min(cursor[0], self._paragraphCount - 1))
+        self._cursor = (para, max(0, min(cursor[1], len(self.get_paragraph(para)))))
+        self._redraw = True
+
+    def process_events(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.MOUSEWHEEL:
+            if self.rect.collidepoint(self.event_pos(event)):
+                self.scroll_by(-event.y * 3)
+        elif event.type == pygame.KEYDOWN and self._editable:
+            self._process_key(event)
+
+    def _process_key(self, event: pygame.event.Event) -> None:
+        para, col = self._cursor
+        text = self.get_paragraph(para)
+        if event.key == pygame.K_BACKSPACE:
+            if col:
+                self.set_paragraph(para, text[:col - 1] + text[col:])
+                self.cursor = (para, col - 1)
+            elif para:
+                prev = self.get_paragraph(para - 1)
+                self.set_paragraph(para - 1, prev + text)
+                self.delete_paragraph(para)
+                self.cursor = (para - 1, len(prev))
+        elif event.key == pygame.K_DELETE:
+            if col < len(text):
+                self.set_paragraph(para, text[:col] + text[col + 1:])
+            elif para < self._paragraphCount - 1:
+                self.set_paragraph(para, text + self.get_paragraph(para + 1))
+                self.delete_paragraph(para + 1)
+            self.cursor = (para, col)
+        elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+            self.set_paragraph(para, text[:col])
+            self.insert_paragraph(para + 1, text[col:])
+            self.cursor = (para + 1, 0)
+        elif event.key == pygame.K_LEFT:
+            self.cursor = (para, col - 1) if col or not para else (para - 1, len(self.get_paragraph(para - 1)))
+        elif event.key == pygame.K_RIGHT:
+            if col < len(text) or para == self._paragraphCount - 1:
+                self.cursor = (para, col + 1)
+            else:
+                self.cursor = (para + 1, 0)
+        elif event.key == pygame.K_UP:
+            self.cursor = (para - 1, col)
+        elif event.key == pygame.K_DOWN:
+            self.cursor = (para + 1, col)
+        elif event.unicode and event.unicode.isprintable():
+            self.set_paragraph(para, text[:col] + event.unicode + text[col:])
+            self.cursor = (para, col + len(event.unicode))
+        else:
+            return
+        self._reveal_cursor()
+
+    def _reveal_cursor(self) -> None:
+        para, col = self._cursor
+        b, j = self._locate_paragraph(para)
+        line = self._first_line(b, j)
+        for k in self._blocks[b][j].lines[:-1]:
+            if col < len(k):
+                break
+            col -= len(k)
+            line += 1
+        if line < self._scroll:
+            self.scroll = line
+        elif line >= self._scroll + self._visibleLines:
+            self.scroll = line - self._visibleLines + 1
@@ -30,8 +30,6 @@ Borrowed from https://github.com/Nearoo/pygame-text-input under the MIT license.
 import pygame
 import pygame.locals as pl
 
-pygame.font.init()
-
 
 class TextInputManager:
     '''
@@ -157,6 +155,8 @@ class TextInputVisualizer:
                  cursor_color=(0, 0, 0)
                  ):
 
+        if not pygame.font.get_init():
+            pygame.font.init()
         self._manager = TextInputManager() if manager is None else manager
         self._font_object = pygame.font.Font(pygame.font.get_default_font(), 25) if font_object is None else font_object
         self._antialias = antialias
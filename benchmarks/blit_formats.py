@@ -0,0 +1,150 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 cjiang. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+Blit benchmark: cost of drawing a typical menu with every image converted with
+convert_alpha() versus converted by PGLib.PGFormat.optimize_surface.
+
+The menu is a full-window background, a grid of text buttons, icons with hard-edged
+transparency, a few anti-aliased translucent sprites and a half-transparent veil. Each
+kind of image is timed on its own, then the whole menu as one frame. Run from the
+repository root:
+
+    python benchmarks/blit_formats.py [--frames N] [--buttons N] [--display]
+
+By default SDL's dummy video driver is used so the benchmark also runs headless.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def build_menu(screen_size: tuple[int, int], buttons: int) -> dict:
+    import pygame
+    from PGLib.PGFonts import sys_font
+
+    font = sys_font("Ariel", 20)
+    background = pygame.Surface(screen_size, pygame.SRCALPHA)
+    background.fill((50, 50, 100))
+
+    button_images = []
+    for i in range(buttons):
+        img = pygame.Surface((120, 40), pygame.SRCALPHA)
+        img.fill((230, 230, 230))
+        img.blit(font.render("Button %d" % i, True, "black"), (10, 10))
+        button_images.append(img)
+
+    icons = []
+    for i in range(buttons // 2):
+        img = pygame.Surface((48, 48), pygame.SRCALPHA)
+        pygame.draw.polygon(img, (200, 40 + i * 7 % 200, 40), [(24, 0), (48, 48), (0, 48)])
+        icons.append(img)
+
+    glows = []
+    for i in range(4):
+        img = pygame.Surface((96, 96), pygame.SRCALPHA)
+        for r in range(48, 0, -4):
+            pygame.draw.circle(img, (255, 220, 120, 255 - r * 5), (48, 48), r)
+        glows.append(img)
+
+    veil = pygame.Surface(screen_size, pygame.SRCALPHA)
+    veil.fill((0, 0, 0))
+    veil.set_alpha(128)
+
+    return {"background": [background], "buttons": button_images, "icons": icons, "glows": glows,
+            "veil": [veil]}
+
+
+def layout(screen_size: tuple[int, int], menu: dict) -> list:
+    width, height = screen_size
+    placed = []
+    for kind, images in menu.items():
+        for i, img in enumerate(images):
+            if img.get_size() == screen_size:
+                pos = (0, 0)
+            else:
+                pos = ((i * 131) % max(1, width - img.get_width()), (i * 47) % max(1, height - img.get_height()))
+            placed.append((kind, img, pos))
+    return placed
+
+
+def time_blits(screen, placed: list, frames: int) -> float:
+    start = time.perf_counter()
+    for _ in range(frames):
+        for _, img, pos in placed:
+            screen.blit(img, pos)
+    return (time.perf_counter() - start) / frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--buttons", type=int, default=40)
+    parser.add_argument("--size", type=int, nargs=2, default=(1280, 720))
+    parser.add_argument("--display", action="store_true", help="use the real video driver")
+    args = parser.parse_args()
+
+    if not args.display:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    import pygame
+    from PGLib.PGFormat import optimize_surface, surface_kind
+
+    pygame.init()
+    screen = pygame.display.set_mode(tuple(args.size))
+    menu = build_menu(screen.get_size(), args.buttons)
+
+    def convert(f):
+        converted = {}
+        for kind, images in menu.items():
+            converted[kind] = []
+            for img in images:
+                new = f(img)
+                if img.get_alpha() is not None and img.get_alpha() < 255:
+                    new.set_alpha(img.get_alpha())
+                converted[kind].append(new)
+        return converted
+
+    baseline = layout(screen.get_size(), convert(lambda s: s.convert_alpha()))
+    optimized = layout(screen.get_size(), convert(optimize_surface))
+
+    print("%-12s %8s %14s %14s %8s" % ("images", "count", "convert_alpha", "optimized", "speedup"))
+    for kind, images in menu.items():
+        before = time_blits(screen, [p for p in baseline if p[0] == kind], args.frames)
+        after = time_blits(screen, [p for p in optimized if p[0] == kind], args.frames)
+        print("%-12s %8d %11.3f ms %11.3f ms %7.1fx   (%s)" %
+              (kind, len(images), before * 1000, after * 1000, before / after, surface_kind(images[0])))
+    before = time_blits(screen, baseline, args.frames)
+    after = time_blits(screen, optimized, args.frames)
+    print("%-12s %8d %11.3f ms %11.3f ms %7.1fx" % ("whole menu", len(baseline), before * 1000, after * 1000,
+                                                    before / after))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 cjiang. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""
+Startup benchmark: import time of PGLib and time from process start to the first frame.
+
+Every sample runs in a fresh interpreter so that nothing is already imported or cached
+in memory. Run from the repository root:
+
+    python benchmarks/startup.py [--runs N] [--buttons N] [--display]
+
+By default SDL's dummy video driver is used so the benchmark also runs headless.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_PYGAME = """
+import time
+t = time.perf_counter()
+import pygame
+print(time.perf_counter() - t)
+"""
+
+IMPORT_PGLIB = """
+import time
+t = time.perf_counter()
+from PGLib.PGGame import *
+print(time.perf_counter() - t)
+"""
+
+FIRST_FRAME = """
+import time
+t = time.perf_counter()
+from PGLib.PGGame import *
+from PGLib.PGGame import PGTextButton
+
+
+class BenchScene(PGScene):
+    def __init__(self, game):
+        super().__init__(game)
+        for i in range(%(buttons)d):
+            PGTextButton(self, (i * 37) %% 600, (i * 53) %% 400, "Button %%d" %% i)
+
+    def draw(self):
+        rects = super().draw()
+        print(time.perf_counter() - t)
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        return rects
+
+
+game = PGGame()
+game.set_active_scene(BenchScene(game), "none", "none")
+game.start()
+"""
+
+
+def sample(code: str, env: dict) -> float:
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, check=True,
+                         capture_output=True, text=True).stdout
+    return float(out.strip().splitlines()[-1])
+
+
+def report(name: str, times: list[float]) -> None:
+    print("%-24s median %7.1f ms   min %7.1f ms   max %7.1f ms" %
+          (name, statistics.median(times) * 1000, min(times) * 1000, max(times) * 1000))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--buttons", type=int, default=50)
+    parser.add_argument("--display", action="store_true", help="use the real video driver")
+    args = parser.parse_args()
+
+    env = dict(os.environ, PYTHONPATH=ROOT, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    if not args.display:
+        env["SDL_VIDEODRIVER"] = "dummy"
+        env["SDL_AUDIODRIVER"] = "dummy"
+
+    report("import pygame", [sample(IMPORT_PYGAME, env) for _ in range(args.runs)])
+    report("import PGLib.PGGame", [sample(IMPORT_PGLIB, env) for _ in range(args.runs)])
+    frame = FIRST_FRAME % {"buttons": args.buttons}
+    report("first frame", [sample(frame, env) for _ in range(args.runs)])
+
+
+if __name__ == "__main__":
+    main()
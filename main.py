@@ -1,11 +1,12 @@
 import pygame
 
 from PGLib.PGGame import *
+from PGLib.PGGame import PGTextButton
 
 
 class TestScene(PGScene):
     def __init__(self, game: PGGame):
-        bg = pygame.Surface(game.screen.get_size(), pygame.SRCALPHA)
+        bg = pygame.Surface(game.screen.get_size())
         bg.fill((50, 50, 100))
         super().__init__(game, bg)
         self._button1 = PGTextButton(self, 0, 0, "googoo")
@@ -0,0 +1,35 @@
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import pytest
+
+
+@pytest.fixture
+def game():
+    from PGLib.PGGame import PGGame, clock
+    from PGLib.PGLatency import PGLatencyTracker
+    from PGLib.PGQuality import PGQualityGovernor
+    from PGLib.PGSurfaceCache import PGSurfaceCache
+    g = PGGame()
+    # clock.get_fps() only reports a rate after ten ticks
+    for _ in range(12):
+        clock.tick()
+    yield g
+    PGSurfaceCache.uninstall()
+    PGQualityGovernor.uninstall()
+    PGLatencyTracker.uninstall()
+    g.stop_capture()
+    pygame.display.quit()  # Otherwise the next game sizes its window from this one
+
+
+@pytest.fixture
+def scene(game):
+    from PGLib.PGGame import PGScene
+    s = PGScene(game)
+    s.activate("none", "none")
+    return s
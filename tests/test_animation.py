@@ -0,0 +1,27 @@
+import asyncio
+
+import pygame
+
+import PGLib.PGObject
+from PGLib.PGGame import PGObject
+
+
+def test_killing_an_object_finishes_its_animations(scene):
+    sprite = PGObject(scene, 0, 0, pygame.Surface((10, 10)))
+    fade = sprite.fade(0)
+    move = sprite.move((100, 100))
+
+    async def wait():
+        asyncio.get_running_loop().call_soon(sprite.kill)
+        await asyncio.wait_for(asyncio.gather(fade, move), 1)
+
+    asyncio.run(wait())
+    assert fade.done and move.done
+    assert not sprite._posChanges and not sprite._alphaChanges
+
+
+def test_move_before_the_clock_has_measured_a_frame(scene, monkeypatch):
+    monkeypatch.setattr(PGLib.PGObject, "clock", pygame.time.Clock())  # has not ticked yet
+    sprite = PGObject(scene, 0, 0, pygame.Surface((10, 10)))
+    sprite.move((120, 0), time=1)
+    assert sprite._posChanges[0][1] > 0
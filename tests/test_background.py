@@ -0,0 +1,75 @@
+import pygame
+
+from PGLib.PGBackground import PGBackground
+
+
+def _background():
+    world = pygame.Surface((300, 200))
+    world.fill((0, 0, 255))
+    background = PGBackground.from_surface(world, chunk_size=64, fill=(255, 0, 0))
+    background.resize((100, 80))
+    return background
+
+
+def test_a_view_entirely_outside_the_world_is_filled():
+    background = _background()
+    for pos in ((5000, 5000), (-700, 30), (150, -1000), (310, 0)):
+        background.pos = pos
+        background.sync()
+        assert background.view.get_at((50, 40))[:3] == (255, 0, 0)
+    assert background.chunks_cached == 0
+
+
+def test_scrolling_back_into_the_world():
+    background = _background()
+    background.pos = (250, 150)
+    background.sync()
+    background.pos = (290, 190)  # Exposed strips are partly outside the world
+    background.sync()
+    assert background.view.get_at((5, 5))[:3] == (0, 0, 255)
+    assert background.view.get_at((15, 15))[:3] == (255, 0, 0)
+
+
+def _checkered_world():
+    world = pygame.Surface((1200, 900))
+    for x in range(0, 1200, 30):
+        for y in range(0, 900, 30):
+            world.fill(((x * 7) % 256, (y * 5) % 256, (x + y) % 256), (x, y, 30, 30))
+    return world
+
+
+def test_camera_scrolls_repaint_only_the_exposed_strips(game, scene, monkeypatch):
+    from PGLib.PGGame import PGObject
+
+    def square(x, y, color, size=24):
+        img = pygame.Surface((size, size))
+        img.fill(color)
+        return PGObject(scene, x, y, img)
+
+    scene.background = PGBackground.from_surface(_checkered_world(), chunk_size=128)
+    scene.update_background()
+    camera = scene.enable_camera((100, 100), cell_size=64)
+    wall = square(300, 200, (255, 0, 0), 40)
+    wall.static = True
+    beyond = square(615, 160, (255, 255, 0))  # Scrolled into view by the first step
+    beyond.static = True
+    square(150, 150, (0, 255, 0))
+    hud = square(10, 10, (0, 0, 255))
+    hud.screen_space = True
+    scene.draw()
+
+    builds = []
+    build = scene.group._build_static
+    monkeypatch.setattr(scene.group, "_build_static", lambda surface: builds.append(1) or build(surface))
+    painted = []
+    repaint = scene.group.repaint_rect
+    monkeypatch.setattr(scene.group, "repaint_rect", lambda rect: painted.append(rect) or repaint(rect))
+    size = game.screen.get_size()
+    for step in ((7, 0), (0, -5), (-12, 9), (30, 4)):
+        camera.move_by(*step)
+        painted.clear()
+        scene.draw()
+        assert builds == []
+        assert sum(r.width * r.height for r in painted) < size[0] * size[1] // 4
+        expected = scene.render(pygame.Surface(size))
+        assert pygame.image.tobytes(game.screen.copy(), "RGB") == pygame.image.tobytes(expected, "RGB")
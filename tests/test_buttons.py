@@ -0,0 +1,69 @@
+import pygame
+
+from PGLib.PGGame import PGTextButton
+
+
+def test_relabel_keeps_the_current_transform(scene):
+    button = PGTextButton(scene, 0, 0, "a", width=40, height=20)
+    button.scale = 2
+    button.alpha = 100
+    button.text = "a much longer label than before"
+    width, height = button._origImage.get_size()
+    assert width > 40
+    assert button.rect.size == (width * 2, height * 2)
+    assert button.image.get_alpha() == 100
+
+    button.angle = 90
+    button.text = "short"
+    w, h = button._origImage.get_size()
+    assert abs(button.rect.width - h * 2) <= 2 and abs(button.rect.height - w * 2) <= 2  # rotozoom pads
+    assert button.scale == 2 and button.angle == 90
+
+
+def test_rotated_corners_are_transparent(scene):
+    button = PGTextButton(scene, 0, 0, "a", width=40, height=20)
+    button.angle = 45
+    assert button.image.get_at((0, 0)).a == 0 or button.image.get_colorkey() == button.image.get_at((0, 0))
+    assert button.image.get_at(button.image.get_rect().center).a == 255
+    source = button._rotationSource
+    button.angle = 30
+    assert button._rotationSource is source
+
+    button.alpha = 100
+    button.angle = 60
+    screen = pygame.Surface(button.rect.size)
+    screen.fill((255, 255, 255))
+    screen.blit(button.image, (0, 0))
+    assert screen.get_at((0, 0))[:3] == (255, 255, 255)
+
+
+def test_buttons_share_their_image_until_relabelled(scene):
+    first = PGTextButton(scene, 0, 0, "shared", width=60, height=20)
+    second = PGTextButton(scene, 30, 0, "shared", width=60, height=20)
+    assert first.image.get_parent() is second.image.get_parent()
+    assert first.rect.topleft == (0, 0) and second.rect.topleft == (30, 0)
+
+    second.alpha = 50
+    assert first.image.get_alpha() in (None, 255)
+    before = pygame.image.tobytes(first.image, "RGB")
+    second.text = "change"
+    assert second.text == "change"
+    assert pygame.image.tobytes(first.image, "RGB") == before
+    assert second.image.get_parent() is None and second.image.get_alpha() == 50
+
+
+def test_scaling_a_colorkeyed_image_leaves_no_key_fringe(scene):
+    from PGLib.PGGame import PGObject
+    img = pygame.Surface((20, 20), pygame.SRCALPHA)
+    pygame.draw.circle(img, (0, 0, 255, 255), (10, 10), 8)
+    sprite = PGObject(scene)
+    sprite.img = img
+    assert sprite._origImage.get_colorkey()  # Hard-edged: converted to a colorkey
+    sprite.scale = 1.5
+    screen = pygame.Surface(sprite.rect.size)
+    screen.fill((255, 255, 255))
+    screen.blit(sprite.image, (0, 0))
+    for x in range(screen.get_width()):
+        for y in range(screen.get_height()):
+            r, g, b, _ = screen.get_at((x, y))
+            assert not (r > 200 and b > 200 and g < 150), (x, y, (r, g, b))  # No magenta
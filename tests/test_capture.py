@@ -0,0 +1,33 @@
+import pygame
+
+from PGLib.PGCapture import PGFrameCapture
+
+
+def test_raw_capture_copies_dirty_rects_into_reused_slot(tmp_path):
+    path = tmp_path / "frames.raw"
+    surface = pygame.Surface((8, 4))
+    surface.fill((10, 20, 30))
+    capture = PGFrameCapture(str(path), (8, 4), fmt="raw", buffers=1, policy="block", max_wait=1)
+    assert capture.capture(surface)
+    surface.fill((200, 0, 0), pygame.Rect(0, 0, 2, 2))
+    assert capture.capture(surface, [pygame.Rect(0, 0, 2, 2)])
+    capture.close()
+
+    data = path.read_bytes()
+    frame = 8 * 4 * 3
+    assert len(data) == 2 * frame
+    assert data[:3] == bytes((10, 20, 30))
+    second = data[frame:]
+    assert second[:3] == bytes((200, 0, 0))
+    assert second[2 * 3:3 * 3] == bytes((10, 20, 30))
+    assert capture.frames_written == 2 and capture.frames_dropped == 0
+
+
+def test_drop_policy_counts_dropped_frames(tmp_path):
+    surface = pygame.Surface((4, 4))
+    capture = PGFrameCapture(str(tmp_path / "png"), (4, 4), buffers=1, policy="drop")
+    results = [capture.capture(surface) for _ in range(20)]
+    capture.close()
+    assert capture.frames_captured + capture.frames_dropped == 20
+    assert capture.frames_dropped == results.count(False)
+    assert len(list((tmp_path / "png").iterdir())) == capture.frames_written
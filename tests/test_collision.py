@@ -0,0 +1,54 @@
+import pygame
+
+from PGLib.PGGame import PGObject, PGTextButton
+
+
+def _solid(scene, x, y):
+    return PGObject(scene, x, y, pygame.Surface((10, 10)))
+
+
+def test_contacts_ended_by_remove_are_reported_by_the_next_update(scene):
+    group = scene.group
+    group.enable_collisions(cell_size=16)
+    a, b = _solid(scene, 0, 0), _solid(scene, 5, 5)
+    group.add_collider(a)
+    group.add_collider(b)
+    group.collisions.update()
+    assert group.collisions.pairs()
+
+    group.remove_collider(b)
+    group.collisions.update()
+    assert group.collisions.exited == [(b, a)]
+    group.collisions.update()
+    assert group.collisions.exited == []
+
+
+def test_repainting_in_place_refreshes_the_mask(scene):
+    button = PGTextButton(scene, 0, 0, "abc", width=60, height=20)
+    mask = button.mask
+    assert button.mask is mask
+    button.text = "abd"
+    assert button.mask is not mask
+    button.alpha = 100
+    assert button.collidepoint(button.rect.center)
+    assert not button.collidepoint(button.rect.bottomright)
+
+
+def test_contacts_follow_colliders_across_cells(scene):
+    group = scene.group
+    group.enable_collisions(cell_size=16, use_masks=False)
+    a, b, c = _solid(scene, 0, 0), _solid(scene, 100, 100), _solid(scene, 200, 0)
+    for s in (a, b, c):
+        group.add_collider(s)
+    group.collisions.update()
+    assert group.collisions.pairs() == []
+
+    a.pos = (95, 95)  # Leaves its cells for those of b
+    group.collisions.update()
+    assert group.collisions.contacts(a) == {b}
+    assert group.collisions.entered == [(a, b)]
+
+    a.pos = (205, 5)
+    group.collisions.update()
+    assert group.collisions.contacts(a) == {c} and group.collisions.contacts(b) == set()
+    assert group.collisions.exited == [(a, b)]
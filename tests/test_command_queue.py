@@ -0,0 +1,21 @@
+from PGLib.PGCommandQueue import PGCommandQueue
+
+
+def test_a_failing_command_does_not_stop_the_drain(capsys):
+    queue = PGCommandQueue(budget=1)
+    ran = []
+    queue.post(ran.append, 1)
+    queue.post(lambda: 1 / 0)
+    queue.post(ran.append, 2)
+    assert queue.drain() == 3
+    assert ran == [1, 2]
+    assert queue.executed == 2 and queue.failed == 1 and queue.depth == 0
+    assert "ZeroDivisionError" in capsys.readouterr().err
+
+
+def test_call_reports_the_exception_through_its_future():
+    queue = PGCommandQueue()
+    future = queue.call(int, "not a number")
+    queue.drain()
+    assert isinstance(future.exception(), ValueError)
+    assert queue.executed == 1 and queue.failed == 0
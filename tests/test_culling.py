@@ -0,0 +1,38 @@
+import pygame
+
+from PGLib.PGGame import PGObject
+
+
+class _Recorder(PGObject):
+    def __init__(self, scene, x, y):
+        super().__init__(scene, x, y, pygame.Surface((10, 10)))
+        self.events = []
+        self.updates = 0
+
+    def process_events(self, event):
+        self.events.append(event.type)
+
+    def update(self, *args, **kwargs):
+        self.updates += 1
+
+
+def test_objects_out_of_view_still_get_key_events(scene):
+    scene.enable_camera((0, 0), cell_size=64)
+    far = _Recorder(scene, 5000, 5000)
+    clicks = []
+    near = _Recorder(scene, 0, 0)
+    near.connect_click(clicks.append, "near")
+    scene.process_events(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=0, unicode="a"))
+    assert far.events == [pygame.KEYDOWN] and near.events == [pygame.KEYDOWN]
+
+    scene.process_events(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(5, 5), button=1))
+    assert clicks == ["near"]
+
+
+def test_animations_survive_enabling_update_culling(scene):
+    far = _Recorder(scene, 5000, 5000)
+    far.fade(0)
+    scene.enable_camera((0, 0), cull_updates=True)
+    for _ in range(40):
+        scene.group.update()
+    assert far.alpha == 0
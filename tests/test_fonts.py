@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+
+import pygame
+
+import PGLib.PGFonts as PGFonts
+
+
+def _fresh_index(monkeypatch, path):
+    monkeypatch.setattr(PGFonts, "_fonts", {})
+    monkeypatch.setattr(PGFonts, "_index", None)
+    PGFonts.init_system_fonts(str(path))
+
+
+def test_the_index_records_and_reuses_resolutions(tmp_path, monkeypatch):
+    pygame.font.init()
+    path = tmp_path / "fonts.json"
+    _fresh_index(monkeypatch, path)
+    font = PGFonts.sys_font("no-such-font-family", 14, bold=True)
+    assert font.get_height() > 0
+    entry = PGFonts._index["no-such-font-family|10"]
+    assert path.exists()
+
+    calls = []
+    monkeypatch.setattr(pygame.font, "SysFont", lambda *args: calls.append(args))
+    _fresh_index(monkeypatch, path)
+    assert PGFonts._index["no-such-font-family|10"] == entry
+    assert PGFonts.sys_font("no-such-font-family", 20, bold=True).get_height() > 0
+    assert not calls
+
+
+def test_the_font_directories_are_walked_only_when_touched(tmp_path, monkeypatch):
+    pygame.font.init()
+    fonts = tmp_path / "fonts"
+    (fonts / "family").mkdir(parents=True)
+    (fonts / "family" / "a.ttf").write_bytes(b"")
+    monkeypatch.setattr(PGFonts, "_font_dirs", lambda: [str(fonts)])
+    path = tmp_path / "fonts.json"
+    _fresh_index(monkeypatch, path)
+    PGFonts.sys_font("no-such-font-family", 14)
+
+    walks = []
+    digest = PGFonts._file_digest
+    monkeypatch.setattr(PGFonts, "_file_digest", lambda: walks.append(1) or digest())
+    _fresh_index(monkeypatch, path)
+    assert PGFonts._index and not walks
+
+    os.utime(fonts, ns=(0, 0))  # Touched, same files
+    _fresh_index(monkeypatch, path)
+    assert PGFonts._index and len(walks) == 1
+    _fresh_index(monkeypatch, path)
+    assert len(walks) == 1  # The new times were recorded
+
+    (fonts / "b.ttf").write_bytes(b"")
+    _fresh_index(monkeypatch, path)
+    assert PGFonts._index == {} and len(walks) == 2
+
+
+def test_star_import_leaves_the_lazy_modules_alone():
+    code = ("import sys\n"
+            "from PGLib.PGGame import *\n"
+            "assert 'PGScene' in dir() and 'sys_font' in dir()\n"
+            "print(sorted(m for m in sys.modules if m.startswith('PGLib.')))\n"
+            "from PGLib.PGGame import PGTextButton, PGTextArea\n")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+    loaded = out.stdout.strip().splitlines()[-1]
+    for module in ("PGButtons", "PGCapture", "PGLatency", "PGMemory", "PGTextArea", "PGListView"):
+        assert "PGLib.%s'" % module not in loaded
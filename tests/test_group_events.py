@@ -0,0 +1,56 @@
+import pygame
+
+from PGLib.PGGame import PGObject
+
+
+class Probe(PGObject):
+    def __init__(self, parent, x, y):
+        img = pygame.Surface((20, 20))
+        img.fill((255, 255, 255))
+        super().__init__(parent, x, y, img)
+        self.events = []
+        self.calls = []
+
+    def process_events(self, event):
+        self.events.append(event.type)
+
+    def on_hover_enter(self):
+        self.calls.append("enter")
+
+    def on_hover_leave(self):
+        self.calls.append("leave")
+
+
+def motion(pos):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))
+
+
+def test_motion_is_forwarded_to_objects(scene):
+    probe = Probe(scene, 0, 0)
+    scene.process_events(motion((100, 100)))
+    assert probe.events == [pygame.MOUSEMOTION]
+
+
+def test_hover_is_hit_tested_once_per_update(scene):
+    probe = Probe(scene, 0, 0)
+    scene.process_events(motion((100, 100)))
+    scene.process_events(motion((5, 5)))
+    scene.update()
+    assert probe.calls == ["enter"]
+    assert scene.group.hovered is probe
+
+    scene.process_events(motion((100, 100)))
+    scene.process_events(motion((6, 6)))
+    scene.update()
+    assert probe.calls == ["enter"]
+
+
+def test_removed_hovered_object_gets_no_leave(scene):
+    probe = Probe(scene, 0, 0)
+    scene.process_events(motion((5, 5)))
+    scene.update()
+    probe.kill()
+    assert scene.group.hovered is None
+    scene.process_events(motion((50, 50)))
+    scene.update()
+    assert probe.calls == ["enter"]
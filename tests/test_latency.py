@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+
+import pygame
+
+from PGLib.PGGame import PGObject
+from PGLib.PGGlobal import latency_tracker
+from PGLib.PGLatency import PGLatencyTracker
+
+
+def test_the_library_does_not_load_the_tracker_until_asked():
+    code = "import sys, PGLib.PGGame; print('PGLib.PGLatency' in sys.modules)"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+    assert out.stdout.strip().splitlines()[-1] == "False"
+
+
+def test_a_click_is_attributed_to_the_clicked_object(game, scene):
+    tracker = game.enable_latency_tracking()
+    assert latency_tracker() is tracker and PGLatencyTracker.active() is tracker
+    sprite = PGObject(scene, 0, 0, pygame.Surface((10, 10)))
+    sprite.connect_click(lambda: setattr(sprite, "pos", (5, 5)))
+    tracker.begin("MouseButtonDown", tracker.now())
+    scene.process_events(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(2, 2), button=1))
+    tracker.end()
+    tracker.presented()
+    report = tracker.report()
+    assert report["by_type"]["MouseButtonDown"]["count"] == 1
+    assert len(report["by_object"]) == 1
+
+    game.disable_latency_tracking()
+    assert latency_tracker() is None
@@ -0,0 +1,44 @@
+import pygame
+import pytest
+
+from PGLib.PGGame import PGObject
+from PGLib.PGLayout import PGAnchor, PGColumn, PGGrid, PGLayout, PGRow
+
+
+def box(scene, w, h):
+    return PGObject(scene, 0, 0, pygame.Surface((w, h)))
+
+
+def test_layout_base_is_abstract():
+    with pytest.raises(TypeError):
+        PGLayout()
+
+
+def test_row_places_children_with_padding_and_spacing(scene):
+    a, b = box(scene, 10, 20), box(scene, 30, 10)
+    row = PGRow(a, b, padding=5, spacing=2, align=1)
+    assert row.measure() == (10 + 2 + 30 + 10, 20 + 10)
+    row.arrange(pygame.Rect(0, 0, 100, 30))
+    assert a.pos == (5, 5)
+    assert b.pos == (17, 15)
+
+
+def test_grid_and_anchor(scene):
+    items = [box(scene, 10, 10) for _ in range(4)]
+    grid = PGGrid(*items, columns=2, spacing=1)
+    root = PGAnchor(grid)
+    root.layout(pygame.Rect(0, 0, 101, 101))
+    assert grid.rect.topleft == (40, 40)
+    assert [o.pos for o in items] == [(40, 40), (51, 40), (40, 51), (51, 51)]
+
+
+def test_resizing_a_child_only_remeasures_its_ancestors(scene):
+    a, b = box(scene, 10, 10), box(scene, 10, 10)
+    left, right = PGColumn(a), PGColumn(b)
+    root = PGRow(left, right)
+    root.layout(pygame.Rect(0, 0, 100, 100))
+    a.img = pygame.Surface((20, 10))
+    assert left._measureDirty and root._measureDirty
+    assert not right._measureDirty
+    root.layout(pygame.Rect(0, 0, 100, 100))
+    assert b.pos == (20, 0)
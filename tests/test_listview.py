@@ -0,0 +1,34 @@
+import pygame
+
+from PGLib.PGListView import PGListView
+
+
+def click(pos):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)
+
+
+def test_only_visible_items_get_views(scene):
+    view = PGListView(scene, 0, 0, 100, 90, list(range(10000)), item_height=30)
+    assert len(view._bound) <= 4
+    view.scroll_by(30 * 5000)
+    assert len(view._bound) <= 4
+    assert len(view._bound) + len(view._pool) <= 8
+
+
+def test_click_selects_item_under_event_position(scene):
+    view = PGListView(scene, 0, 0, 100, 90, ["a", "b", "c", "d"], item_height=30)
+    chosen = []
+    view.connect_select(lambda i, item: chosen.append(item))
+    pygame.mouse.set_pos((0, 0))
+    scene.process_events(click((10, 65)))
+    assert chosen == ["c"]
+    assert view.click_pos == (10, 65)
+
+
+def test_click_position_follows_the_camera(scene):
+    scene.enable_camera((0, 30))
+    view = PGListView(scene, 0, 30, 100, 90, ["a", "b", "c", "d"], item_height=30)
+    chosen = []
+    view.connect_select(lambda i, item: chosen.append(item))
+    scene.process_events(click((10, 5)))
+    assert chosen == ["a"]
@@ -0,0 +1,36 @@
+import pygame
+
+from PGLib.PGGame import PGObject
+
+
+def test_the_static_composite_is_accounted_for(game, scene):
+    sprite = PGObject(scene, 0, 0, pygame.Surface((10, 10)))
+    tracker = game.enable_memory_tracking()
+    assert "static composite" not in tracker.sample().by_category()
+
+    sprite.static = True
+    scene.draw()
+    composite = scene.group.static_composite
+    assert composite is not None
+    size = composite.get_width() * composite.get_height() * composite.get_bytesize()
+    assert tracker.sample().by_category()["static composite"] == size
+
+
+def test_transition_veils_and_button_caches_are_accounted_for(game, scene):
+    from PGLib.PGGame import PGScene, PGTextButton
+    PGTextButton(scene, 0, 0, "memory", width=80, height=20)
+    tracker = game.enable_memory_tracking()
+    categories = tracker.sample().by_category()
+    assert "button images" in categories or "label cache" in categories
+
+    second = PGScene(game)
+    second.activate("fade", "fade")
+    for _ in range(200):
+        game._frame()
+        if second.veil:
+            break
+    veil = second.veil
+    assert veil is not None
+    roots = {s.get_abs_parent() for s in veil.surfaces()}
+    size = sum(s.get_width() * s.get_height() * s.get_bytesize() for s in roots)
+    assert tracker.sample().by_category()["veil"] == size
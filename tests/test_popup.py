@@ -0,0 +1,49 @@
+import pygame
+
+from PGLib.PGGame import PGObject
+from PGLib.PGPopUpScene import PGPopUpScene
+
+
+class Clicks(PGObject):
+    def __init__(self, parent, x, y, size):
+        img = pygame.Surface(size)
+        img.fill((0, 200, 0))
+        super().__init__(parent, x, y, img)
+        self.clicks = 0
+
+    def on_click(self):
+        self.clicks += 1
+
+
+def click(pos):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)
+
+
+def test_popup_takes_events_and_snapshots_scene_once(game, scene):
+    below = Clicks(scene, 0, 0, game.screen.get_size())
+    popup = PGPopUpScene(game, (40, 40), dim=0)
+    popup.activate()
+    assert game.overlays == [popup]
+    assert popup not in game.scenes
+
+    background = popup.background
+    popup.refresh()
+    assert popup.background is background  # Underlying scene did not change
+
+    game.overlays[-1].process_events(click(popup.window.rect.center))
+    assert below.clicks == 0
+
+    below.alpha = 128
+    popup.refresh()
+    assert popup.background is not background
+
+
+def test_closing_popup_returns_input_to_scene(game, scene):
+    below = Clicks(scene, 0, 0, game.screen.get_size())
+    popup = PGPopUpScene(game, (40, 40))
+    popup.activate()
+    popup.finish()
+    assert game.overlays == []
+    game._frame()
+    scene.process_events(click((1, 1)))
+    assert below.clicks == 1
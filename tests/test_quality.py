@@ -0,0 +1,32 @@
+from PGLib.PGQuality import PGQualityGovernor, QUALITY_LEVELS, animation_tick, quality
+
+
+def test_quality_steps_down_under_load_and_back_up():
+    governor = PGQualityGovernor(fps=100, window=4)
+    changes = []
+    governor.connect_change(changes.append)
+    for _ in range(4):
+        governor.record(0.02)
+    assert governor.level == 1
+    for _ in range(7):
+        governor.record(0.001)
+    assert governor.level == 1  # Has not stayed long enough at the new level
+    governor.record(0.001)
+    assert governor.level == 0
+    assert [(d.old, d.new) for d in changes] == [(0, 1), (1, 0)]
+
+
+def test_pinned_quality_is_followed_by_the_library():
+    governor = PGQualityGovernor(window=2)
+    governor.install()
+    try:
+        governor.pin(2)
+        for _ in range(10):
+            governor.record(0)
+        assert quality() is QUALITY_LEVELS[2]
+        assert animation_tick() == 2  # Frame 10: two steps at once
+        governor.record(0)
+        assert animation_tick() == 0
+    finally:
+        PGQualityGovernor.uninstall()
+    assert quality() is QUALITY_LEVELS[0]
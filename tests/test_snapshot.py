@@ -0,0 +1,65 @@
+import json
+
+import pygame
+
+from PGLib.PGGame import PGObject, PGScene, PGTextButton
+from PGLib.PGImages import register_image
+
+
+def test_round_trip_skips_plain_sprites(game, scene):
+    register_image("test-red", pygame.Surface((8, 8)))
+    sprite = PGObject(scene, 10, 20, image_ref=("registered", "test-red"))
+    sprite.name = "red"
+    sprite.alpha = 120
+    PGTextButton(scene, 40, 0, "ok", width=30, height=20)
+    scene.group.add(pygame.sprite.DirtySprite())
+    scene.group.set_layer_static(0)
+    scene.enable_camera((5, 5), cell_size=128, cull_updates=True)
+
+    state = json.loads(json.dumps(scene.snapshot()))
+    assert len(state["objects"]) == 2
+    assert state["camera"]["cell_size"] == 128 and state["camera"]["cull_updates"]
+    assert state["static_layers"] == [0]
+
+    restored = PGScene.restore(game, state)
+    red = restored.find("red")
+    assert red.pos == sprite.pos and red.alpha == 120
+    assert red.image.get_parent() is sprite.image.get_parent()  # Shares the converted image
+    assert restored.group.cull_cell_size == 128 and restored.group.cull_updates
+    assert restored.group.static_layers == [0]
+
+
+def test_snapshot_after_a_transition(game):
+    first = PGScene(game)
+    first.activate("none", "none")
+    second = PGScene(game)
+    PGObject(second, 0, 0, image_ref=register_image("test-blue", pygame.Surface((4, 4))))
+    done = second.activate("fade", "fade")
+    for _ in range(200):
+        if done.done:
+            break
+        game._frame()
+    assert done.done and second.background_set()
+
+    state = second.snapshot()
+    assert "background" not in state
+    restored = PGScene.restore(game, state)
+    assert not restored.background_set()
+
+
+def test_shared_images_are_bounded_and_accounted_for(game, monkeypatch):
+    import gc
+    from PGLib import PGImages
+    images = PGImages._SharedSurfaces(3 * 10 * 10 * 4)
+    registered = {}
+    monkeypatch.setattr(PGImages, "_images", images)
+    monkeypatch.setattr(PGImages, "_registered", registered)
+    for i in range(5):
+        register_image("test-bounded-%d" % i, pygame.Surface((10, 10), pygame.SRCALPHA))
+        PGImages.load_image(("registered", "test-bounded-%d" % i))
+    registered.clear()
+    gc.collect()
+    assert len(images.keys()) == 3  # The least recently used ones were let go
+
+    tracker = game.enable_memory_tracking()
+    assert tracker.sample().by_category()["shared images"] >= 3 * 10 * 10 * 4
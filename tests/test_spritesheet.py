@@ -0,0 +1,51 @@
+import pygame
+import pytest
+
+from PGLib.PGGame import PGAnimatedObject, PGSpriteSheet
+
+
+def _sheet():
+    surface = pygame.Surface((40, 10))
+    for i in range(4):
+        surface.fill((60 * i, 0, 0), (i * 10, 0, 10, 10))
+    return PGSpriteSheet(surface, (10, 10))
+
+
+def test_setting_a_frame_tells_the_group(scene, monkeypatch):
+    sprite = PGAnimatedObject(scene, 0, 0, _sheet(), playing=False)
+    changed = []
+    monkeypatch.setattr(scene.group, "_sprite_changed", changed.append)
+    sprite.frame = 2
+    assert changed == [sprite]
+    assert sprite.image.get_at((0, 0))[:3] == (120, 0, 0)
+
+
+def test_setting_a_frame_out_of_range_is_refused(scene):
+    sprite = PGAnimatedObject(scene, 0, 0, _sheet(), playing=False)
+    with pytest.raises(AssertionError, match="out of range"):
+        sprite.frame = 4
+    assert sprite.frame == 0
+
+
+def test_scaled_frames_leave_no_key_fringe(scene):
+    surface = pygame.Surface((20, 10), pygame.SRCALPHA)
+    pygame.draw.circle(surface, (0, 0, 255, 255), (5, 5), 4)
+    sprite = PGAnimatedObject(scene, 0, 0, PGSpriteSheet(surface, (10, 10)), playing=False)
+    sprite.scale = 1.5
+    screen = pygame.Surface(sprite.rect.size)
+    screen.fill((255, 255, 255))
+    screen.blit(sprite.image, (0, 0))
+    assert all(not (c.r > 200 and c.b > 200 and c.g < 150)
+               for c in (screen.get_at((x, y)) for x in range(screen.get_width()) for y in range(screen.get_height())))
+
+
+def test_killing_ends_the_playback(scene):
+    import asyncio
+    sprite = PGAnimatedObject(scene, 0, 0, _sheet(), loop=False, playing=False)
+
+    async def wait():
+        asyncio.get_running_loop().call_soon(sprite.kill)
+        await asyncio.wait_for(sprite.play(), 1)
+
+    asyncio.run(wait())
+    assert not sprite.alive()
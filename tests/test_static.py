@@ -0,0 +1,44 @@
+import pygame
+
+from PGLib.PGGame import PGObject
+
+
+def square(scene, x, y, color, size=10):
+    img = pygame.Surface((size, size))
+    img.fill(color)
+    return PGObject(scene, x, y, img)
+
+
+def test_static_objects_are_drawn_from_the_composite(game, scene):
+    wall = square(scene, 0, 0, (255, 0, 0), 20)
+    wall.static = True
+    mover = square(scene, 5, 5, (0, 0, 255))
+    scene.draw()
+    assert wall.static and not mover.static
+    assert game.screen.get_at((1, 1))[:3] == (255, 0, 0)
+    assert game.screen.get_at((6, 6))[:3] == (0, 0, 255)  # Dynamic objects stay on top
+
+    mover.pos = (40, 40)
+    rects = scene.draw()
+    assert game.screen.get_at((6, 6))[:3] == (255, 0, 0)  # Restored from the composite
+    assert all(r.width <= 20 and r.height <= 20 for r in rects)
+
+
+def test_changing_a_static_object_rebuilds_the_composite(game, scene):
+    wall = square(scene, 0, 0, (255, 0, 0), 20)
+    wall.static = True
+    scene.draw()
+    img = pygame.Surface((20, 20))
+    img.fill((0, 255, 0))
+    wall.img = img
+    scene.draw()
+    assert game.screen.get_at((1, 1))[:3] == (0, 255, 0)
+
+
+def test_static_layers_apply_to_new_objects(scene):
+    scene.group.set_layer_static(3)
+    obj = square(scene, 0, 0, (1, 2, 3))
+    scene.group.change_layer(obj, 3)
+    assert obj.static
+    scene.group.change_layer(obj, 0)
+    assert not obj.static
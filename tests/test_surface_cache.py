@@ -0,0 +1,43 @@
+import pygame
+
+from PGLib.PGGame import PGScene, PGTextButton
+from PGLib.PGSurfaceCache import PGSurfaceCache
+
+
+def test_round_trip_and_size_accounting(tmp_path):
+    cache = PGSurfaceCache(str(tmp_path))
+    surface = pygame.Surface((10, 10), pygame.SRCALPHA)
+    surface.fill((1, 2, 3, 4))
+    cache.put("k", surface)
+    size = cache.size
+    cache.put("k", surface)
+    assert cache.size == size  # Overwriting does not count the entry twice
+    loaded = cache.get("k")
+    assert loaded.get_at((5, 5)) == (1, 2, 3, 4)
+    assert cache.get("missing") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cached_button_renders_its_label_when_repainted(game, scene, tmp_path):
+    game.enable_surface_cache(str(tmp_path))
+    PGTextButton(scene, 0, 0, "cached", width=80, height=30)
+    PGTextButton._imageCache.clear()  # Load from disk rather than share in memory
+    PGTextButton._imageCacheBytes = 0
+    button = PGTextButton(scene, 0, 0, "cached", width=80, height=30)
+    assert PGSurfaceCache.active().hits == 1
+    button._paint(button.image)  # Renders the label the cache hit skipped
+    assert button._textSize is not None
+    button.text = "other"
+    assert button.text == "other"
+
+
+def test_fit_image_matches_with_and_without_cache(game, tmp_path):
+    img = pygame.Surface((40, 20), pygame.SRCALPHA)
+    img.fill((200, 100, 50, 128))
+    path = str(tmp_path / "img.png")
+    pygame.image.save(img, path)
+    plain = PGScene.fit_image(path, (20, 10))
+    game.enable_surface_cache(str(tmp_path / "cache"))
+    built = PGScene.fit_image(path, (20, 10))
+    cached = PGScene.fit_image(path, (20, 10))
+    assert plain.get_at((5, 5)) == built.get_at((5, 5)) == cached.get_at((5, 5))
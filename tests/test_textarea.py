@@ -0,0 +1,66 @@
+import pygame
+import pytest
+
+from PGLib.PGFonts import sys_font
+from PGLib.PGTextArea import PGTextArea
+
+
+@pytest.fixture
+def area(scene):
+    text = "\n".join("paragraph %d" % i for i in range(600))
+    area = PGTextArea(scene, 0, 0, 300, 120, text, font=sys_font("Ariel", 16), follow=False)
+    area.update()
+    return area
+
+
+def test_lookups_match_a_linear_scan(area):
+    area.insert_paragraph(10, "x")
+    area.delete_paragraph(300)
+    paragraphs = area.text.split("\n")
+    assert area.paragraph_count == len(paragraphs)
+    for i in (0, 1, 127, 128, 255, 256, 400, len(paragraphs) - 1):
+        assert area.get_paragraph(i) == paragraphs[i]
+        b, j = area._locate_paragraph(i)
+        assert area._paragraph_index(b, j) == i
+        assert area._first_line(b, j) == i  # Every paragraph is a single line
+        assert area._locate_line(i) == (b, j, 0)
+
+
+def test_edit_above_viewport_only_redraws_when_it_reflows(area):
+    area.scroll = 100
+    area.update()
+    area.set_paragraph(5, "short edit")
+    assert not area._redraw
+    assert area.scroll == 100
+
+    area.set_paragraph(5, "long " * 200)
+    added = len(area._blocks[0][5].lines) - 1
+    assert added > 0
+    assert area._redraw
+    assert area.scroll == 100 + added  # The same lines stay in view
+
+
+def test_edit_inside_viewport_redraws(area):
+    area.scroll = 100
+    area.update()
+    area.set_paragraph(101, "changed")
+    assert area._redraw
+
+
+def test_wheel_uses_the_event_position(area):
+    area.scroll = 10
+    outside = pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=-1, pos=(500, 500))
+    area.process_events(outside)
+    assert area.scroll == 10
+    inside = pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=-1, pos=(10, 10))
+    area.process_events(inside)
+    assert area.scroll == 13
+
+
+def test_typing_and_newlines(scene):
+    area = PGTextArea(scene, 0, 0, 300, 120, "", font=sys_font("Ariel", 16))
+    for key, char in [(pygame.K_a, "a"), (pygame.K_b, "b"), (pygame.K_RETURN, "\r"), (pygame.K_c, "c"),
+                      (pygame.K_BACKSPACE, "\b"), (pygame.K_BACKSPACE, "\b")]:
+        area.process_events(pygame.event.Event(pygame.KEYDOWN, key=key, unicode=char, mod=0))
+    assert area.text == "ab"
+    assert area.cursor == (0, 2)